@@ -1,5 +1,6 @@
 using System.Diagnostics;
 using Microsoft.Win32;
+using Xbox360MemoryCarver.Core.Utils;
 
 namespace Xbox360MemoryCarver;
 
@@ -360,7 +361,7 @@ public static class DependencyChecker
         };
 
         // Add workspace-relative paths
-        var workspaceRoot = FindWorkspaceRoot(assemblyDir);
+        var workspaceRoot = WorkspaceLocator.FindWorkspaceRoot(assemblyDir);
         if (!string.IsNullOrEmpty(workspaceRoot))
         {
             candidates.Add(Path.Combine(workspaceRoot, "src", folderName, folderName, "bin", "Release",
@@ -395,7 +396,7 @@ public static class DependencyChecker
         };
 
         // Add workspace-relative paths
-        var workspaceRoot = FindWorkspaceRoot(assemblyDir);
+        var workspaceRoot = WorkspaceLocator.FindWorkspaceRoot(assemblyDir);
         if (!string.IsNullOrEmpty(workspaceRoot))
         {
             candidates.Add(Path.Combine(workspaceRoot, "src", folderName, cliProject, "bin", "Release",
@@ -413,21 +414,5 @@ public static class DependencyChecker
         return (false, null);
     }
 
-    private static string? FindWorkspaceRoot(string startDir)
-    {
-        var dir = startDir;
-        while (!string.IsNullOrEmpty(dir))
-        {
-            if (Directory.GetFiles(dir, "*.slnx").Length > 0 || Directory.GetFiles(dir, "*.sln").Length > 0) return dir;
-
-            var parent = Directory.GetParent(dir);
-            if (parent == null) break;
-
-            dir = parent.FullName;
-        }
-
-        return null;
-    }
-
     #endregion
 }
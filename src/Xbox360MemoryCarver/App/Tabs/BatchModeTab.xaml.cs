@@ -122,11 +122,14 @@ public sealed partial class BatchModeTab : UserControl, IDisposable
         var folder = await picker.PickSingleFolderAsync();
         if (folder == null) return;
 
+        // A new path fires InputDirectoryTextBox_TextChanged, which scans the folder; re-picking the
+        // same folder leaves the text unchanged, so rescan here to pick up files added since
+        var unchanged = InputDirectoryTextBox.Text == folder.Path;
         InputDirectoryTextBox.Text = folder.Path;
         if (string.IsNullOrEmpty(OutputDirectoryTextBox.Text))
             OutputDirectoryTextBox.Text = Path.Combine(folder.Path, "extracted");
 
-        ScanForDumpFiles();
+        if (unchanged) ScanForDumpFiles();
     }
 
     private async void BrowseOutputButton_Click(object sender, RoutedEventArgs e)
@@ -156,12 +159,16 @@ public sealed partial class BatchModeTab : UserControl, IDisposable
             return;
         }
 
-        foreach (var file in Directory.GetFiles(directory, "*.dmp", SearchOption.AllDirectories))
+        // FileInfo from the enumeration already carries name and length, so no extra stat per file is needed
+        var dumpInfos = new DirectoryInfo(directory)
+            .EnumerateFiles("*.dmp", SearchOption.AllDirectories)
+            .OrderBy(f => f.FullName, StringComparer.OrdinalIgnoreCase);
+
+        foreach (var info in dumpInfos)
         {
-            var info = new FileInfo(file);
             var entry = new DumpFileEntry
             {
-                FilePath = file,
+                FilePath = info.FullName,
                 FileName = info.Name,
                 Size = info.Length,
                 IsSelected = true
@@ -227,6 +234,7 @@ public sealed partial class BatchModeTab : UserControl, IDisposable
                 OutputPath = OutputDirectoryTextBox.Text,
                 ConvertDdx = BatchConvertDdxCheckBox.IsChecked is true,
                 SaveAtlas = BatchSaveAtlasCheckBox.IsChecked is true,
+                DeduplicateContent = BatchSkipDuplicatesCheckBox.IsChecked is true,
                 Verbose = BatchVerboseCheckBox.IsChecked is true,
                 FileTypes = selectedTypes.Count > 0 ? selectedTypes : null
             };
@@ -341,7 +341,16 @@ public sealed partial class DdxConverterTab : UserControl, IDisposable
     {
         return await Task.Run(() =>
         {
-            var ddxFiles = Directory.EnumerateFiles(directory, "*.ddx", SearchOption.AllDirectories).ToArray();
+            // FileInfo from the enumeration already carries the length, so no extra stat per file is needed
+            var root = new DirectoryInfo(directory);
+            var ddxFiles = root
+                .EnumerateFiles("*.ddx", SearchOption.AllDirectories)
+                .ToArray();
+
+            // Every enumerated path starts with the root's full path, so relative paths are a plain slice
+            var rootLength = Path.EndsInDirectorySeparator(root.FullName)
+                ? root.FullName.Length
+                : root.FullName.Length + 1;
 
             if (ddxFiles.Length == 0) return Array.Empty<DdxFileEntry>();
 
@@ -362,15 +371,15 @@ public sealed partial class DdxConverterTab : UserControl, IDisposable
                 },
                 index =>
                 {
-                    var filePath = ddxFiles[index];
-                    var relativePath = Path.GetRelativePath(directory, filePath);
-                    var (fileSize, formatDesc) = ReadDdxFileHeaderSync(filePath);
+                    var file = ddxFiles[index];
+                    var relativePath = file.FullName[rootLength..];
+                    var formatDesc = ReadDdxFileHeaderSync(file.FullName);
 
                     entries[index] = new DdxFileEntry
                     {
-                        FullPath = filePath,
+                        FullPath = file.FullName,
                         RelativePath = relativePath,
-                        FileSize = fileSize,
+                        FileSize = file.Length,
                         FormatDescription = formatDesc,
                         IsSelected = formatDesc is "3XDO" or "3XDR"
                     };
@@ -389,24 +398,21 @@ public sealed partial class DdxConverterTab : UserControl, IDisposable
         }, cancellationToken);
     }
 
-    private static (long fileSize, string formatDesc) ReadDdxFileHeaderSync(string filePath)
+    private static string ReadDdxFileHeaderSync(string filePath)
     {
         try
         {
-            var fileInfo = new FileInfo(filePath);
-            var fileSize = fileInfo.Length;
+            // Read through a raw handle; no FileStream buffer per file
+            using var handle = File.OpenHandle(filePath);
 
             Span<byte> header = stackalloc byte[4];
-            using var fs = new FileStream(filePath, FileMode.Open, FileAccess.Read, FileShare.Read, 4,
-                FileOptions.SequentialScan);
-            var bytesRead = fs.Read(header);
+            var bytesRead = RandomAccess.Read(handle, header, 0);
 
-            var formatDesc = bytesRead < 4 ? "Invalid" : DetermineDdxFormat(header);
-            return (fileSize, formatDesc);
+            return bytesRead < 4 ? "Invalid" : DetermineDdxFormat(header);
         }
         catch
         {
-            return (0, "Error");
+            return "Error";
         }
     }
 
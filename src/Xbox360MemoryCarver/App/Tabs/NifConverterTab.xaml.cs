@@ -321,7 +321,16 @@ public sealed partial class NifConverterTab : UserControl, IDisposable
     {
         return await Task.Run(() =>
         {
-            var nifFiles = Directory.EnumerateFiles(directory, "*.nif", SearchOption.AllDirectories).ToList();
+            // FileInfo from the enumeration already carries the length, so no extra stat per file is needed
+            var root = new DirectoryInfo(directory);
+            var nifFiles = root
+                .EnumerateFiles("*.nif", SearchOption.AllDirectories)
+                .ToList();
+
+            // Every enumerated path starts with the root's full path, so relative paths are a plain slice
+            var rootLength = Path.EndsInDirectorySeparator(root.FullName)
+                ? root.FullName.Length
+                : root.FullName.Length + 1;
             if (nifFiles.Count == 0 || cancellationToken.IsCancellationRequested) return Array.Empty<NifFileEntry>();
 
             InitializeScanProgress(nifFiles.Count);
@@ -340,16 +349,16 @@ public sealed partial class NifConverterTab : UserControl, IDisposable
                 },
                 index =>
                 {
-                    var filePath = nifFiles[index];
-                    var relativePath = Path.GetRelativePath(directory, filePath);
-                    var (fileSize, formatDesc) = ReadNifFileHeaderSync(filePath);
+                    var file = nifFiles[index];
+                    var relativePath = file.FullName[rootLength..];
+                    var formatDesc = ReadNifFileHeaderSync(file.FullName);
                     var isXbox360 = formatDesc == "Xbox 360 (BE)";
 
                     entries[index] = new NifFileEntry
                     {
-                        FullPath = filePath,
+                        FullPath = file.FullName,
                         RelativePath = relativePath,
-                        FileSize = fileSize,
+                        FileSize = file.Length,
                         FormatDescription = formatDesc,
                         IsSelected = isXbox360
                     };
@@ -364,25 +373,22 @@ public sealed partial class NifConverterTab : UserControl, IDisposable
         }, cancellationToken);
     }
 
-    private static (long fileSize, string formatDesc) ReadNifFileHeaderSync(string filePath)
+    private static string ReadNifFileHeaderSync(string filePath)
     {
         try
         {
-            var fileInfo = new FileInfo(filePath);
-            var fileSize = fileInfo.Length;
+            // Read through a raw handle; no FileStream buffer per file
+            using var handle = File.OpenHandle(filePath);
 
             // Use stackalloc for small header buffer - no heap allocation
             Span<byte> headerBytes = stackalloc byte[50];
+            var bytesRead = RandomAccess.Read(handle, headerBytes, 0);
 
-            using var fs = new FileStream(filePath, FileMode.Open, FileAccess.Read, FileShare.Read, 64);
-            var bytesRead = fs.Read(headerBytes);
-
-            var formatDesc = DetermineNifFormat(headerBytes[..bytesRead]);
-            return (fileSize, formatDesc);
+            return DetermineNifFormat(headerBytes[..bytesRead]);
         }
         catch
         {
-            return (0, "Error");
+            return "Error";
         }
     }
 
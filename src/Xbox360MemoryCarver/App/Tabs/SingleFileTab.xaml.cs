@@ -255,6 +255,7 @@ public sealed partial class SingleFileTab : UserControl
                 OutputPath = outputPath,
                 ConvertDdx = ConvertDdxCheckBox.IsChecked == true,
                 SaveAtlas = SaveAtlasCheckBox.IsChecked == true,
+                DeduplicateContent = SkipDuplicatesCheckBox.IsChecked == true,
                 Verbose = VerboseCheckBox.IsChecked == true,
                 FileTypes = types
             };
@@ -1,4 +1,5 @@
 using System.CommandLine;
+using System.IO.MemoryMappedFiles;
 using System.Text.Json;
 using Spectre.Console;
 using Xbox360MemoryCarver.Core;
@@ -22,7 +23,7 @@ public static class AnalyzeCommand
         var outputOpt = new Option<string?>("-o", "--output") { Description = "Output path for analysis report" };
         var formatOpt = new Option<string>("-f", "--format")
         {
-            Description = "Output format: text, md, json",
+            Description = "Output format: text, md, json, jsonl",
             DefaultValueFactory = _ => "text"
         };
         var extractEsmOpt = new Option<string?>("-e", "--extract-esm")
@@ -91,20 +92,56 @@ public static class AnalyzeCommand
 
         AnsiConsole.WriteLine();
 
-        var report = format.ToLowerInvariant() switch
+        var isJson = format.Equals("json", StringComparison.OrdinalIgnoreCase);
+        var isJsonLines = format.Equals("jsonl", StringComparison.OrdinalIgnoreCase);
+
+        if (isJsonLines)
         {
-            "md" or "markdown" => MemoryDumpAnalyzer.GenerateReport(result),
-            "json" => SerializeResultToJson(result),
-            _ => MemoryDumpAnalyzer.GenerateSummary(result)
-        };
+            await using (var stream = string.IsNullOrEmpty(output) ? Console.OpenStandardOutput() : File.Create(output))
+            {
+                await WriteJsonLinesAsync(result, stream);
+            }
+
+            if (!string.IsNullOrEmpty(output))
+            {
+                AnsiConsole.MarkupLine($"[green]Report saved to:[/] {output}");
+            }
+        }
+        else if (isJson && !string.IsNullOrEmpty(output))
+        {
+            // Serialize straight into the file instead of building the whole document as a string first
+            await using (var stream = File.Create(output))
+            {
+                await JsonSerializer.SerializeAsync(stream, BuildJsonResult(result),
+                    CarverJsonContext.Default.JsonAnalysisResult);
+            }
 
-        if (!string.IsNullOrEmpty(output))
+            AnsiConsole.MarkupLine($"[green]Report saved to:[/] {output}");
+        }
+        else if (!isJson && !string.IsNullOrEmpty(output))
         {
-            await File.WriteAllTextAsync(output, report);
+            // Write the builder's chunks straight to the file instead of copying the report into one string first
+            var report = format.ToLowerInvariant() is "md" or "markdown"
+                ? MemoryDumpAnalyzer.BuildReport(result)
+                : MemoryDumpAnalyzer.BuildSummary(result);
+
+            await using (var writer = File.CreateText(output))
+            {
+                await writer.WriteAsync(report);
+            }
+
             AnsiConsole.MarkupLine($"[green]Report saved to:[/] {output}");
         }
         else
         {
+            var report = format.ToLowerInvariant() switch
+            {
+                "md" or "markdown" => MemoryDumpAnalyzer.GenerateReport(result),
+                "json" => JsonSerializer.Serialize(BuildJsonResult(result),
+                    CarverJsonContext.Default.JsonAnalysisResult),
+                _ => MemoryDumpAnalyzer.GenerateSummary(result)
+            };
+
             AnsiConsole.WriteLine(report);
         }
 
@@ -115,12 +152,11 @@ public static class AnalyzeCommand
     }
 
     /// <summary>
-    ///     Serialize analysis result to JSON using source-generated serializer.
+    ///     Convert an analysis result to the trim-compatible types used by the source-generated serializer.
     /// </summary>
-    private static string SerializeResultToJson(AnalysisResult result)
+    private static JsonAnalysisResult BuildJsonResult(AnalysisResult result)
     {
-        // Convert to the trim-compatible JSON types
-        var jsonResult = new JsonAnalysisResult
+        return new JsonAnalysisResult
         {
             FilePath = result.FilePath,
             FileSize = result.FileSize,
@@ -128,13 +164,7 @@ public static class AnalyzeCommand
             IsXbox360 = result.MinidumpInfo?.IsXbox360 ?? false,
             ModuleCount = result.MinidumpInfo?.Modules.Count ?? 0,
             MemoryRegionCount = result.MinidumpInfo?.MemoryRegions.Count ?? 0,
-            CarvedFiles = result.CarvedFiles.Select(cf => new JsonCarvedFileInfo
-            {
-                FileType = cf.FileType,
-                Offset = cf.Offset,
-                Length = cf.Length,
-                FileName = cf.FileName
-            }).ToList(),
+            CarvedFiles = result.CarvedFiles.Select(ToJsonCarvedFile).ToList(),
             EsmRecords = result.EsmRecords != null
                 ? new JsonEsmRecordSummary
                 {
@@ -152,8 +182,34 @@ public static class AnalyzeCommand
             }).ToList(),
             FormIdMap = result.FormIdMap
         };
+    }
+
+    /// <summary>
+    ///     Write one compact JSON object per carved file, so pipelines can stream the results line by line
+    ///     without the text report formatting or loading a single large document.
+    /// </summary>
+    private static async Task WriteJsonLinesAsync(AnalysisResult result, Stream stream)
+    {
+        await using var writer = new Utf8JsonWriter(stream);
+        foreach (var carvedFile in result.CarvedFiles)
+        {
+            JsonSerializer.Serialize(writer, ToJsonCarvedFile(carvedFile),
+                CarverJsonContext.Default.JsonCarvedFileInfo);
+            await writer.FlushAsync();
+            stream.WriteByte((byte)'\n');
+            writer.Reset();
+        }
+    }
 
-        return JsonSerializer.Serialize(jsonResult, CarverJsonContext.Default.JsonAnalysisResult);
+    private static JsonCarvedFileInfo ToJsonCarvedFile(CarvedFileInfo carvedFile)
+    {
+        return new JsonCarvedFileInfo
+        {
+            FileType = carvedFile.FileType,
+            Offset = carvedFile.Offset,
+            Length = carvedFile.Length,
+            FileName = carvedFile.FileName
+        };
     }
 
     private static async Task ExtractEsmRecordsAsync(string input, string extractEsm,
@@ -177,11 +233,14 @@ public static class AnalyzeCommand
         {
             AnsiConsole.WriteLine();
             AnsiConsole.MarkupLine("[blue]Extracting compiled scripts (SCDA)...[/]");
-            var dumpData = await File.ReadAllBytesAsync(input);
+            using var mmf = MemoryMappedFile.CreateFromFile(input, FileMode.Open, null, 0,
+                MemoryMappedFileAccess.Read);
+            using var accessor = mmf.CreateViewAccessor(0, result.FileSize, MemoryMappedFileAccess.Read);
             var scriptsDir = Path.Combine(extractEsm, "scripts");
             var scriptProgress =
                 verbose ? new Progress<string>(msg => AnsiConsole.MarkupLine($"  [grey]{msg}[/]")) : null;
-            var scriptResult = await ScdaExtractor.ExtractGroupedAsync(dumpData, scriptsDir, scriptProgress);
+            var scriptResult =
+                await ScdaExtractor.ExtractGroupedAsync(accessor, result.FileSize, scriptsDir, scriptProgress);
             AnsiConsole.MarkupLine(
                 $"[green]Scripts extracted:[/] {scriptResult.TotalRecords} records ({scriptResult.GroupedQuests} quests, {scriptResult.UngroupedScripts} ungrouped)");
         }
@@ -433,21 +433,40 @@ public static class BsaCommand
                     return await extractor.ExtractFilteredAsync(output, predicate, overwrite, progress);
                 });
 
-            // Summary
-            var succeeded = results.Count(r => r.Success);
-            var failed = results.Count(r => !r.Success);
-            var converted = results.Count(r => r.WasConverted);
-            var totalSize = results.Where(r => r.Success).Sum(r => r.ExtractedSize);
+            // Summary, tallied in a single pass over the results
+            int succeeded = 0, failed = 0, converted = 0;
+            int ddxConverted = 0, xmaConverted = 0, nifConverted = 0;
+            long totalSize = 0;
+            foreach (var r in results)
+            {
+                if (r.Success)
+                {
+                    succeeded++;
+                    totalSize += r.ExtractedSize;
+                }
+                else
+                {
+                    failed++;
+                }
+
+                if (r.WasConverted)
+                {
+                    converted++;
+                }
+
+                switch (r.ConversionType)
+                {
+                    case "DDX->DDS": ddxConverted++; break;
+                    case "XMA->OGG": xmaConverted++; break;
+                    case "NIF BE->LE": nifConverted++; break;
+                }
+            }
 
             AnsiConsole.WriteLine();
             AnsiConsole.MarkupLine("[green]✓ Extracted:[/] {0:N0} files ({1})", succeeded, FormatSize(totalSize));
 
             if (converted > 0)
             {
-                var ddxConverted = results.Count(r => r.ConversionType == "DDX->DDS");
-                var xmaConverted = results.Count(r => r.ConversionType == "XMA->OGG");
-                var nifConverted = results.Count(r => r.ConversionType == "NIF BE->LE");
-
                 var parts = new List<string>();
                 if (ddxConverted > 0)
                 {
@@ -51,13 +51,20 @@ public static class CarveCommand
         ["xdbf"] = "XDBF Files"
     };
 
+    /// <summary>
+    ///     Serializes per-file console output when several dumps are processed in parallel.
+    /// </summary>
+    private static readonly Lock ConsoleLock = new();
+
     public static async Task ExecuteAsync(
         string inputPath,
         string outputDir,
         List<string>? fileTypes,
         bool convertDdx,
         bool verbose,
-        int maxFiles)
+        int maxFiles,
+        int jobs = 1,
+        bool deduplicate = false)
     {
         var files = new List<string>();
 
@@ -67,7 +74,8 @@ public static class CarveCommand
         }
         else if (Directory.Exists(inputPath))
         {
-            files.AddRange(Directory.GetFiles(inputPath, "*.dmp", SearchOption.TopDirectoryOnly));
+            files.AddRange(Directory.EnumerateFiles(inputPath, "*.dmp", SearchOption.TopDirectoryOnly)
+                .Order(StringComparer.OrdinalIgnoreCase));
         }
 
         if (files.Count == 0)
@@ -78,28 +86,7 @@ public static class CarveCommand
 
         AnsiConsole.MarkupLine($"[blue]Found[/] {files.Count} file(s) to process");
 
-        foreach (var file in files)
-        {
-            await ProcessFileAsync(file, outputDir, fileTypes, convertDdx, verbose, maxFiles);
-        }
-
-        AnsiConsole.WriteLine();
-        AnsiConsole.MarkupLine("[green]Done![/]");
-    }
-
-    private static async Task ProcessFileAsync(
-        string file,
-        string outputDir,
-        List<string>? fileTypes,
-        bool convertDdx,
-        bool verbose,
-        int maxFiles)
-    {
-        AnsiConsole.WriteLine();
-        AnsiConsole.Write(new Rule($"[blue]{Path.GetFileName(file)}[/]").LeftJustified());
-
-        var stopwatch = Stopwatch.StartNew();
-
+        // Options only depend on the command line, so build them once and share them across all dumps
         var options = new ExtractionOptions
         {
             OutputPath = outputDir,
@@ -107,30 +94,100 @@ public static class CarveCommand
             FileTypes = fileTypes,
             Verbose = verbose,
             MaxFilesPerType = maxFiles,
+            DeduplicateContent = deduplicate,
             ExtractScripts = fileTypes == null ||
                              fileTypes.Count == 0 ||
                              fileTypes.Any(t => t.Contains("scda", StringComparison.OrdinalIgnoreCase) ||
                                                 t.Contains("script", StringComparison.OrdinalIgnoreCase))
         };
 
+        // Each dump is written to its own {output}/{dump_name}/ folder, so dumps can be processed concurrently.
+        // Live progress bars cannot be shared between concurrent extractions, so they are only shown when serial.
+        var parallelism = Math.Clamp(jobs, 1, Math.Min(files.Count, Environment.ProcessorCount));
+        if (parallelism == 1)
+        {
+            foreach (var file in files)
+            {
+                await ProcessFileAsync(file, options, true);
+            }
+        }
+        else
+        {
+            AnsiConsole.MarkupLine($"[blue]Processing[/] up to {parallelism} files in parallel");
+
+            using var semaphore = new SemaphoreSlim(parallelism);
+            var tasks = files.Select(async file =>
+            {
+                await semaphore.WaitAsync();
+                try
+                {
+                    await ProcessFileAsync(file, options, false);
+                }
+                finally
+                {
+                    semaphore.Release();
+                }
+            });
+
+            await Task.WhenAll(tasks);
+        }
+
+        AnsiConsole.WriteLine();
+        AnsiConsole.MarkupLine("[green]Done![/]");
+    }
+
+    private static async Task ProcessFileAsync(string file, ExtractionOptions options, bool showProgress)
+    {
+        if (showProgress)
+        {
+            PrintFileHeader(file);
+        }
+
+        var stopwatch = Stopwatch.StartNew();
+
         ExtractionSummary summary;
 
         try
         {
-            summary = await ExtractWithProgressAsync(file, options);
+            summary = showProgress
+                ? await ExtractWithProgressAsync(file, options)
+                : await MemoryDumpExtractor.Extract(file, options, null);
         }
         catch (Exception ex)
         {
-            AnsiConsole.MarkupLine($"[red]Error:[/] {ex.Message}");
+            lock (ConsoleLock)
+            {
+                if (!showProgress)
+                {
+                    PrintFileHeader(file);
+                }
+
+                AnsiConsole.MarkupLine($"[red]Error:[/] {ex.Message}");
+            }
+
             return;
         }
 
         stopwatch.Stop();
 
-        AnsiConsole.MarkupLine(
-            $"[green]Extracted[/] {summary.TotalExtracted} files in [blue]{stopwatch.Elapsed.TotalSeconds:F2}s[/]");
+        lock (ConsoleLock)
+        {
+            if (!showProgress)
+            {
+                PrintFileHeader(file);
+            }
+
+            AnsiConsole.MarkupLine(
+                $"[green]Extracted[/] {summary.TotalExtracted} files in [blue]{stopwatch.Elapsed.TotalSeconds:F2}s[/]");
+
+            PrintSummary(summary, options.ConvertDdx);
+        }
+    }
 
-        PrintSummary(summary, convertDdx);
+    private static void PrintFileHeader(string file)
+    {
+        AnsiConsole.WriteLine();
+        AnsiConsole.Write(new Rule($"[blue]{Path.GetFileName(file)}[/]").LeftJustified());
     }
 
     private static async Task<ExtractionSummary> ExtractWithProgressAsync(string file, ExtractionOptions options)
@@ -166,6 +223,7 @@ public static class CarveCommand
     private static void PrintSummary(ExtractionSummary summary, bool convertDdx)
     {
         PrintCategoryTable(summary);
+        PrintDuplicateStats(summary);
         PrintConversionStats(summary, convertDdx);
         PrintScriptStats(summary);
     }
@@ -221,6 +279,17 @@ public static class CarveCommand
         return table;
     }
 
+    private static void PrintDuplicateStats(ExtractionSummary summary)
+    {
+        if (summary.DuplicatesSkipped == 0)
+        {
+            return;
+        }
+
+        AnsiConsole.WriteLine();
+        AnsiConsole.MarkupLine($"[grey]Skipped {summary.DuplicatesSkipped} duplicate file(s)[/]");
+    }
+
     private static void PrintConversionStats(ExtractionSummary summary, bool convertDdx)
     {
         if (!convertDdx)
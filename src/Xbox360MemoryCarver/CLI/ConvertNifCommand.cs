@@ -1,3 +1,4 @@
+using System.Collections.Concurrent;
 using System.CommandLine;
 using Spectre.Console;
 using Xbox360MemoryCarver.Core.Formats.Nif;
@@ -63,7 +64,11 @@ public static class ConvertNifCommand
         }
 
         PrintStartMessage(context);
-        await ProcessFilesAsync(context);
+        using (context.Converters)
+        {
+            await ProcessFilesAsync(context);
+        }
+
         PrintSummary(context);
     }
 
@@ -112,7 +117,8 @@ public static class ConvertNifCommand
             Output = output,
             InputBaseDir = inputBaseDir,
             Verbose = verbose,
-            Overwrite = overwrite
+            Overwrite = overwrite,
+            Converters = new ThreadLocal<NifConverter>(() => new NifConverter(verbose))
         };
     }
 
@@ -128,11 +134,10 @@ public static class ConvertNifCommand
 
     /// <summary>
     ///     Processes all files with progress display.
+    ///     Files are independent, so they are converted concurrently to overlap disk reads with conversion.
     /// </summary>
     private static async Task ProcessFilesAsync(ConversionContext context)
     {
-        var converter = new NifConverter(context.Verbose);
-
         await AnsiConsole.Progress()
             .AutoClear(false)
             .Columns(
@@ -144,17 +149,25 @@ public static class ConvertNifCommand
             {
                 var task = ctx.AddTask("[yellow]Converting NIF files[/]", maxValue: context.Files.Count);
 
-                foreach (var file in context.Files)
-                {
-                    var fileName = Path.GetFileName(file);
-                    task.Description = $"[yellow]{fileName}[/]";
+                await Parallel.ForEachAsync(context.Files,
+                    new ParallelOptions { MaxDegreeOfParallelism = Environment.ProcessorCount },
+                    async (file, _) =>
+                    {
+                        var fileName = Path.GetFileName(file);
+                        task.Description = $"[yellow]{fileName}[/]";
 
-                    await ProcessSingleFileAsync(context, converter, file, fileName);
-                    task.Increment(1);
-                }
+                        await ProcessSingleFileAsync(context, file, fileName);
+                        task.Increment(1);
+                    });
 
                 task.Description = "[green]Complete[/]";
             });
+
+        // Workers only queue their messages; writing them during the live display would garble it
+        foreach (var message in context.Messages)
+        {
+            AnsiConsole.MarkupLine(message);
+        }
     }
 
     /// <summary>
@@ -162,7 +175,6 @@ public static class ConvertNifCommand
     /// </summary>
     private static async Task ProcessSingleFileAsync(
         ConversionContext context,
-        NifConverter converter,
         string file,
         string fileName)
     {
@@ -175,15 +187,12 @@ public static class ConvertNifCommand
                 return;
             }
 
-            await ConvertFileAsync(context, converter, file, fileName, outputPath);
+            await ConvertFileAsync(context, file, fileName, outputPath);
         }
         catch (Exception ex)
         {
-            context.Failed++;
-            if (context.Verbose)
-            {
-                AnsiConsole.MarkupLine($"[red]Failed:[/] {fileName} - {ex.Message}");
-            }
+            context.IncrementFailed();
+            context.Log($"[red]Failed:[/] {fileName} - {ex.Message}");
         }
     }
 
@@ -219,51 +228,41 @@ public static class ConvertNifCommand
             return false;
         }
 
-        if (context.Verbose)
-        {
-            AnsiConsole.MarkupLine($"[grey]Skipping (exists):[/] {fileName}");
-        }
-
-        context.Skipped++;
+        context.Log($"[grey]Skipping (exists):[/] {fileName}");
+        context.IncrementSkipped();
         return true;
     }
 
     /// <summary>
     ///     Performs the actual file conversion.
+    ///     NifConverter resets its per-conversion state on each call, so every worker thread reuses one instance
+    ///     instead of allocating a fresh set of block tables per file. Convert is synchronous, so the instance
+    ///     is never shared between two files in flight.
     /// </summary>
     private static async Task ConvertFileAsync(
         ConversionContext context,
-        NifConverter converter,
         string file,
         string fileName,
         string outputPath)
     {
         var data = await File.ReadAllBytesAsync(file);
-        var result = converter.Convert(data);
+        var result = context.Converters.Value!.Convert(data);
 
         if (result is { Success: true, OutputData: not null })
         {
             await File.WriteAllBytesAsync(outputPath, result.OutputData);
-            context.Converted++;
+            context.IncrementConverted();
 
-            if (context.Verbose)
+            context.Log($"[green]Converted:[/] {fileName}");
+            if (!string.IsNullOrEmpty(result.ErrorMessage))
             {
-                AnsiConsole.MarkupLine($"[green]Converted:[/] {fileName}");
-                if (!string.IsNullOrEmpty(result.ErrorMessage))
-                {
-                    AnsiConsole.MarkupLine($"[dim]  {result.ErrorMessage}[/]");
-                }
+                context.Log($"[dim]  {result.ErrorMessage}[/]");
             }
         }
         else
         {
-            if (context.Verbose)
-            {
-                AnsiConsole.MarkupLine(
-                    $"[yellow]Skipped:[/] {fileName} - {result.ErrorMessage ?? "already LE or invalid"}");
-            }
-
-            context.Skipped++;
+            context.Log($"[yellow]Skipped:[/] {fileName} - {result.ErrorMessage ?? "already LE or invalid"}");
+            context.IncrementSkipped();
         }
     }
 
@@ -300,8 +299,34 @@ public static class ConvertNifCommand
         public required string? InputBaseDir { get; init; }
         public required bool Verbose { get; init; }
         public required bool Overwrite { get; init; }
-        public int Converted { get; set; }
-        public int Skipped { get; set; }
-        public int Failed { get; set; }
+        public required ThreadLocal<NifConverter> Converters { get; init; }
+
+        /// <summary>
+        ///     Verbose per-file messages, printed once the progress display has finished.
+        /// </summary>
+        public ConcurrentQueue<string> Messages { get; } = new();
+
+        private int _converted;
+        private int _failed;
+        private int _skipped;
+
+        public int Converted => Volatile.Read(ref _converted);
+        public int Failed => Volatile.Read(ref _failed);
+        public int Skipped => Volatile.Read(ref _skipped);
+
+        public void IncrementConverted() => Interlocked.Increment(ref _converted);
+        public void IncrementFailed() => Interlocked.Increment(ref _failed);
+        public void IncrementSkipped() => Interlocked.Increment(ref _skipped);
+
+        /// <summary>
+        ///     Queue a markup line for output after the progress display, when verbose output is enabled.
+        /// </summary>
+        public void Log(string markup)
+        {
+            if (Verbose)
+            {
+                Messages.Enqueue(markup);
+            }
+        }
     }
 }
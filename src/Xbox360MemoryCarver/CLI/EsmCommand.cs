@@ -1,8 +1,11 @@
 using System.CommandLine;
+using System.IO.MemoryMappedFiles;
 using System.Text;
 using System.Text.Json;
 using Spectre.Console;
 using Xbox360MemoryCarver.Core.Formats.EsmRecord;
+using Xbox360MemoryCarver.Core.Json;
+using Xbox360MemoryCarver.Core.Utils;
 
 namespace Xbox360MemoryCarver.CLI;
 
@@ -68,15 +71,54 @@ public static class EsmCommand
         AnsiConsole.MarkupLine("[dim]Size:[/] {0:N0} bytes ({1:N2} MB)", fileInfo.Length,
             fileInfo.Length / 1024.0 / 1024.0);
 
-        // Load file into memory
-        var data = await File.ReadAllBytesAsync(input);
+        if (fileInfo.Length is 0 or > int.MaxValue)
+        {
+            AnsiConsole.MarkupLine("[red]Error:[/] Not a valid ESM/ESP file (missing TES4 header)");
+            return;
+        }
+
+        var result = ScanFile(input, fileInfo.Length);
+        if (result == null)
+        {
+            AnsiConsole.MarkupLine("[red]Error:[/] Not a valid ESM/ESP file (missing TES4 header)");
+            return;
+        }
+
+        var outputText = format.ToLowerInvariant() switch
+        {
+            "md" or "markdown" => FormatMarkdown(result, Path.GetFileName(input), recordType, limit),
+            "json" => FormatJson(result),
+            _ => FormatText(result, verbose, recordType, limit)
+        };
+
+        if (!string.IsNullOrEmpty(output))
+        {
+            await File.WriteAllTextAsync(output, outputText);
+            AnsiConsole.MarkupLine("[green]Output written to:[/] {0}", output);
+        }
+        else
+        {
+            Console.WriteLine(outputText);
+        }
+    }
+
+    /// <summary>
+    ///     Scan a plugin straight out of a read-only mapping instead of loading it into a managed array;
+    ///     the parsers read the mapped pages through a span and the OS pages them in on demand.
+    ///     Returns null if the file has no TES4 header.
+    /// </summary>
+    private static EsmFileScanResult? ScanFile(string input, long fileSize)
+    {
+        using var mmf = MemoryMappedFile.CreateFromFile(input, FileMode.Open, null, 0, MemoryMappedFileAccess.Read);
+        using var accessor = mmf.CreateViewAccessor(0, fileSize, MemoryMappedFileAccess.Read);
+        using var reader = new MemoryMappedSpanReader(accessor, fileSize);
+        var data = reader.GetSpan(0, (int)fileSize);
 
         // Parse file header
         var header = EsmParser.ParseFileHeader(data);
         if (header == null)
         {
-            AnsiConsole.MarkupLine("[red]Error:[/] Not a valid ESM/ESP file (missing TES4 header)");
-            return;
+            return null;
         }
 
         // Scan records
@@ -95,8 +137,7 @@ public static class EsmCommand
             }
         }
 
-        // Generate output
-        var result = new EsmFileScanResult
+        return new EsmFileScanResult
         {
             Header = header,
             RecordTypeCounts = recordCounts,
@@ -105,23 +146,6 @@ public static class EsmCommand
             FormIdToEditorId = formIdMap,
             RecordsByCategory = GetRecordsByCategory(recordCounts)
         };
-
-        var outputText = format.ToLowerInvariant() switch
-        {
-            "md" or "markdown" => FormatMarkdown(result, Path.GetFileName(input), recordType, limit),
-            "json" => FormatJson(result),
-            _ => FormatText(result, verbose, recordType, limit)
-        };
-
-        if (!string.IsNullOrEmpty(output))
-        {
-            await File.WriteAllTextAsync(output, outputText);
-            AnsiConsole.MarkupLine("[green]Output written to:[/] {0}", output);
-        }
-        else
-        {
-            Console.WriteLine(outputText);
-        }
     }
 
     private static Dictionary<RecordCategory, int> GetRecordsByCategory(Dictionary<string, int> recordCounts)
@@ -305,31 +329,24 @@ public static class EsmCommand
 
     private static string FormatJson(EsmFileScanResult result)
     {
-        var options = new JsonSerializerOptions
-        {
-            WriteIndented = true,
-            PropertyNamingPolicy = JsonNamingPolicy.CamelCase
-        };
-
-        // Create a serializable version
-        var jsonObj = new
+        var jsonResult = new JsonEsmScanResult
         {
-            header = result.Header != null
-                ? new
+            Header = result.Header != null
+                ? new JsonEsmFileHeader
                 {
-                    version = result.Header.Version,
-                    author = result.Header.Author,
-                    description = result.Header.Description,
-                    nextObjectId = result.Header.NextObjectId,
-                    masters = result.Header.Masters
+                    Version = result.Header.Version,
+                    Author = result.Header.Author,
+                    Description = result.Header.Description,
+                    NextObjectId = result.Header.NextObjectId,
+                    Masters = [.. result.Header.Masters]
                 }
                 : null,
-            totalRecords = result.TotalRecords,
-            uniqueEditorIds = result.FormIdToEditorId.Count,
-            recordTypeCounts = result.RecordTypeCounts,
-            recordsByCategory = result.RecordsByCategory.ToDictionary(kvp => kvp.Key.ToString(), kvp => kvp.Value)
+            TotalRecords = result.TotalRecords,
+            UniqueEditorIds = result.FormIdToEditorId.Count,
+            RecordTypeCounts = result.RecordTypeCounts,
+            RecordsByCategory = result.RecordsByCategory.ToDictionary(kvp => kvp.Key.ToString(), kvp => kvp.Value)
         };
 
-        return JsonSerializer.Serialize(jsonObj, options);
+        return JsonSerializer.Serialize(jsonResult, CarverJsonContext.Default.JsonEsmScanResult);
     }
 }
@@ -1,6 +1,5 @@
-using System.Buffers;
-using System.IO.MemoryMappedFiles;
 using Xbox360MemoryCarver.Core.Formats;
+using Xbox360MemoryCarver.Core.Utils;
 
 namespace Xbox360MemoryCarver.Core.Carving;
 
@@ -11,127 +10,85 @@ internal static class CarveExtractor
 {
     /// <summary>
     ///     Prepare extraction data for a single match.
+    ///     Headers are parsed straight from the mapped view; only the carved file itself is copied out.
     /// </summary>
     public static ExtractionData? PrepareExtraction(
-        MemoryMappedViewAccessor accessor,
-        long fileSize,
+        MemoryMappedSpanReader reader,
         long offset,
         string signatureId,
         IFileFormat format,
-        string outputPath)
+        CarveSizeLimits limits,
+        string outputPath,
+        OutputDirectoryCache directories)
     {
+        var fileSize = reader.Length;
+
         // Read data before and after the signature for context
         const int preReadSize = 512;
         var actualPreRead = (int)Math.Min(preReadSize, offset);
         var readStart = offset - actualPreRead;
 
-        var headerScanSize = signatureId.StartsWith("ddx", StringComparison.OrdinalIgnoreCase)
-            ? Math.Min(format.MaxSize, 512 * 1024) // 512KB for DDX boundary scanning
-            : Math.Min(format.MaxSize, 64 * 1024); // 64KB for other types
-
-        var headerSize = (int)Math.Min(headerScanSize, fileSize - offset);
+        var headerSize = (int)Math.Min(limits.HeaderScanSize, fileSize - offset);
         var totalRead = actualPreRead + headerSize;
-        var buffer = ArrayPool<byte>.Shared.Rent(totalRead);
-
-        try
-        {
-            accessor.ReadArray(readStart, buffer, 0, totalRead);
-            var span = buffer.AsSpan(0, totalRead);
-
-            var sigOffset = actualPreRead;
-
-            var parseResult = format.Parse(span, sigOffset);
-            if (parseResult == null)
-            {
-                return null;
-            }
+        var span = reader.GetSpan(readStart, totalRead);
 
-            var extractionInfo = BuildExtractionInfo(parseResult, actualPreRead);
-            var (leadingBytes, customFilename, originalPath, metadata) = extractionInfo;
+        var sigOffset = actualPreRead;
 
-            // Adjust for leading bytes (e.g., comments before script signature)
-            var adjustedOffset = offset - leadingBytes;
-            var adjustedSize = parseResult.EstimatedSize + leadingBytes;
-
-            if (adjustedSize < format.MinSize || adjustedSize > format.MaxSize)
-            {
-                return null;
-            }
-
-            adjustedSize = (int)Math.Min(adjustedSize, fileSize - adjustedOffset);
-
-            var outputFile = BuildOutputPath(outputPath, signatureId, format, customFilename, offset,
-                parseResult.OutputFolderOverride, parseResult.ExtensionOverride);
-
-            // Read the actual file data (including any leading bytes)
-            var fileData = new byte[adjustedSize];
-            accessor.ReadArray(adjustedOffset, fileData, 0, adjustedSize);
-
-            return new ExtractionData(outputFile, fileData, adjustedSize, originalPath, metadata);
-        }
-        finally
+        var parseResult = format.Parse(span, sigOffset);
+        if (parseResult == null)
         {
-            ArrayPool<byte>.Shared.Return(buffer);
+            return null;
         }
-    }
-
-    private static (int leadingBytes, string? customFilename, string? originalPath, Dictionary<string, object>? metadata
-        )
-        BuildExtractionInfo(ParseResult parseResult, int actualPreRead)
-    {
-        string? customFilename = null;
-        string? originalPath = null;
-        var leadingBytes = 0;
 
-        // Get the safe filename for extraction
-        if (parseResult.Metadata.TryGetValue("safeName", out var safeName))
+        var size = parseResult.EstimatedSize;
+        if (size < limits.MinSize || size > limits.MaxSize)
         {
-            customFilename = safeName.ToString();
+            return null;
         }
 
-        // Get the original path for the manifest (DDX textures)
-        if (parseResult.Metadata.TryGetValue("texturePath", out var pathObj) && pathObj is string path)
-        {
-            originalPath = path;
-        }
+        size = (int)Math.Min(size, fileSize - offset);
 
-        // Get embedded path for XMA files
-        if (parseResult.Metadata.TryGetValue("embeddedPath", out var embeddedPathObj) &&
-            embeddedPathObj is string embeddedPath)
-        {
-            originalPath ??= embeddedPath;
-        }
+        var outputFile = BuildOutputPath(outputPath, signatureId, format, parseResult.SafeName, offset, directories,
+            parseResult.OutputFolderOverride, parseResult.ExtensionOverride);
 
-        // Check for leading comments (scripts with comments before the scn keyword)
-        if (parseResult.Metadata.TryGetValue("leadingCommentSize", out var leadingObj) &&
-            leadingObj is int leading)
-        {
-            leadingBytes = Math.Min(leading, actualPreRead);
-        }
+        // Materialize the actual file data only now that it is going to be written
+        var fileData = reader.GetSpan(offset, size).ToArray();
 
-        return (leadingBytes, customFilename, originalPath, parseResult.Metadata);
+        return new ExtractionData(outputFile, fileData, size, parseResult.OriginalPath,
+            parseResult.Metadata);
     }
 
     private static string BuildOutputPath(string outputPath, string signatureId, IFileFormat format,
-        string? customFilename, long offset, string? outputFolderOverride = null, string? extensionOverride = null)
+        string? customFilename, long offset, OutputDirectoryCache directories, string? outputFolderOverride = null,
+        string? extensionOverride = null)
     {
         // Use override if provided, otherwise fall back to format default
         var typeFolder = outputFolderOverride ??
                          (string.IsNullOrEmpty(format.OutputFolder) ? signatureId : format.OutputFolder);
         var typePath = Path.Combine(outputPath, typeFolder);
-        Directory.CreateDirectory(typePath);
+        directories.EnsureExists(typePath);
 
         var extension = extensionOverride ?? format.Extension;
         var filename = customFilename ?? $"{offset:X8}";
-        var outputFile = Path.Combine(typePath, $"{filename}{extension}");
 
-        var counter = 1;
-        while (File.Exists(outputFile))
-        {
-            outputFile = Path.Combine(typePath, $"{filename}_{counter++}{extension}");
-        }
+        // Name collisions are resolved when the file is created (see CarveWriter), not with a stat per file
+        return Path.Combine(typePath, $"{filename}{extension}");
+    }
+}
+
+/// <summary>
+///     Size limits for one signature, resolved once per carve so each match checks them with plain field loads
+///     instead of interface calls and a signature id comparison.
+/// </summary>
+internal readonly record struct CarveSizeLimits(int HeaderScanSize, int MinSize, int MaxSize)
+{
+    public static CarveSizeLimits For(string signatureId, IFileFormat format)
+    {
+        var headerScanSize = signatureId.StartsWith("ddx", StringComparison.OrdinalIgnoreCase)
+            ? Math.Min(format.MaxSize, 512 * 1024) // 512KB for DDX boundary scanning
+            : Math.Min(format.MaxSize, 64 * 1024); // 64KB for other types
 
-        return outputFile;
+        return new CarveSizeLimits(headerScanSize, format.MinSize, format.MaxSize);
     }
 }
 
@@ -43,16 +43,21 @@ public static class CarveManifest
     public static async Task SaveAsync(string outputPath, IEnumerable<CarveEntry> entries)
     {
         var manifestPath = Path.Combine(outputPath, "manifest.json");
-        var json = JsonSerializer.Serialize(entries.ToList(), CarverJsonContext.Default.ListCarveEntry);
-        await File.WriteAllTextAsync(manifestPath, json);
+        var list = entries as List<CarveEntry> ?? entries.ToList();
+
+        // Stream straight to disk rather than building the whole JSON document as a string first
+        await using var stream = File.Create(manifestPath);
+        await JsonSerializer.SerializeAsync(stream, list, CarverJsonContext.Default.ListCarveEntry);
     }
 
     /// <summary>
-    ///     Load a manifest from a JSON file.
+    ///     Load a manifest from a JSON file written by a previous run.
+    ///     Callers in the same process should use the entries returned by
+    ///     <see cref="MemoryCarver.CarveDumpAsync(string, IProgress{double})" /> instead of re-reading the file.
     /// </summary>
     public static async Task<List<CarveEntry>> LoadAsync(string manifestPath)
     {
-        var json = await File.ReadAllTextAsync(manifestPath);
-        return JsonSerializer.Deserialize(json, CarverJsonContext.Default.ListCarveEntry) ?? [];
+        await using var stream = File.OpenRead(manifestPath);
+        return await JsonSerializer.DeserializeAsync(stream, CarverJsonContext.Default.ListCarveEntry) ?? [];
     }
 }
@@ -1,4 +1,5 @@
 using System.Collections.Concurrent;
+using Microsoft.Win32.SafeHandles;
 using Xbox360MemoryCarver.Core.Formats;
 
 namespace Xbox360MemoryCarver.Core.Carving;
@@ -11,6 +12,7 @@ internal sealed record WriteFileParams(
     byte[] Data,
     long Offset,
     string SignatureId,
+    IFileFormat Format,
     int FileSize,
     string? OriginalPath,
     Dictionary<string, object>? Metadata);
@@ -22,10 +24,12 @@ internal sealed class CarveWriter(
     Dictionary<string, IFileConverter> converters,
     bool enableConversion,
     bool saveAtlas,
+    OutputDirectoryCache directories,
     Action<CarveEntry> addToManifest)
 {
     private readonly Action<CarveEntry> _addToManifest = addToManifest;
     private readonly Dictionary<string, IFileConverter> _converters = converters;
+    private readonly OutputDirectoryCache _directories = directories;
     private readonly bool _enableConversion = enableConversion;
     private readonly ConcurrentBag<long> _failedConversionOffsets = [];
     private readonly bool _saveAtlas = saveAtlas;
@@ -37,10 +41,10 @@ internal sealed class CarveWriter(
 
     public async Task WriteFileAsync(WriteFileParams p)
     {
-        var format = FormatRegistry.GetBySignatureId(p.SignatureId);
+        var format = p.Format;
 
         // Try conversion if available for this format
-        if (_enableConversion && format != null && _converters.TryGetValue(format.FormatId, out var converter) &&
+        if (_enableConversion && _converters.TryGetValue(format.FormatId, out var converter) &&
             converter.CanConvert(p.SignatureId, p.Metadata))
         {
             var convertResult = await TryConvertAsync(converter, p);
@@ -59,14 +63,14 @@ internal sealed class CarveWriter(
             isRepaired = outputData != p.Data;
         }
 
-        await WriteFileWithRetryAsync(p.OutputFile, outputData);
+        var writtenFile = await WriteNewFileAsync(p.OutputFile, outputData);
         _addToManifest(new CarveEntry
         {
             FileType = p.SignatureId,
             Offset = p.Offset,
             SizeInDump = p.FileSize,
             SizeOutput = outputData.Length,
-            Filename = Path.GetFileName(p.OutputFile),
+            Filename = Path.GetFileName(writtenFile),
             OriginalPath = p.OriginalPath,
             Notes = isRepaired ? "Repaired" : null,
             Metadata = p.Metadata
@@ -83,14 +87,13 @@ internal sealed class CarveWriter(
             return false;
         }
 
-        var format = FormatRegistry.GetBySignatureId(p.SignatureId);
-        var originalFolder = format?.OutputFolder ?? p.SignatureId;
+        var originalFolder = p.Format.OutputFolder;
         var targetFolder = converter.TargetFolder;
 
         var convertedOutputFile = Path.ChangeExtension(p.OutputFile.Replace(
             Path.DirectorySeparatorChar + originalFolder + Path.DirectorySeparatorChar,
             Path.DirectorySeparatorChar + targetFolder + Path.DirectorySeparatorChar), converter.TargetExtension);
-        Directory.CreateDirectory(Path.GetDirectoryName(convertedOutputFile)!);
+        _directories.EnsureExists(Path.GetDirectoryName(convertedOutputFile)!);
 
         await WriteFileWithRetryAsync(convertedOutputFile, result.OutputData);
 
@@ -118,6 +121,41 @@ internal sealed class CarveWriter(
         return true;
     }
 
+    /// <summary>
+    ///     Write data to a file that does not exist yet. If the name is already taken (by an earlier run or
+    ///     another carve with the same name) the next free "_N" suffix is used. Creating with CreateNew
+    ///     makes the existence check and the create a single race-free operation.
+    /// </summary>
+    /// <returns>The path actually written.</returns>
+    private static async Task<string> WriteNewFileAsync(string outputFile, byte[] data)
+    {
+        var currentPath = outputFile;
+        for (var counter = 1;; counter++)
+        {
+            SafeFileHandle handle;
+            try
+            {
+                handle = File.OpenHandle(currentPath, FileMode.CreateNew, FileAccess.Write, FileShare.None,
+                    FileOptions.Asynchronous, data.Length);
+            }
+            catch (IOException) when (File.Exists(currentPath))
+            {
+                var dir = Path.GetDirectoryName(outputFile)!;
+                var nameWithoutExt = Path.GetFileNameWithoutExtension(outputFile);
+                var ext = Path.GetExtension(outputFile);
+                currentPath = Path.Combine(dir, $"{nameWithoutExt}_{counter}{ext}");
+                continue;
+            }
+
+            using (handle)
+            {
+                await RandomAccess.WriteAsync(handle, data, 0);
+            }
+
+            return currentPath;
+        }
+    }
+
     /// <summary>
     ///     Write file with retry logic for handling concurrent access to same filename.
     /// </summary>
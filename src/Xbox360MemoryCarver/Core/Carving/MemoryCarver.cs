@@ -1,6 +1,7 @@
-using System.Buffers;
 using System.Collections.Concurrent;
 using System.IO.MemoryMappedFiles;
+using System.Runtime.InteropServices;
+using System.Security.Cryptography;
 using Xbox360MemoryCarver.Core.Formats;
 using Xbox360MemoryCarver.Core.Utils;
 
@@ -11,17 +12,34 @@ namespace Xbox360MemoryCarver.Core.Carving;
 /// </summary>
 public sealed class MemoryCarver : IDisposable
 {
+    /// <summary>
+    ///     Built matchers keyed by their signature set. Building compiles the whole automaton, and a carver is
+    ///     created per dump, so batch runs reuse the matcher instead of rebuilding it for every file.
+    /// </summary>
+    private static readonly ConcurrentDictionary<string, SignatureMatcher> MatcherCache = new();
+
+    private const string ScdaSignatureId = "scda";
+
+    private readonly bool _collectScriptOffsets;
     private readonly Dictionary<string, IFileConverter> _converters = new();
+    private readonly bool _deduplicateContent;
+    private readonly OutputDirectoryCache _directories = new();
     private readonly bool _enableConversion;
+    private readonly IFileFormat[] _formats;
     private readonly ConcurrentBag<CarveEntry> _manifest = [];
     private readonly int _maxFilesPerType;
     private readonly string _outputDir;
-    private readonly ConcurrentDictionary<long, byte> _processedOffsets = new();
+    private readonly List<long> _scriptOffsets = [];
     private readonly bool _saveAtlas;
-    private readonly HashSet<string> _signatureIdsToSearch;
+    private readonly IReadOnlySet<string> _signatureIdsToSearch;
+    private readonly int[] _patternSignatureIndex;
+    private readonly int _scdaPatternId = -1;
+    private readonly string[] _signatureIds;
     private readonly SignatureMatcher _signatureMatcher;
-    private readonly ConcurrentDictionary<string, int> _stats = new();
+    private readonly CarveSizeLimits[] _sizeLimits;
+    private readonly int[] _statCounts;
     private bool _disposed;
+    private int _duplicatesSkipped;
     private CarveWriter? _writer;
 
     public MemoryCarver(
@@ -30,18 +48,50 @@ public sealed class MemoryCarver : IDisposable
         bool convertDdxToDds = true,
         List<string>? fileTypes = null,
         bool verbose = false,
-        bool saveAtlas = false)
+        bool saveAtlas = false,
+        bool collectScriptOffsets = false,
+        bool deduplicateContent = false)
     {
         _outputDir = outputDir;
         _maxFilesPerType = maxFilesPerType;
         _saveAtlas = saveAtlas;
         _enableConversion = convertDdxToDds;
+        _collectScriptOffsets = collectScriptOffsets;
+        _deduplicateContent = deduplicateContent;
 
-        _signatureMatcher = new SignatureMatcher();
         _signatureIdsToSearch = GetSignatureIdsToSearch(fileTypes);
 
-        InitializeSignatures();
-        _signatureMatcher.Build();
+        // Script extraction reuses this pass to locate SCDA records, even when SCDA files are not carved
+        var matcherIds = collectScriptOffsets && !_signatureIdsToSearch.Contains(ScdaSignatureId)
+            ? new HashSet<string>(_signatureIdsToSearch, StringComparer.OrdinalIgnoreCase) { ScdaSignatureId }
+            : _signatureIdsToSearch;
+        _signatureMatcher = GetSignatureMatcher(matcherIds);
+
+        // Per-type counts live in a flat array indexed by signature so the hot limit check is a plain load
+        _signatureIds = [.. ResolveSignatures(_signatureIdsToSearch).Select(sig => sig.Id)];
+        var signatureIndex = new Dictionary<string, int>(_signatureIds.Length, StringComparer.OrdinalIgnoreCase);
+        for (var i = 0; i < _signatureIds.Length; i++)
+        {
+            signatureIndex[_signatureIds[i]] = i;
+        }
+
+        _statCounts = new int[_signatureIds.Length];
+
+        // Resolve each signature's format once so extraction indexes it instead of looking it up per match
+        _formats = [.. _signatureIds.Select(id => FormatRegistry.GetBySignatureId(id)!)];
+        _sizeLimits = [.. _signatureIds.Select((id, i) => CarveSizeLimits.For(id, _formats[i]))];
+
+        // Matches come back as matcher pattern ids; map each id to its count slot once (-1 = not carved)
+        _patternSignatureIndex = new int[_signatureMatcher.PatternCount];
+        for (var id = 0; id < _patternSignatureIndex.Length; id++)
+        {
+            var name = _signatureMatcher.GetPatternName(id);
+            _patternSignatureIndex[id] = signatureIndex.GetValueOrDefault(name, -1);
+            if (name == ScdaSignatureId)
+            {
+                _scdaPatternId = id;
+            }
+        }
 
         if (_enableConversion)
         {
@@ -53,7 +103,34 @@ public sealed class MemoryCarver : IDisposable
     public int DdxConvertFailedCount => _converters.TryGetValue("ddx", out var c) ? c.FailedCount : 0;
     public int XurConvertedCount => _converters.TryGetValue("xui", out var c) ? c.ConvertedCount : 0;
     public int XurConvertFailedCount => _converters.TryGetValue("xui", out var c) ? c.FailedCount : 0;
-    public IReadOnlyDictionary<string, int> Stats => _stats;
+
+    /// <summary>
+    ///     Number of files carved per signature id during the last carve.
+    /// </summary>
+    public IReadOnlyDictionary<string, int> Stats
+    {
+        get
+        {
+            var stats = new Dictionary<string, int>(_signatureIds.Length);
+            for (var i = 0; i < _signatureIds.Length; i++)
+            {
+                stats[_signatureIds[i]] = Volatile.Read(ref _statCounts[i]);
+            }
+
+            return stats;
+        }
+    }
+
+    /// <summary>
+    ///     Number of matches skipped during the last carve because an earlier offset carved identical bytes.
+    /// </summary>
+    public int DuplicatesSkipped => _duplicatesSkipped;
+
+    /// <summary>
+    ///     Offsets of every SCDA signature seen during the last carve, in ascending order.
+    ///     Only populated when the carver was created with collectScriptOffsets.
+    /// </summary>
+    public IReadOnlyList<long> ScriptSignatureOffsets => _scriptOffsets;
 
     /// <summary>
     ///     Offsets of files that failed conversion (DDX -> DDS, etc.).
@@ -71,6 +148,23 @@ public sealed class MemoryCarver : IDisposable
     }
 
     public async Task<List<CarveEntry>> CarveDumpAsync(string dumpPath, IProgress<double>? progress = null)
+    {
+        var fileInfo = new FileInfo(dumpPath);
+        using var mmf = MemoryMappedFile.CreateFromFile(dumpPath, FileMode.Open, null, 0, MemoryMappedFileAccess.Read);
+        using var accessor = mmf.CreateViewAccessor(0, fileInfo.Length, MemoryMappedFileAccess.Read);
+
+        return await CarveDumpAsync(dumpPath, accessor, fileInfo.Length, progress);
+    }
+
+    /// <summary>
+    ///     Carve files from a dump that the caller has already memory-mapped,
+    ///     so the same mapping can be shared with module and script extraction.
+    /// </summary>
+    public async Task<List<CarveEntry>> CarveDumpAsync(
+        string dumpPath,
+        MemoryMappedViewAccessor accessor,
+        long fileSize,
+        IProgress<double>? progress = null)
     {
         var dumpName = Path.GetFileNameWithoutExtension(dumpPath);
         var outputPath = Path.Combine(_outputDir, BinaryUtils.SanitizeFilename(dumpName));
@@ -78,38 +172,52 @@ public sealed class MemoryCarver : IDisposable
 
         Reset();
 
-        var fileInfo = new FileInfo(dumpPath);
-        using var mmf = MemoryMappedFile.CreateFromFile(dumpPath, FileMode.Open, null, 0, MemoryMappedFileAccess.Read);
-        using var accessor = mmf.CreateViewAccessor(0, fileInfo.Length, MemoryMappedFileAccess.Read);
+        var matches = FindAllMatches(accessor, fileSize, progress);
+        await ExtractMatchesAsync(accessor, fileSize, matches, outputPath, progress);
 
-        var matches = FindAllMatches(accessor, fileInfo.Length, progress);
-        await ExtractMatchesAsync(accessor, fileInfo.Length, matches, outputPath, progress);
-        await CarveManifest.SaveAsync(outputPath, _manifest);
+        // Snapshot the bag once; the same list is serialized and returned to the caller
+        List<CarveEntry> entries = [.. _manifest];
+        await CarveManifest.SaveAsync(outputPath, entries);
 
         progress?.Report(1.0);
-        return [.. _manifest];
+        return entries;
     }
 
     private void Reset()
     {
         _manifest.Clear();
-        _processedOffsets.Clear();
-        foreach (var key in _stats.Keys)
+        _duplicatesSkipped = 0;
+        _directories.Clear();
+        _scriptOffsets.Clear();
+        Array.Clear(_statCounts);
+    }
+
+    private static SignatureMatcher GetSignatureMatcher(IReadOnlySet<string> signatureIds)
+    {
+        var key = string.Join('|', signatureIds.Select(id => id.ToLowerInvariant()).Order(StringComparer.Ordinal));
+        return MatcherCache.GetOrAdd(key, _ => BuildSignatureMatcher(signatureIds));
+    }
+
+    private static SignatureMatcher BuildSignatureMatcher(IReadOnlySet<string> signatureIds)
+    {
+        var matcher = new SignatureMatcher();
+        foreach (var sig in ResolveSignatures(signatureIds))
         {
-            _stats[key] = 0;
+            matcher.AddPattern(sig.Id, sig.MagicBytes);
         }
+
+        matcher.Build();
+        return matcher;
     }
 
-    private void InitializeSignatures()
+    private static IEnumerable<FormatSignature> ResolveSignatures(IReadOnlySet<string> signatureIds)
     {
-        foreach (var sigId in _signatureIdsToSearch)
+        foreach (var sigId in signatureIds)
         {
-            var format = FormatRegistry.GetBySignatureId(sigId);
-            var sig = format?.Signatures.FirstOrDefault(s => s.Id.Equals(sigId, StringComparison.OrdinalIgnoreCase));
+            var sig = FormatRegistry.GetSignature(sigId);
             if (sig != null)
             {
-                _signatureMatcher.AddPattern(sig.Id, sig.MagicBytes);
-                _stats[sig.Id] = 0;
+                yield return sig;
             }
         }
     }
@@ -127,14 +235,11 @@ public sealed class MemoryCarver : IDisposable
         }
     }
 
-    private static HashSet<string> GetSignatureIdsToSearch(List<string>? fileTypes)
+    private static IReadOnlySet<string> GetSignatureIdsToSearch(List<string>? fileTypes)
     {
         if (fileTypes == null || fileTypes.Count == 0)
         {
-            return FormatRegistry.All
-                .Where(f => f.EnableSignatureScanning)
-                .SelectMany(f => f.Signatures.Select(s => s.Id))
-                .ToHashSet(StringComparer.OrdinalIgnoreCase);
+            return FormatRegistry.ScannableSignatureIds;
         }
 
         var result = new HashSet<string>(StringComparer.OrdinalIgnoreCase);
@@ -161,44 +266,45 @@ public sealed class MemoryCarver : IDisposable
         return result;
     }
 
-    private List<(string SignatureId, long Offset)> FindAllMatches(
+    private List<(string SignatureId, int SignatureIndex, long Offset)> FindAllMatches(
         MemoryMappedViewAccessor accessor,
         long fileSize,
         IProgress<double>? progress)
     {
         const int chunkSize = 64 * 1024 * 1024;
-        if (_signatureIdsToSearch.Count == 0)
+        if (_signatureIdsToSearch.Count == 0 && !_collectScriptOffsets)
         {
             return [];
         }
 
-        var maxPatternLength = _signatureMatcher.MaxPatternLength;
-        var allMatches = new List<(string SignatureId, long Offset)>();
-        var buffer = ArrayPool<byte>.Shared.Rent(chunkSize + maxPatternLength);
+        var allMatches = new List<(string SignatureId, int SignatureIndex, long Offset)>();
 
-        try
+        // Scan windows directly over the mapped pages, one window per core at a time;
+        // chunkSize only bounds the working set per search
+        using var reader = new MemoryMappedSpanReader(accessor, fileSize);
+        var matches = _signatureMatcher.SearchMapped(reader, chunkSize,
+            progress == null ? null : scanned => progress.Report((double)scanned / fileSize * 0.5));
+
+        foreach (var (patternId, position) in matches)
         {
-            long offset = 0;
-            while (offset < fileSize)
+            if (_collectScriptOffsets && patternId == _scdaPatternId)
             {
-                var toRead = (int)Math.Min(chunkSize + maxPatternLength, fileSize - offset);
-                accessor.ReadArray(offset, buffer, 0, toRead);
-
-                foreach (var (name, _, position) in _signatureMatcher.Search(buffer.AsSpan(0, toRead), offset))
-                {
-                    if (_stats.GetValueOrDefault(name, 0) < _maxFilesPerType)
-                    {
-                        allMatches.Add((name, position));
-                    }
-                }
+                _scriptOffsets.Add(position);
+            }
 
-                offset += chunkSize;
-                progress?.Report(Math.Min((double)offset / fileSize * 0.5, 0.5));
+            var signatureIndex = _patternSignatureIndex[patternId];
+            if (signatureIndex >= 0 && _statCounts[signatureIndex] < _maxFilesPerType)
+            {
+                allMatches.Add((_signatureIds[signatureIndex], signatureIndex, position));
             }
         }
-        finally
+
+        if (_scriptOffsets.Count > 0)
         {
-            ArrayPool<byte>.Shared.Return(buffer);
+            // Chunk windows overlap by the longest pattern, so a signature can be reported twice
+            var distinctOffsets = _scriptOffsets.Distinct().Order().ToList();
+            _scriptOffsets.Clear();
+            _scriptOffsets.AddRange(distinctOffsets);
         }
 
         return allMatches.DistinctBy(m => m.Offset).OrderBy(m => m.Offset).ToList();
@@ -207,7 +313,7 @@ public sealed class MemoryCarver : IDisposable
     private async Task ExtractMatchesAsync(
         MemoryMappedViewAccessor accessor,
         long fileSize,
-        List<(string SignatureId, long Offset)> matches,
+        List<(string SignatureId, int SignatureIndex, long Offset)> matches,
         string outputPath,
         IProgress<double>? progress)
     {
@@ -216,52 +322,170 @@ public sealed class MemoryCarver : IDisposable
             return;
         }
 
-        _writer = new CarveWriter(_converters, _enableConversion, _saveAtlas, _manifest.Add);
+        _writer = new CarveWriter(_converters, _enableConversion, _saveAtlas, _directories, _manifest.Add);
+
+        // One reader shared by all workers; it only hands out read-only spans over the mapping
+        using var reader = new MemoryMappedSpanReader(accessor, fileSize);
+
+        if (_deduplicateContent)
+        {
+            await ExtractDistinctMatchesAsync(reader, matches, outputPath, progress);
+        }
+        else
+        {
+            await ExtractAllMatchesAsync(reader, matches, outputPath, progress);
+        }
+    }
+
+    /// <summary>
+    ///     Carve and write every match, up to the per-type limit.
+    /// </summary>
+    private async Task ExtractAllMatchesAsync(
+        MemoryMappedSpanReader reader,
+        List<(string SignatureId, int SignatureIndex, long Offset)> matches,
+        string outputPath,
+        IProgress<double>? progress)
+    {
         var processedCount = 0;
-        var totalMatches = matches.Count;
 
         await Parallel.ForEachAsync(matches,
             new ParallelOptions { MaxDegreeOfParallelism = Environment.ProcessorCount },
             async (match, _) =>
             {
-                if (_stats.GetValueOrDefault(match.SignatureId, 0) >= _maxFilesPerType)
+                if (Volatile.Read(ref _statCounts[match.SignatureIndex]) < _maxFilesPerType)
                 {
-                    return;
-                }
+                    var extraction = CarveExtractor.PrepareExtraction(reader, match.Offset, match.SignatureId,
+                        _formats[match.SignatureIndex], _sizeLimits[match.SignatureIndex], outputPath, _directories);
 
-                if (!_processedOffsets.TryAdd(match.Offset, 0))
-                {
-                    return;
+                    if (extraction != null)
+                    {
+                        await WriteExtractionAsync(match, extraction.Value);
+                    }
                 }
 
-                var format = FormatRegistry.GetBySignatureId(match.SignatureId);
-                if (format == null)
-                {
-                    return;
-                }
+                ReportProgress(progress, Interlocked.Increment(ref processedCount), matches.Count, 0.5, 0.5);
+            });
+    }
 
-                var extraction = CarveExtractor.PrepareExtraction(accessor, fileSize, match.Offset,
-                    match.SignatureId, format, outputPath);
+    /// <summary>
+    ///     Carve every match in parallel, then write only the lowest offset of each identical payload.
+    ///     Duplicates are resolved in offset order, so the surviving copy does not depend on thread timing;
+    ///     the per-type limit likewise keeps the first matches found.
+    /// </summary>
+    private async Task ExtractDistinctMatchesAsync(
+        MemoryMappedSpanReader reader,
+        List<(string SignatureId, int SignatureIndex, long Offset)> matches,
+        string outputPath,
+        IProgress<double>? progress)
+    {
+        var prepared = new ExtractionData?[matches.Count];
+        var hashes = new UInt128[matches.Count];
+        var processedCount = 0;
+
+        await Parallel.ForAsync(0, matches.Count,
+            new ParallelOptions { MaxDegreeOfParallelism = Environment.ProcessorCount },
+            (i, _) =>
+            {
+                var match = matches[i];
+                var extraction = CarveExtractor.PrepareExtraction(reader, match.Offset, match.SignatureId,
+                    _formats[match.SignatureIndex], _sizeLimits[match.SignatureIndex], outputPath, _directories);
 
                 if (extraction != null)
                 {
-                    _stats.AddOrUpdate(match.SignatureId, 1, (_, v) => v + 1);
-                    await _writer.WriteFileAsync(new WriteFileParams(
-                        extraction.Value.OutputFile,
-                        extraction.Value.Data,
-                        match.Offset,
-                        match.SignatureId,
-                        extraction.Value.FileSize,
-                        extraction.Value.OriginalPath,
-                        extraction.Value.Metadata));
+                    prepared[i] = extraction;
+                    hashes[i] = HashContent(extraction.Value.Data);
                 }
 
-                var currentCount = Interlocked.Increment(ref processedCount);
-                if (progress != null &&
-                    (currentCount % Math.Max(1, totalMatches / 100) == 0 || currentCount == totalMatches))
-                {
-                    progress.Report(0.5 + (double)currentCount / totalMatches * 0.5);
-                }
+                ReportProgress(progress, Interlocked.Increment(ref processedCount), matches.Count, 0.5, 0.25);
+                return ValueTask.CompletedTask;
+            });
+
+        var selected = SelectDistinctMatches(matches, prepared, hashes);
+        var writtenCount = 0;
+
+        await Parallel.ForEachAsync(selected,
+            new ParallelOptions { MaxDegreeOfParallelism = Environment.ProcessorCount },
+            async (i, _) =>
+            {
+                await WriteExtractionAsync(matches[i], prepared[i]!.Value);
+
+                // Release the carved bytes as soon as they are on disk
+                prepared[i] = null;
+                ReportProgress(progress, Interlocked.Increment(ref writtenCount), selected.Count, 0.75, 0.25);
             });
     }
+
+    /// <summary>
+    ///     Pick the indices of the matches to write, walking them in offset order: the first carve of each
+    ///     payload wins and later identical ones are counted as skipped duplicates.
+    /// </summary>
+    private List<int> SelectDistinctMatches(
+        List<(string SignatureId, int SignatureIndex, long Offset)> matches,
+        ExtractionData?[] prepared,
+        UInt128[] hashes)
+    {
+        var selected = new List<int>(matches.Count);
+        var seen = new HashSet<(int SignatureIndex, UInt128 Hash)>();
+        var selectedCounts = new int[_signatureIds.Length];
+
+        for (var i = 0; i < matches.Count; i++)
+        {
+            var signatureIndex = matches[i].SignatureIndex;
+            if (prepared[i] == null || selectedCounts[signatureIndex] >= _maxFilesPerType)
+            {
+                prepared[i] = null;
+                continue;
+            }
+
+            if (!seen.Add((signatureIndex, hashes[i])))
+            {
+                prepared[i] = null;
+                _duplicatesSkipped++;
+                continue;
+            }
+
+            selectedCounts[signatureIndex]++;
+            selected.Add(i);
+        }
+
+        return selected;
+    }
+
+    private async Task WriteExtractionAsync(
+        (string SignatureId, int SignatureIndex, long Offset) match,
+        ExtractionData extraction)
+    {
+        Interlocked.Increment(ref _statCounts[match.SignatureIndex]);
+        await _writer!.WriteFileAsync(new WriteFileParams(
+            extraction.OutputFile,
+            extraction.Data,
+            match.Offset,
+            match.SignatureId,
+            _formats[match.SignatureIndex],
+            extraction.FileSize,
+            extraction.OriginalPath,
+            extraction.Metadata));
+    }
+
+    /// <summary>
+    ///     Report about once per percent of <paramref name="total" />, mapped onto [start, start + span].
+    /// </summary>
+    private static void ReportProgress(IProgress<double>? progress, int current, int total, double start,
+        double span)
+    {
+        if (progress != null && (current % Math.Max(1, total / 100) == 0 || current == total))
+        {
+            progress.Report(start + (double)current / total * span);
+        }
+    }
+
+    /// <summary>
+    ///     128-bit content fingerprint (truncated SHA-256, hardware accelerated) used to detect duplicate carves.
+    /// </summary>
+    private static UInt128 HashContent(ReadOnlySpan<byte> data)
+    {
+        Span<byte> digest = stackalloc byte[SHA256.HashSizeInBytes];
+        SHA256.HashData(data, digest);
+        return MemoryMarshal.Read<UInt128>(digest);
+    }
 }
@@ -0,0 +1,34 @@
+using System.Collections.Concurrent;
+
+namespace Xbox360MemoryCarver.Core.Carving;
+
+/// <summary>
+///     Tracks output directories already created during a carve, so each type folder
+///     is created once instead of once per extracted file.
+/// </summary>
+internal sealed class OutputDirectoryCache
+{
+    private readonly ConcurrentDictionary<string, byte> _created = new(StringComparer.Ordinal);
+
+    /// <summary>
+    ///     Create the directory unless it was already created through this cache.
+    /// </summary>
+    public void EnsureExists(string path)
+    {
+        if (_created.ContainsKey(path))
+        {
+            return;
+        }
+
+        Directory.CreateDirectory(path);
+        _created.TryAdd(path, 0);
+    }
+
+    /// <summary>
+    ///     Forget all cached directories (e.g. before carving into a tree that may have been removed).
+    /// </summary>
+    public void Clear()
+    {
+        _created.Clear();
+    }
+}
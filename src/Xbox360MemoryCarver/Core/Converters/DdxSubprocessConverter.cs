@@ -1,5 +1,6 @@
 using System.Diagnostics;
 using System.Text.RegularExpressions;
+using Xbox360MemoryCarver.Core.Utils;
 
 namespace Xbox360MemoryCarver.Core.Converters;
 
@@ -33,25 +34,59 @@ public partial class DdxSubprocessConverter
     private const string DdxConvExeName = "DDXConv.exe";
     private const string DdxConvFolderName = "DDXConv";
     private const string TargetFramework = "net10.0";
+
+    /// <summary>
+    ///     Smallest input DDXConv can accept: the fixed 0x44-byte DDX header.
+    /// </summary>
+    private const int MinDdxHeaderSize = 0x44;
+
+    /// <summary>
+    ///     DDXConv location resolved once per process. Discovery probes the environment, several candidate
+    ///     paths and walks up to the workspace root, and a converter is created for every dump processed.
+    /// </summary>
+    private static readonly Lazy<string> DefaultDdxConvPath = new(FindDdxConvPath);
+
+    /// <summary>
+    ///     Process-wide cap on concurrently running DDXConv instances. Each carver converts in parallel,
+    ///     and batch runs process several dumps at once, so without a shared limit the process count multiplies.
+    /// </summary>
+    private static readonly SemaphoreSlim ProcessSlots = new(Environment.ProcessorCount);
+
+    /// <summary>
+    ///     Per-file flags appended to every DDXConv command line; they are fixed for the converter's lifetime.
+    /// </summary>
+    private readonly string _optionFlags;
+
     private readonly bool _saveAtlas;
 
     private readonly bool _verbose;
+    private int _failed;
+    private int _processed;
+    private int _skipped;
+    private int _succeeded;
 
     public DdxSubprocessConverter(bool verbose = false, string? ddxConvPath = null, bool saveAtlas = false)
     {
         _verbose = verbose;
         _saveAtlas = saveAtlas;
-        DdxConvPath = ddxConvPath ?? FindDdxConvPath();
+        _optionFlags = (verbose ? " --verbose" : "") + (saveAtlas ? " --atlas" : "");
+        DdxConvPath = ddxConvPath ?? DefaultDdxConvPath.Value;
 
-        if (string.IsNullOrEmpty(DdxConvPath) || !File.Exists(DdxConvPath))
+        // The discovered default has already been checked; only an explicit path needs a stat here
+        if (string.IsNullOrEmpty(DdxConvPath) || (ddxConvPath != null && !File.Exists(DdxConvPath)))
         {
             throw new FileNotFoundException($"{DdxConvExeName} not found.", DdxConvExeName);
         }
     }
 
-    public int Processed { get; private set; }
-    public int Succeeded { get; private set; }
-    public int Failed { get; private set; }
+    public int Processed => _processed;
+    public int Succeeded => _succeeded;
+    public int Failed => _failed;
+
+    /// <summary>
+    ///     Inputs rejected by the header pre-check without starting DDXConv.
+    /// </summary>
+    public int Skipped => _skipped;
     public string DdxConvPath { get; }
 
     private static string FindDdxConvPath()
@@ -63,7 +98,7 @@ public partial class DdxSubprocessConverter
         }
 
         var assemblyDir = AppContext.BaseDirectory;
-        var workspaceRoot = FindWorkspaceRoot(assemblyDir);
+        var workspaceRoot = WorkspaceLocator.FindWorkspaceRoot(assemblyDir);
 
         foreach (var path in BuildCandidatePaths(assemblyDir, workspaceRoot))
         {
@@ -100,28 +135,6 @@ public partial class DdxSubprocessConverter
         return candidates;
     }
 
-    private static string? FindWorkspaceRoot(string startDir)
-    {
-        var dir = startDir;
-        while (!string.IsNullOrEmpty(dir))
-        {
-            if (Directory.GetFiles(dir, "*.slnx").Length > 0 || Directory.GetFiles(dir, "*.sln").Length > 0)
-            {
-                return dir;
-            }
-
-            var parent = Directory.GetParent(dir);
-            if (parent == null)
-            {
-                break;
-            }
-
-            dir = parent.FullName;
-        }
-
-        return null;
-    }
-
     public static bool IsAvailable()
     {
         try
@@ -137,14 +150,21 @@ public partial class DdxSubprocessConverter
 
     public bool ConvertFile(string inputPath, string outputPath)
     {
-        Processed++;
+        Interlocked.Increment(ref _processed);
         try
         {
+            if (!FileHasDdxHeader(inputPath))
+            {
+                Interlocked.Increment(ref _skipped);
+                Interlocked.Increment(ref _failed);
+                return false;
+            }
+
             var args = BuildConversionArguments(inputPath, outputPath);
             using var process = StartDdxConvProcess(args);
             if (process == null)
             {
-                Failed++;
+                Interlocked.Increment(ref _failed);
                 return false;
             }
 
@@ -158,35 +178,24 @@ public partial class DdxSubprocessConverter
 
             if (process.ExitCode != 0 || !File.Exists(outputPath))
             {
-                Failed++;
+                Interlocked.Increment(ref _failed);
                 return false;
             }
 
-            Succeeded++;
+            Interlocked.Increment(ref _succeeded);
             return true;
         }
         catch (Exception ex)
         {
             Console.WriteLine($"[DdxConverter] Exception converting {inputPath}: {ex.GetType().Name}: {ex.Message}");
-            Failed++;
+            Interlocked.Increment(ref _failed);
             return false;
         }
     }
 
     private string BuildConversionArguments(string inputPath, string outputPath)
     {
-        var args = $"\"{inputPath}\" \"{outputPath}\"";
-        if (_verbose)
-        {
-            args += " --verbose";
-        }
-
-        if (_saveAtlas)
-        {
-            args += " --atlas";
-        }
-
-        return args;
+        return $"\"{inputPath}\" \"{outputPath}\"{_optionFlags}";
     }
 
     private Process? StartDdxConvProcess(string args)
@@ -331,9 +340,22 @@ public partial class DdxSubprocessConverter
     [GeneratedRegex(@"^\[PROGRESS\] DONE (\d+) (\d+) (\d+)$", RegexOptions.Compiled)]
     private static partial Regex DoneLineRegex();
 
-    public ConversionResult ConvertFromMemoryWithResult(byte[] ddxData)
+    /// <summary>
+    ///     Converts DDX data to DDS via a DDXConv subprocess without blocking a thread-pool thread.
+    ///     Safe to call concurrently; the carver runs many conversions in parallel.
+    /// </summary>
+    public async Task<ConversionResult> ConvertFromMemoryWithResultAsync(byte[] ddxData)
     {
-        Processed++;
+        Interlocked.Increment(ref _processed);
+
+        // Reject data DDXConv cannot read before paying for temp files and a process launch
+        if (!HasDdxHeader(ddxData))
+        {
+            Interlocked.Increment(ref _skipped);
+            Interlocked.Increment(ref _failed);
+            return ConversionResult.Failure("Not a DDX texture (missing 3XDO/3XDR header)");
+        }
+
         string? tempInputPath = null, tempOutputPath = null;
 
         try
@@ -342,23 +364,38 @@ public partial class DdxSubprocessConverter
             tempInputPath = Path.Combine(tempPath, $"ddx_{Guid.NewGuid():N}.ddx");
             tempOutputPath = Path.Combine(tempPath, $"dds_{Guid.NewGuid():N}.dds");
 
-            File.WriteAllBytes(tempInputPath, ddxData);
+            await File.WriteAllBytesAsync(tempInputPath, ddxData);
             var args = $"\"{tempInputPath}\" \"{tempOutputPath}\" --verbose";
             if (_saveAtlas)
             {
                 args += " --atlas";
             }
 
-            using var process = StartDdxConvProcess(args);
-            if (process == null)
+            string stdout, stderr;
+            int exitCode;
+
+            await ProcessSlots.WaitAsync();
+            try
             {
-                Failed++;
-                return ConversionResult.Failure("Failed to start DDXConv");
-            }
+                using var process = StartDdxConvProcess(args);
+                if (process == null)
+                {
+                    Interlocked.Increment(ref _failed);
+                    return ConversionResult.Failure("Failed to start DDXConv");
+                }
 
-            var stdout = process.StandardOutput.ReadToEnd();
-            var stderr = process.StandardError.ReadToEnd();
-            process.WaitForExit();
+                // Drain both pipes concurrently so a full stderr buffer cannot stall the child process
+                var stdoutTask = process.StandardOutput.ReadToEndAsync();
+                var stderrTask = process.StandardError.ReadToEndAsync();
+                await process.WaitForExitAsync();
+                stdout = await stdoutTask;
+                stderr = await stderrTask;
+                exitCode = process.ExitCode;
+            }
+            finally
+            {
+                ProcessSlots.Release();
+            }
 
             var consoleOutput = stdout + (string.IsNullOrEmpty(stderr) ? "" : $"\nSTDERR: {stderr}");
             if (_verbose && !string.IsNullOrWhiteSpace(stdout))
@@ -370,21 +407,21 @@ public partial class DdxSubprocessConverter
 
             if (!File.Exists(tempOutputPath))
             {
-                Failed++;
+                Interlocked.Increment(ref _failed);
                 return new ConversionResult
                 {
                     Success = false,
                     IsPartial = isPartial,
-                    Notes = notes ?? $"Exit code {process.ExitCode}",
+                    Notes = notes ?? $"Exit code {exitCode}",
                     ConsoleOutput = consoleOutput
                 };
             }
 
-            var ddsData = File.ReadAllBytes(tempOutputPath);
+            var ddsData = await File.ReadAllBytesAsync(tempOutputPath);
             var atlasPath = tempOutputPath.Replace(".dds", "_full_atlas.dds");
-            var atlasData = _saveAtlas && File.Exists(atlasPath) ? File.ReadAllBytes(atlasPath) : null;
+            var atlasData = _saveAtlas && File.Exists(atlasPath) ? await File.ReadAllBytesAsync(atlasPath) : null;
 
-            Succeeded++;
+            Interlocked.Increment(ref _succeeded);
             return new ConversionResult
             {
                 Success = true,
@@ -397,7 +434,7 @@ public partial class DdxSubprocessConverter
         }
         catch (Exception ex)
         {
-            Failed++;
+            Interlocked.Increment(ref _failed);
             return ConversionResult.Failure($"Exception: {ex.Message}");
         }
         finally
@@ -406,6 +443,27 @@ public partial class DdxSubprocessConverter
         }
     }
 
+    /// <summary>
+    ///     Whether the data starts with a complete 3XDO or 3XDR header.
+    /// </summary>
+    internal static bool HasDdxHeader(ReadOnlySpan<byte> data)
+    {
+        if (data.Length < MinDdxHeaderSize)
+        {
+            return false;
+        }
+
+        var magic = data[..4];
+        return magic.SequenceEqual("3XDO"u8) || magic.SequenceEqual("3XDR"u8);
+    }
+
+    private static bool FileHasDdxHeader(string path)
+    {
+        Span<byte> header = stackalloc byte[MinDdxHeaderSize];
+        using var handle = File.OpenHandle(path);
+        return RandomAccess.Read(handle, header, 0) == header.Length && HasDdxHeader(header);
+    }
+
     private static (bool isPartial, string? notes) AnalyzeOutput(string output)
     {
         var isPartial = output.Contains("atlas-only", StringComparison.OrdinalIgnoreCase) ||
@@ -448,9 +506,4 @@ public partial class DdxSubprocessConverter
             /* Best-effort cleanup */
         }
     }
-
-    public Task<ConversionResult> ConvertFromMemoryWithResultAsync(byte[] ddxData)
-    {
-        return Task.Run(() => ConvertFromMemoryWithResult(ddxData));
-    }
 }
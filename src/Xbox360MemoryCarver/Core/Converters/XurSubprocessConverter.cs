@@ -1,4 +1,5 @@
 using System.Diagnostics;
+using Xbox360MemoryCarver.Core.Utils;
 
 namespace Xbox360MemoryCarver.Core.Converters;
 
@@ -14,14 +15,24 @@ public class XurSubprocessConverter
 
     private static readonly Logger Log = Logger.Instance;
 
+    /// <summary>
+    ///     XUIHelper location resolved once per process rather than for every dump processed.
+    /// </summary>
+    private static readonly Lazy<string> DefaultXuiHelperPath = new(FindXuiHelperPath);
+
+    private readonly string? _workingDirectory;
+
     public XurSubprocessConverter(string? xuiHelperPath = null)
     {
-        XuiHelperPath = xuiHelperPath ?? FindXuiHelperPath();
+        XuiHelperPath = xuiHelperPath ?? DefaultXuiHelperPath.Value;
 
-        if (string.IsNullOrEmpty(XuiHelperPath) || !File.Exists(XuiHelperPath))
+        // The discovered default has already been checked; only an explicit path needs a stat here
+        if (string.IsNullOrEmpty(XuiHelperPath) || (xuiHelperPath != null && !File.Exists(XuiHelperPath)))
         {
             throw new FileNotFoundException($"{XuiHelperExeName} not found.", XuiHelperExeName);
         }
+
+        _workingDirectory = Path.GetDirectoryName(XuiHelperPath);
     }
 
     public int Processed { get; private set; }
@@ -38,7 +49,7 @@ public class XurSubprocessConverter
         }
 
         var assemblyDir = AppContext.BaseDirectory;
-        var workspaceRoot = FindWorkspaceRoot(assemblyDir);
+        var workspaceRoot = WorkspaceLocator.FindWorkspaceRoot(assemblyDir);
 
         foreach (var path in BuildCandidatePaths(assemblyDir, workspaceRoot))
         {
@@ -81,28 +92,6 @@ public class XurSubprocessConverter
         return candidates;
     }
 
-    private static string? FindWorkspaceRoot(string startDir)
-    {
-        var dir = startDir;
-        while (!string.IsNullOrEmpty(dir))
-        {
-            if (Directory.GetFiles(dir, "*.slnx").Length > 0 || Directory.GetFiles(dir, "*.sln").Length > 0)
-            {
-                return dir;
-            }
-
-            var parent = Directory.GetParent(dir);
-            if (parent == null)
-            {
-                break;
-            }
-
-            dir = parent.FullName;
-        }
-
-        return null;
-    }
-
     /// <summary>
     ///     Detects XUR version from file header.
     /// </summary>
@@ -215,7 +204,7 @@ public class XurSubprocessConverter
             RedirectStandardOutput = true,
             RedirectStandardError = true,
             CreateNoWindow = true,
-            WorkingDirectory = Path.GetDirectoryName(XuiHelperPath)
+            WorkingDirectory = _workingDirectory
         });
     }
 
@@ -78,55 +78,48 @@ public sealed class BikFormat : FileFormatBase
             return null;
         }
 
-        try
-        {
-            // Read header fields
-            var fileSize = BinaryUtils.ReadUInt32LE(data, offset + 4);
-            var frameCount = BinaryUtils.ReadUInt32LE(data, offset + 8);
-            var largestFrameSize = BinaryUtils.ReadUInt32LE(data, offset + 12);
-            var width = BinaryUtils.ReadUInt32LE(data, offset + 20);
-            var height = BinaryUtils.ReadUInt32LE(data, offset + 24);
+        // Read header fields
+        var fileSize = BinaryUtils.ReadUInt32LE(data, offset + 4);
+        var frameCount = BinaryUtils.ReadUInt32LE(data, offset + 8);
+        var largestFrameSize = BinaryUtils.ReadUInt32LE(data, offset + 12);
+        var width = BinaryUtils.ReadUInt32LE(data, offset + 20);
+        var height = BinaryUtils.ReadUInt32LE(data, offset + 24);
 
-            // Validate dimensions
-            if (width == 0 || height == 0 || width > 4096 || height > 4096)
-            {
-                return null;
-            }
-
-            // Validate frame count
-            if (frameCount == 0 || frameCount > 1000000)
-            {
-                return null;
-            }
+        // Validate dimensions
+        if (width == 0 || height == 0 || width > 4096 || height > 4096)
+        {
+            return null;
+        }
 
-            // File size in header includes header, so use it directly
-            // Add 8 bytes for the magic and size fields themselves
-            var estimatedSize = (int)Math.Min(fileSize + 8, MaxSize);
+        // Validate frame count
+        if (frameCount == 0 || frameCount > 1000000)
+        {
+            return null;
+        }
 
-            // Sanity check - largest frame shouldn't be bigger than total file
-            if (largestFrameSize > fileSize)
-            {
-                return null;
-            }
+        // File size in header includes header, so use it directly
+        // Add 8 bytes for the magic and size fields themselves
+        var estimatedSize = (int)Math.Min(fileSize + 8, MaxSize);
 
-            return new ParseResult
-            {
-                Format = $"BIK{versionByte}",
-                EstimatedSize = estimatedSize,
-                Metadata = new Dictionary<string, object>
-                {
-                    ["version"] = versionByte.ToString(),
-                    ["width"] = (int)width,
-                    ["height"] = (int)height,
-                    ["frameCount"] = (int)frameCount,
-                    ["fileSize"] = (long)fileSize,
-                    ["dimensions"] = $"{width}x{height}"
-                }
-            };
-        }
-        catch
+        // Sanity check - largest frame shouldn't be bigger than total file
+        if (largestFrameSize > fileSize)
         {
             return null;
         }
+
+        return new ParseResult
+        {
+            Format = $"BIK{versionByte}",
+            EstimatedSize = estimatedSize,
+            Metadata = new Dictionary<string, object>
+            {
+                ["version"] = versionByte.ToString(),
+                ["width"] = (int)width,
+                ["height"] = (int)height,
+                ["frameCount"] = (int)frameCount,
+                ["fileSize"] = (long)fileSize,
+                ["dimensions"] = $"{width}x{height}"
+            }
+        };
     }
 }
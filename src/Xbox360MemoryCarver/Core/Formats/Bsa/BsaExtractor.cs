@@ -2,8 +2,11 @@
 // Licensed under the MIT License.
 
 using System.Buffers;
+using System.Buffers.Binary;
+using System.Collections.Concurrent;
 using System.IO.Compression;
 using System.IO.MemoryMappedFiles;
+using Xbox360MemoryCarver.Core.Carving;
 using Xbox360MemoryCarver.Core.Converters;
 using Xbox360MemoryCarver.Core.Formats.Xma;
 
@@ -16,10 +19,15 @@ namespace Xbox360MemoryCarver.Core.Formats.Bsa;
 /// </summary>
 public sealed class BsaExtractor : IDisposable
 {
+    // CMF compression method nibble plus the FLG preset-dictionary bit
+    private const ushort ZlibMethodAndDictMask = 0x0F20;
+    private const ushort ZlibDeflateNoDict = 0x0800;
+
     // Converter cache - keyed by extension (e.g., ".ddx", ".nif")
     // Uses FormatRegistry to resolve converters
-    private readonly Dictionary<string, IFileConverter?> _converterCache = new(StringComparer.OrdinalIgnoreCase);
+    private readonly ConcurrentDictionary<string, IFileConverter?> _converterCache = new(StringComparer.OrdinalIgnoreCase);
     private readonly bool _defaultCompressed;
+    private readonly OutputDirectoryCache _directories = new();
     private readonly bool _embedFileNames;
     private readonly HashSet<string> _enabledExtensions = new(StringComparer.OrdinalIgnoreCase);
     private readonly MemoryMappedFile _mappedFile;
@@ -233,24 +241,17 @@ public sealed class BsaExtractor : IDisposable
     /// </summary>
     private IFileConverter? GetOrCreateConverter(string extension)
     {
-        if (_converterCache.TryGetValue(extension, out var cached))
-        {
-            return cached;
-        }
-
-        var converter = FormatRegistry.GetConverterByExtension(extension);
-        if (converter != null)
+        return _converterCache.GetOrAdd(extension, ext =>
         {
-            converter.Initialize(_verbose);
-        }
-
-        _converterCache[extension] = converter;
-        return converter;
+            var converter = FormatRegistry.GetConverterByExtension(ext);
+            converter?.Initialize(_verbose);
+            return converter;
+        });
     }
 
     /// <summary>
     ///     Extract a single file to a byte array.
-    ///     Thread-safe: each call creates its own view accessor for lock-free concurrent reads.
+    ///     Thread-safe: each call creates its own view stream for lock-free concurrent reads.
     /// </summary>
     public byte[] ExtractFile(BsaFileRecord file)
     {
@@ -259,69 +260,129 @@ public sealed class BsaExtractor : IDisposable
         // Determine if this file is compressed
         var isCompressed = _defaultCompressed != file.CompressionToggle;
 
-        // Calculate data offset and size (use long for offset arithmetic)
-        var dataOffset = (long)file.Offset;
-        var dataSize = (int)file.Size;
-
-        // Skip embedded file name if present
-        if (_embedFileNames)
+        // Data is read (or inflated) straight out of the mapping, never staged in an intermediate buffer
+        using var view = OpenRecordView(file, out var dataSize);
+        if (view == null)
         {
-            // Read the name length byte
-            using var nameAccessor = _mappedFile.CreateViewAccessor(file.Offset, 1, MemoryMappedFileAccess.Read);
-            var nameLen = nameAccessor.ReadByte(0);
-            dataOffset += 1 + nameLen;
-            dataSize -= 1 + nameLen;
+            return [];
         }
 
-        // Create a view accessor for this file's data - thread-safe, no lock needed
-        using var accessor = _mappedFile.CreateViewAccessor(dataOffset, dataSize, MemoryMappedFileAccess.Read);
-
         if (isCompressed)
         {
             // First 4 bytes are uncompressed size (little-endian)
-            var uncompressedSize = accessor.ReadUInt32(0);
+            Span<byte> sizeBytes = stackalloc byte[4];
+            view.ReadExactly(sizeBytes);
+            var uncompressedSize = BinaryPrimitives.ReadUInt32LittleEndian(sizeBytes);
+            var compressedStart = view.Position;
 
-            var compressedSize = dataSize - 4;
-            var compressedData = ArrayPool<byte>.Shared.Rent(compressedSize);
-            try
-            {
-                accessor.ReadArray(4, compressedData, 0, compressedSize);
+            var result = new byte[uncompressedSize];
 
-                // Decompress using zlib (deflate with 2-byte header)
-                var result = new byte[uncompressedSize];
-                using var compressedStream = new MemoryStream(compressedData, 0, compressedSize);
-
-                // Skip zlib header (2 bytes) - BSA uses raw deflate sometimes, zlib other times
-                // Try zlib first, fall back to raw deflate
+            // BSA uses raw deflate sometimes, zlib other times. Only try zlib when the 2-byte header
+            // passes the zlib checksum, so raw deflate data doesn't pay for a failed inflate first
+            Span<byte> zlibHeader = stackalloc byte[2];
+            if (view.ReadAtLeast(zlibHeader, 2, false) == 2 && HasZlibHeader(zlibHeader))
+            {
                 try
                 {
-                    using var zlibStream = new ZLibStream(compressedStream, CompressionMode.Decompress);
+                    view.Position = compressedStart;
+                    using var zlibStream = new ZLibStream(view, CompressionMode.Decompress, true);
                     zlibStream.ReadExactly(result, 0, (int)uncompressedSize);
+                    return result;
                 }
-                catch
+                catch (Exception ex) when (ex is InvalidDataException or EndOfStreamException)
                 {
-                    // Try raw deflate
-                    compressedStream.Position = 0;
-                    using var deflateStream = new DeflateStream(compressedStream, CompressionMode.Decompress);
-                    deflateStream.ReadExactly(result, 0, (int)uncompressedSize);
+                    // Header looked valid by chance; fall through to raw deflate
                 }
-
-                return result;
-            }
-            finally
-            {
-                ArrayPool<byte>.Shared.Return(compressedData);
             }
+
+            view.Position = compressedStart;
+            using var deflateStream = new DeflateStream(view, CompressionMode.Decompress, true);
+            deflateStream.ReadExactly(result, 0, (int)uncompressedSize);
+
+            return result;
         }
 
         {
             // Uncompressed - just read the data
             var result = new byte[dataSize];
-            accessor.ReadArray(0, result, 0, dataSize);
+            view.ReadExactly(result);
             return result;
         }
     }
 
+    /// <summary>
+    ///     Open a view over the whole record (embedded name included) positioned at the file data.
+    ///     Returns null for an empty entry, which extracts as an empty file.
+    ///     Thread-safe: each view is independent, no lock needed.
+    /// </summary>
+    private MemoryMappedViewStream? OpenRecordView(BsaFileRecord file, out int dataSize)
+    {
+        // Never map a zero size: that would map everything up to the end of the archive
+        dataSize = 0;
+        if (file.Size == 0)
+        {
+            return null;
+        }
+
+        var view = _mappedFile.CreateViewStream(file.Offset, file.Size, MemoryMappedFileAccess.Read);
+
+        // Skip embedded file name if present: a length byte followed by the name
+        var dataStart = _embedFileNames ? 1 + view.ReadByte() : 0;
+        dataSize = (int)file.Size - dataStart;
+        if (dataSize <= 0)
+        {
+            view.Dispose();
+            if (dataSize < 0)
+            {
+                throw new InvalidDataException(
+                    $"BSA entry '{file.FullPath}' has an embedded name longer than the entry");
+            }
+
+            return null;
+        }
+
+        view.Position = dataStart;
+        return view;
+    }
+
+    /// <summary>
+    ///     Copy exactly <paramref name="count" /> bytes. View streams can extend past the record
+    ///     (page rounding), so the copy is bounded by the record size rather than the stream length.
+    /// </summary>
+    private static async Task CopyBytesAsync(Stream source, Stream destination, int count)
+    {
+        var buffer = ArrayPool<byte>.Shared.Rent(Math.Min(count, 81920));
+        try
+        {
+            while (count > 0)
+            {
+                var chunk = Math.Min(count, buffer.Length);
+                await source.ReadExactlyAsync(buffer.AsMemory(0, chunk));
+                await destination.WriteAsync(buffer.AsMemory(0, chunk));
+                count -= chunk;
+            }
+        }
+        finally
+        {
+            ArrayPool<byte>.Shared.Return(buffer);
+        }
+    }
+
+    /// <summary>
+    ///     Cheap zlib header check (RFC 1950) on the big-endian CMF/FLG word: deflate compression method,
+    ///     no preset dictionary (ZLibStream can't supply one), and a word divisible by 31.
+    /// </summary>
+    private static bool HasZlibHeader(ReadOnlySpan<byte> data)
+    {
+        if (data.Length < 2)
+        {
+            return false;
+        }
+
+        var header = BinaryPrimitives.ReadUInt16BigEndian(data);
+        return (header & ZlibMethodAndDictMask) == ZlibDeflateNoDict && header % 31 == 0;
+    }
+
     /// <summary>
     ///     Extract a single file to disk, optionally converting Xbox 360 formats to PC.
     ///     Supports: DDX->DDS, XMA->OGG, NIF (big-endian to little-endian).
@@ -358,7 +419,34 @@ public sealed class BsaExtractor : IDisposable
 
         try
         {
-            Directory.CreateDirectory(outputDirectory);
+            _directories.EnsureExists(outputDirectory);
+
+            // Stored files that need no conversion go straight from the mapping to disk,
+            // without materializing the whole file as a byte array first
+            if (conversionType == null && !wasCompressed)
+            {
+                ObjectDisposedException.ThrowIf(_disposed, this);
+                await using var view = OpenRecordView(file, out var dataSize);
+                await using (var output = File.Create(outputPath))
+                {
+                    if (view != null)
+                    {
+                        await CopyBytesAsync(view, output, dataSize);
+                    }
+                }
+
+                return new BsaExtractResult
+                {
+                    SourcePath = file.FullPath,
+                    OutputPath = outputPath,
+                    Success = true,
+                    OriginalSize = file.Size,
+                    ExtractedSize = dataSize,
+                    WasCompressed = false,
+                    WasConverted = false
+                };
+            }
+
             var data = ExtractFile(file);
 
             // Apply conversion if configured
@@ -478,56 +566,71 @@ public sealed class BsaExtractor : IDisposable
     /// <summary>
     ///     Extract all files to a directory.
     /// </summary>
-    public async Task<List<BsaExtractResult>> ExtractAllAsync(
+    public Task<List<BsaExtractResult>> ExtractAllAsync(
         string outputDir,
         bool overwrite = false,
         IProgress<(int current, int total, string fileName)>? progress = null,
         CancellationToken cancellationToken = default)
     {
-        var results = new List<BsaExtractResult>();
-        var allFiles = Archive.AllFiles.ToList();
-        var total = allFiles.Count;
-
-        for (var i = 0; i < total; i++)
-        {
-            cancellationToken.ThrowIfCancellationRequested();
-
-            var file = allFiles[i];
-            progress?.Report((i + 1, total, file.FullPath));
-
-            var result = await ExtractFileToDiskAsync(file, outputDir, overwrite);
-            results.Add(result);
-        }
-
-        return results;
+        return ExtractBatchAsync(Archive.AllFiles.ToList(), outputDir, overwrite, progress, cancellationToken);
     }
 
     /// <summary>
     ///     Extract files matching a filter.
     /// </summary>
-    public async Task<List<BsaExtractResult>> ExtractFilteredAsync(
+    public Task<List<BsaExtractResult>> ExtractFilteredAsync(
         string outputDir,
         Func<BsaFileRecord, bool> filter,
         bool overwrite = false,
         IProgress<(int current, int total, string fileName)>? progress = null,
         CancellationToken cancellationToken = default)
     {
-        var results = new List<BsaExtractResult>();
-        var filteredFiles = Archive.AllFiles.Where(filter).ToList();
-        var total = filteredFiles.Count;
+        return ExtractBatchAsync(Archive.AllFiles.Where(filter).ToList(), outputDir, overwrite, progress,
+            cancellationToken);
+    }
 
-        for (var i = 0; i < total; i++)
-        {
-            cancellationToken.ThrowIfCancellationRequested();
+    /// <summary>
+    ///     Extract a batch of files across all cores. Inflating and converting each file is independent
+    ///     CPU work over its own view of the mapping, so files are processed in parallel; results keep
+    ///     the input order and progress reports the number of files completed so far.
+    /// </summary>
+    private async Task<List<BsaExtractResult>> ExtractBatchAsync(
+        List<BsaFileRecord> files,
+        string outputDir,
+        bool overwrite,
+        IProgress<(int current, int total, string fileName)>? progress,
+        CancellationToken cancellationToken)
+    {
+        var total = files.Count;
+        var results = new BsaExtractResult[total];
+        var completed = 0;
+        CreateOutputDirectories(files, outputDir);
 
-            var file = filteredFiles[i];
-            progress?.Report((i + 1, total, file.FullPath));
+        await Parallel.ForEachAsync(Enumerable.Range(0, total),
+            new ParallelOptions
+            {
+                MaxDegreeOfParallelism = Environment.ProcessorCount,
+                CancellationToken = cancellationToken
+            },
+            async (i, _) =>
+            {
+                var file = files[i];
+                results[i] = await ExtractFileToDiskAsync(file, outputDir, overwrite);
+                progress?.Report((Interlocked.Increment(ref completed), total, file.FullPath));
+            });
 
-            var result = await ExtractFileToDiskAsync(file, outputDir, overwrite);
-            results.Add(result);
-        }
+        return [.. results];
+    }
 
-        return results;
+    /// <summary>
+    ///     Create every folder a batch will write into once up front, rather than once per extracted file.
+    /// </summary>
+    private void CreateOutputDirectories(List<BsaFileRecord> files, string outputDir)
+    {
+        foreach (var file in files)
+        {
+            _directories.EnsureExists(Path.GetDirectoryName(Path.Combine(outputDir, file.FullPath))!);
+        }
     }
 
     /// <summary>
@@ -558,8 +661,7 @@ public sealed class BsaExtractor : IDisposable
     {
         return Archive.Folders
             .Where(f => f.Name is not null)
-            .ToDictionary(f => f.Name!, f => f.Files.Count)
-            .OrderByDescending(kv => kv.Value)
-            .ToDictionary(kv => kv.Key, kv => kv.Value);
+            .OrderByDescending(f => f.Files.Count)
+            .ToDictionary(f => f.Name!, f => f.Files.Count);
     }
 }
@@ -1,6 +1,8 @@
 // Copyright (c) 2026 Xbox360MemoryCarver Contributors
 // Licensed under the MIT License.
 
+using System.Runtime.CompilerServices;
+using System.Runtime.InteropServices;
 using System.Text;
 
 namespace Xbox360MemoryCarver.Core.Formats.Bsa;
@@ -10,6 +12,10 @@ namespace Xbox360MemoryCarver.Core.Formats.Bsa;
 ///     BSA files are ALWAYS little-endian, even for Xbox 360 archives.
 ///     The Xbox360Archive flag (bit 7) indicates Xbox 360 origin but does NOT affect byte order.
 /// </summary>
+/// <remarks>
+///     The folder table and each folder's file records are read in one call and reinterpreted as
+///     fixed-layout records, rather than issuing three small reads per entry.
+/// </remarks>
 public static class BsaParser
 {
     /// <summary>BSA magic bytes.</summary>
@@ -73,18 +79,15 @@ public static class BsaParser
         };
 
         // Read folder records
-        var folders = new List<BsaFolderRecord>((int)folderCount);
-        for (var i = 0; i < folderCount; i++)
+        var folderRecords = ReadRecords<HashedEntryRecord>(stream, folderCount);
+        var folders = new List<BsaFolderRecord>(folderRecords.Length);
+        foreach (ref readonly var record in folderRecords.AsSpan())
         {
-            var nameHash = reader.ReadUInt64();
-            var count = reader.ReadUInt32();
-            var folderOffset = reader.ReadUInt32();
-
             folders.Add(new BsaFolderRecord
             {
-                NameHash = nameHash,
-                FileCount = count,
-                Offset = folderOffset
+                NameHash = record.NameHash,
+                FileCount = record.Value,
+                Offset = record.Offset
             });
         }
 
@@ -104,31 +107,29 @@ public static class BsaParser
             }
 
             // Read file records for this folder
-            for (var i = 0; i < folder.FileCount; i++)
+            var fileRecords = ReadRecords<HashedEntryRecord>(stream, folder.FileCount);
+            folder.Files.EnsureCapacity(fileRecords.Length);
+            foreach (ref readonly var record in fileRecords.AsSpan())
             {
-                var fileNameHash = reader.ReadUInt64();
-                var size = reader.ReadUInt32();
-                var fileOffset = reader.ReadUInt32();
-
-                var file = new BsaFileRecord
+                folder.Files.Add(new BsaFileRecord
                 {
-                    NameHash = fileNameHash,
-                    RawSize = size,
-                    Offset = fileOffset,
+                    NameHash = record.NameHash,
+                    RawSize = record.Value,
+                    Offset = record.Offset,
                     Folder = folder
-                };
-                folder.Files.Add(file);
+                });
             }
         }
 
         // Read file names block if present
         if (archiveFlags.HasFlag(BsaArchiveFlags.IncludeFileNames))
         {
+            // The names are packed back to back; read the block once and decode each name as one slice
+            ReadOnlySpan<byte> names = ReadFileNameBlock(stream, totalFileNameLength);
             foreach (var folder in folders)
             foreach (var file in folder.Files)
             {
-                var fileName = ReadNullTerminatedString(reader);
-                file.Name = fileName;
+                file.Name = ReadNullTerminatedString(ref names);
             }
         }
 
@@ -175,15 +176,64 @@ public static class BsaParser
         return data[..4].SequenceEqual(BsaMagic);
     }
 
-    private static string ReadNullTerminatedString(BinaryReader reader)
+    /// <summary>
+    ///     Read <paramref name="count" /> consecutive fixed-size records with a single stream read.
+    /// </summary>
+    private static TRecord[] ReadRecords<TRecord>(Stream stream, uint count) where TRecord : unmanaged
     {
-        var bytes = new List<byte>();
-        byte b;
-        while ((b = reader.ReadByte()) != 0)
+        // A corrupt count must not turn into a huge allocation before the short read is noticed
+        var byteCount = (long)count * Unsafe.SizeOf<TRecord>();
+        if (stream.CanSeek && byteCount > stream.Length - stream.Position)
         {
-            bytes.Add(b);
+            throw new EndOfStreamException($"BSA record table of {count} entries runs past the end of the archive");
         }
 
-        return Encoding.ASCII.GetString(bytes.ToArray());
+        var records = new TRecord[count];
+        stream.ReadExactly(MemoryMarshal.AsBytes(records.AsSpan()));
+        return records;
+    }
+
+    /// <summary>
+    ///     Read the packed file-name block in a single read.
+    /// </summary>
+    private static byte[] ReadFileNameBlock(Stream stream, uint length)
+    {
+        // A corrupt length must not turn into a huge allocation before the short read is noticed
+        if (stream.CanSeek && length > stream.Length - stream.Position)
+        {
+            throw new EndOfStreamException($"BSA file name block of {length} bytes runs past the end of the archive");
+        }
+
+        var names = new byte[length];
+        stream.ReadExactly(names);
+        return names;
+    }
+
+    /// <summary>
+    ///     Decode the string at the start of <paramref name="data" /> and advance past its terminator.
+    /// </summary>
+    private static string ReadNullTerminatedString(ref ReadOnlySpan<byte> data)
+    {
+        var length = data.IndexOf((byte)0);
+        if (length < 0)
+        {
+            length = data.Length;
+        }
+
+        var value = Encoding.ASCII.GetString(data[..length]);
+        data = data[Math.Min(length + 1, data.Length)..];
+        return value;
+    }
+
+    /// <summary>
+    ///     Folder record (hash, file count, offset) and file record (hash, raw size, offset) share this layout.
+    ///     BSA is little-endian, matching the x64/ARM64 hosts this tool runs on.
+    /// </summary>
+    [StructLayout(LayoutKind.Sequential, Pack = 4, Size = 16)]
+    private readonly struct HashedEntryRecord
+    {
+        public readonly ulong NameHash;
+        public readonly uint Value;
+        public readonly uint Offset;
     }
 }
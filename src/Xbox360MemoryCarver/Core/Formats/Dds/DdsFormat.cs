@@ -1,4 +1,7 @@
+using System.Buffers.Binary;
+using System.Runtime.InteropServices;
 using System.Text;
+using Xbox360MemoryCarver.Core.Formats.Ddx;
 using Xbox360MemoryCarver.Core.Utils;
 
 namespace Xbox360MemoryCarver.Core.Formats.Dds;
@@ -8,6 +11,13 @@ namespace Xbox360MemoryCarver.Core.Formats.Dds;
 /// </summary>
 public sealed class DdsFormat : FileFormatBase
 {
+    // DDS_HEADER dwords following the magic: size, flags, height, width, pitch, depth, mip count
+    private const int HeaderFieldCount = 7;
+    private const int HeightField = 2;
+    private const int WidthField = 3;
+    private const int PitchField = 4;
+    private const int MipCountField = 6;
+
     public override string FormatId => "dds";
     public override string DisplayName => "DDS";
     public override string Extension => ".dds";
@@ -39,75 +49,81 @@ public sealed class DdsFormat : FileFormatBase
             return null;
         }
 
-        try
+        // Every DDS header declares a 124-byte size in one byte order or the other; stray "DDS " hits
+        // in dump data fail this one read before any other header field is loaded, and the byte order
+        // it was written in decides how every other field is read
+        var headerSize = BinaryPrimitives.ReadUInt32LittleEndian(headerData[4..]);
+        var isBigEndian = headerSize == BinaryPrimitives.ReverseEndianness(124u);
+        if (headerSize != 124 && !isBigEndian)
         {
-            var headerSize = BinaryUtils.ReadUInt32LE(headerData, 4);
-            var height = BinaryUtils.ReadUInt32LE(headerData, 12);
-            var width = BinaryUtils.ReadUInt32LE(headerData, 16);
-            var pitchOrLinearSize = BinaryUtils.ReadUInt32LE(headerData, 20);
-            var mipmapCount = BinaryUtils.ReadUInt32LE(headerData, 28);
-            var fourcc = headerData.Slice(84, 4);
-            var endianness = "little";
-
-            // Check if big-endian (Xbox 360)
-            if (height > 16384 || width > 16384 || headerSize != 124)
-            {
-                height = BinaryUtils.ReadUInt32BE(headerData, 12);
-                width = BinaryUtils.ReadUInt32BE(headerData, 16);
-                pitchOrLinearSize = BinaryUtils.ReadUInt32BE(headerData, 20);
-                mipmapCount = BinaryUtils.ReadUInt32BE(headerData, 28);
-                endianness = "big";
-            }
+            return null;
+        }
 
-            if (height == 0 || width == 0 || height > 16384 || width > 16384)
-            {
-                return null;
-            }
+        // Load the header dwords once (little-endian host); Xbox 360 headers are big-endian
+        // and are byte-swapped in place rather than re-read
+        Span<uint> fields = stackalloc uint[HeaderFieldCount];
+        MemoryMarshal.Cast<byte, uint>(headerData.Slice(4, HeaderFieldCount * 4)).CopyTo(fields);
+        if (isBigEndian)
+        {
+            BinaryPrimitives.ReverseEndianness(fields, fields);
+        }
 
-            var fourccStr = Encoding.ASCII.GetString(fourcc).TrimEnd('\0');
-            var bytesPerBlock = GetBytesPerBlock(fourccStr);
-            var estimatedSize = CalculateMipmapSize((int)width, (int)height, (int)mipmapCount, bytesPerBlock);
+        var endianness = isBigEndian ? "big" : "little";
 
-            // Try to find texture path before the DDS header
-            var texturePath = TexturePathExtractor.FindPrecedingDdsPath(data, offset);
+        var height = fields[HeightField];
+        var width = fields[WidthField];
+        var pitchOrLinearSize = fields[PitchField];
+        var mipmapCount = fields[MipCountField];
+        var fourcc = headerData.Slice(84, 4);
 
-            var metadata = new Dictionary<string, object>
-            {
-                ["pitch"] = pitchOrLinearSize,
-                ["endianness"] = endianness,
-                ["width"] = (int)width,
-                ["height"] = (int)height,
-                ["mipCount"] = (int)mipmapCount,
-                ["fourCc"] = fourccStr,
-                ["isXbox360"] = endianness == "big"
-            };
-
-            string? fileName = null;
-            if (!string.IsNullOrEmpty(texturePath))
-            {
-                metadata["texturePath"] = texturePath;
-                var fn = Path.GetFileName(texturePath);
-                if (!string.IsNullOrEmpty(fn))
-                {
-                    metadata["fileName"] = fn;
-                    metadata["safeName"] = TexturePathExtractor.SanitizeFilename(Path.GetFileNameWithoutExtension(fn));
-                    fileName = fn;
-                }
-            }
+        if (height == 0 || width == 0 || height > 16384 || width > 16384)
+        {
+            return null;
+        }
+
+        var bytesPerBlock = GetBytesPerBlock(fourcc);
+        var fourccStr = Encoding.ASCII.GetString(fourcc).TrimEnd('\0');
+        var estimatedSize = TextureFormats.CalculateMipChainSize((int)width, (int)height,
+            Math.Min((int)mipmapCount, 13), bytesPerBlock);
+
+        // Try to find texture path before the DDS header
+        var texturePath = TexturePathExtractor.FindPrecedingDdsPath(data, offset);
 
-            return new ParseResult
+        var metadata = new Dictionary<string, object>
+        {
+            ["pitch"] = pitchOrLinearSize,
+            ["endianness"] = endianness,
+            ["width"] = (int)width,
+            ["height"] = (int)height,
+            ["mipCount"] = (int)mipmapCount,
+            ["fourCc"] = fourccStr,
+            ["isXbox360"] = endianness == "big"
+        };
+
+        string? fileName = null;
+        string? safeName = null;
+        if (!string.IsNullOrEmpty(texturePath))
+        {
+            metadata["texturePath"] = texturePath;
+            var fn = Path.GetFileName(texturePath);
+            if (!string.IsNullOrEmpty(fn))
             {
-                Format = "DDS",
-                EstimatedSize = estimatedSize + 128,
-                FileName = fileName,
-                Metadata = metadata
-            };
+                metadata["fileName"] = fn;
+                safeName = TexturePathExtractor.SanitizeFilename(Path.GetFileNameWithoutExtension(fn));
+                metadata["safeName"] = safeName;
+                fileName = fn;
+            }
         }
-        catch (Exception ex)
+
+        return new ParseResult
         {
-            Console.WriteLine($"[DdsFormat] Exception at offset {offset}: {ex.GetType().Name}: {ex.Message}");
-            return null;
-        }
+            Format = "DDS",
+            EstimatedSize = estimatedSize + 128,
+            FileName = fileName,
+            SafeName = safeName,
+            OriginalPath = string.IsNullOrEmpty(texturePath) ? null : texturePath,
+            Metadata = metadata
+        };
     }
 
     public override string GetDisplayDescription(string signatureId,
@@ -121,33 +137,18 @@ public sealed class DdsFormat : FileFormatBase
         return "DirectDraw Surface texture";
     }
 
-    private static int GetBytesPerBlock(string fourcc)
+    /// <summary>
+    ///     Block size looked up on the raw FourCC as a single dword, without decoding it to a string first.
+    /// </summary>
+    private static int GetBytesPerBlock(ReadOnlySpan<byte> fourcc)
     {
-        return fourcc switch
+        return BinaryPrimitives.ReadUInt32BigEndian(fourcc) switch
         {
-            "DXT1" => 8,
-            "ATI1" or "BC4U" or "BC4S" => 8,
-            _ => 16 // DXT2-5, ATI2, BC5U, BC5S, and others default to 16
+            0x44585431 => 8, // "DXT1"
+            0x41544931 => 8, // "ATI1"
+            0x42433455 => 8, // "BC4U"
+            0x42433453 => 8, // "BC4S"
+            _ => 16 // DXT2-5, ATI2, BC5U, BC5S, and others
         };
     }
-
-    private static int CalculateMipmapSize(int width, int height, int mipmapCount, int bytesPerBlock)
-    {
-        var blocksWide = (width + 3) / 4;
-        var blocksHigh = (height + 3) / 4;
-        var estimatedSize = blocksWide * blocksHigh * bytesPerBlock;
-
-        var mipWidth = width;
-        var mipHeight = height;
-        for (var i = 1; i < mipmapCount && i < 13; i++)
-        {
-            mipWidth = Math.Max(1, mipWidth / 2);
-            mipHeight = Math.Max(1, mipHeight / 2);
-            blocksWide = Math.Max(1, (mipWidth + 3) / 4);
-            blocksHigh = Math.Max(1, (mipHeight + 3) / 4);
-            estimatedSize += blocksWide * blocksHigh * bytesPerBlock;
-        }
-
-        return estimatedSize;
-    }
 }
@@ -12,6 +12,25 @@ public sealed class DdxFormat : FileFormatBase, IFileConverter
     private const string SignatureId3Xdo = "ddx_3xdo";
     private const string SignatureId3Xdr = "ddx_3xdr";
 
+    /// <summary>
+    ///     Signatures that end a DDX texture; another DDX header or a RIFF header must also validate.
+    /// </summary>
+    private static readonly SignatureBoundaryScanner.SignatureTable BoundarySignatures =
+        SignatureBoundaryScanner.CreateSignatureTable(
+            ("3XDO"u8.ToArray(), IsValidNextDdxHeader),
+            ("3XDR"u8.ToArray(), IsValidNextDdxHeader),
+            ("RIFF"u8.ToArray(), SignatureBoundaryScanner.IsValidRiffHeader),
+            ("XEX2"u8.ToArray(), null),
+            ("XUIS"u8.ToArray(), null),
+            ("XUIB"u8.ToArray(), null),
+            ("XDBF"u8.ToArray(), null),
+            ("TES4"u8.ToArray(), null),
+            ("LIPS"u8.ToArray(), null),
+            ("scn "u8.ToArray(), null),
+            ("DDS "u8.ToArray(), null),
+            ([0x89, (byte)'P', (byte)'N', (byte)'G'], null),
+            ("Gamebryo File Format"u8.ToArray(), null));
+
     private int _convertedCount;
     private DdxSubprocessConverter? _converter;
     private int _failedCount;
@@ -145,8 +164,17 @@ public sealed class DdxFormat : FileFormatBase, IFileConverter
             return null;
         }
 
+        // Validate GPU format is a known Xbox 360 texture format - reject unknown formats
+        // This significantly reduces false positives from random data matching "3XDO"/"3XDR" magic.
+        // It is the low byte of the big-endian format dword, so it is checked straight from the data
+        // before any other header field is decoded.
+        int formatByte = data[offset + 0x2B];
+        if (!TextureFormats.TryGetGpuFormatName(formatByte, out var formatName))
+        {
+            return null;
+        }
+
         var formatDword = BinaryUtils.ReadUInt32BE(data, offset + 0x28);
-        var formatByte = (int)(formatDword & 0xFF);
         var sizeDword = BinaryUtils.ReadUInt32BE(data, offset + 0x2C);
         var width = (int)(sizeDword & 0x1FFF) + 1;
         var height = (int)((sizeDword >> 13) & 0x1FFF) + 1;
@@ -160,14 +188,7 @@ public sealed class DdxFormat : FileFormatBase, IFileConverter
             return null;
         }
 
-        // Validate GPU format is a known Xbox 360 texture format - reject unknown formats
-        // This significantly reduces false positives from random data matching "3XDO"/"3XDR" magic
-        if (!TextureFormats.Xbox360GpuTextureFormats.TryGetValue(formatByte, out var formatName))
-        {
-            return null;
-        }
-
-        var uncompressedSize = CalculateUncompressedSize(width, height, mipCount, formatName);
+        var uncompressedSize = CalculateUncompressedSize(width, height, mipCount, formatByte);
         var estimatedSize = FindDdxBoundary(data, offset, uncompressedSize);
         var texturePath = TexturePathExtractor.FindPrecedingPath(data, offset, ".ddx");
 
@@ -186,6 +207,7 @@ public sealed class DdxFormat : FileFormatBase, IFileConverter
         };
 
         string? fileName = null;
+        string? safeName = null;
         if (texturePath != null)
         {
             metadata["texturePath"] = texturePath;
@@ -199,7 +221,8 @@ public sealed class DdxFormat : FileFormatBase, IFileConverter
             var safeFileName = Path.GetFileNameWithoutExtension(texturePath);
             if (!string.IsNullOrEmpty(safeFileName))
             {
-                metadata["safeName"] = TexturePathExtractor.SanitizeFilename(safeFileName);
+                safeName = TexturePathExtractor.SanitizeFilename(safeFileName);
+                metadata["safeName"] = safeName;
             }
         }
 
@@ -208,6 +231,8 @@ public sealed class DdxFormat : FileFormatBase, IFileConverter
             Format = is3Xdo ? "3XDO" : "3XDR",
             EstimatedSize = estimatedSize,
             FileName = fileName,
+            SafeName = safeName,
+            OriginalPath = texturePath,
             Metadata = metadata
         };
     }
@@ -217,20 +242,10 @@ public sealed class DdxFormat : FileFormatBase, IFileConverter
         return data[offset + 0x04] != 0xFF && data[offset + 0x24] >= 0x80;
     }
 
-    private static int CalculateUncompressedSize(int width, int height, int mipCount, string formatName)
+    private static int CalculateUncompressedSize(int width, int height, int mipCount, int formatByte)
     {
-        var bytesPerBlock = TextureFormats.GetBytesPerBlock(formatName);
-        var size = (width + 3) / 4 * ((height + 3) / 4) * bytesPerBlock;
-
-        int mipW = width, mipH = height;
-        for (var i = 1; i < mipCount; i++)
-        {
-            mipW = Math.Max(1, mipW / 2);
-            mipH = Math.Max(1, mipH / 2);
-            size += Math.Max(1, (mipW + 3) / 4) * Math.Max(1, (mipH + 3) / 4) * bytesPerBlock;
-        }
-
-        return size;
+        var bytesPerBlock = TextureFormats.GetGpuBytesPerBlock(formatByte);
+        return TextureFormats.CalculateMipChainSize(width, height, mipCount, bytesPerBlock);
     }
 
     private static int FindDdxBoundary(ReadOnlySpan<byte> data, int offset, int uncompressedSize)
@@ -240,44 +255,9 @@ public sealed class DdxFormat : FileFormatBase, IFileConverter
         var maxSize = Math.Min(data.Length - offset,
             Math.Min(headerSize + uncompressedSize * 2 + 512, 10 * 1024 * 1024));
 
-        for (var i = offset + minScanStart; i < offset + maxSize - 4; i++)
-        {
-            var slice = data.Slice(i, 4);
-
-            // Check for DDX signatures with validation
-            if ((slice.SequenceEqual("3XDO"u8) || slice.SequenceEqual("3XDR"u8)) && IsValidNextDdxHeader(data, i))
-            {
-                return i - offset;
-            }
-
-            // Check for RIFF with validation
-            if (slice.SequenceEqual("RIFF"u8) && SignatureBoundaryScanner.IsValidRiffHeader(data, i))
-            {
-                return i - offset;
-            }
-
-            // Check for other file signatures
-            if (slice.SequenceEqual("XEX2"u8) ||
-                slice.SequenceEqual("XUIS"u8) ||
-                slice.SequenceEqual("XUIB"u8) ||
-                slice.SequenceEqual("XDBF"u8) ||
-                slice.SequenceEqual("TES4"u8) ||
-                slice.SequenceEqual("LIPS"u8) ||
-                slice.SequenceEqual("scn "u8) ||
-                slice.SequenceEqual("DDS "u8) ||
-                SignatureBoundaryScanner.IsPngSignature(data, i))
-            {
-                return i - offset;
-            }
-
-            // Check for NIF (Gamebryo)
-            if (i + 20 <= data.Length && data.Slice(i, 20).SequenceEqual("Gamebryo File Format"u8))
-            {
-                return i - offset;
-            }
-        }
-
-        return headerSize + Math.Max(100, uncompressedSize * 7 / 10);
+        var boundary = SignatureBoundaryScanner.FindNextSignature(data, offset + minScanStart, offset + maxSize - 4,
+            BoundarySignatures);
+        return boundary >= 0 ? boundary - offset : headerSize + Math.Max(100, uncompressedSize * 7 / 10);
     }
 
     private static bool IsValidNextDdxHeader(ReadOnlySpan<byte> data, int position)
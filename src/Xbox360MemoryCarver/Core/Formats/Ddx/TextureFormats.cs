@@ -1,4 +1,5 @@
 using System.Collections.Frozen;
+using System.Diagnostics.CodeAnalysis;
 
 namespace Xbox360MemoryCarver.Core.Formats.Ddx;
 
@@ -25,6 +26,12 @@ public static class TextureFormats
         [0x88] = "DXT5"
     }.ToFrozenDictionary();
 
+    /// <summary>
+    ///     <see cref="Xbox360GpuTextureFormats" /> flattened into a table indexed by format byte (null = unknown),
+    ///     so the per-header check is an array load instead of a hash lookup.
+    /// </summary>
+    private static readonly string?[] GpuFormatNames = BuildGpuFormatNames();
+
     /// <summary>
     ///     Bytes per compression block for each format.
     /// </summary>
@@ -41,6 +48,12 @@ public static class TextureFormats
         ["BC5S"] = 16
     }.ToFrozenDictionary();
 
+    /// <summary>
+    ///     Bytes per block for each GPU format byte, resolved from its name once (0 = unknown format).
+    /// </summary>
+    private static readonly byte[] GpuBytesPerBlock =
+        [.. GpuFormatNames.Select(name => (byte)(name == null ? 0 : GetBytesPerBlock(name)))];
+
     /// <summary>
     ///     Get bytes per block for a format, defaulting to 16 if unknown.
     /// </summary>
@@ -48,4 +61,54 @@ public static class TextureFormats
     {
         return BytesPerBlock.GetValueOrDefault(fourcc, 16);
     }
+
+    /// <summary>
+    ///     Total size of a block-compressed mip chain.
+    ///     Once a level fits in a single 4x4 block every smaller level is one block too,
+    ///     so that tail is added in closed form instead of being walked level by level.
+    /// </summary>
+    public static int CalculateMipChainSize(int width, int height, int mipCount, int bytesPerBlock)
+    {
+        var size = (width + 3) / 4 * ((height + 3) / 4) * bytesPerBlock;
+
+        int level = 1, mipW = width, mipH = height;
+        for (; level < mipCount && (mipW > 4 || mipH > 4); level++)
+        {
+            mipW = Math.Max(1, mipW / 2);
+            mipH = Math.Max(1, mipH / 2);
+            size += (mipW + 3) / 4 * ((mipH + 3) / 4) * bytesPerBlock;
+        }
+
+        return size + Math.Max(0, mipCount - level) * bytesPerBlock;
+    }
+
+    /// <summary>
+    ///     Get the name of a known Xbox 360 GPU texture format.
+    /// </summary>
+    public static bool TryGetGpuFormatName(int formatByte, [NotNullWhen(true)] out string? formatName)
+    {
+        formatName = (uint)formatByte < (uint)GpuFormatNames.Length ? GpuFormatNames[formatByte] : null;
+        return formatName != null;
+    }
+
+    /// <summary>
+    ///     Get bytes per block for a known Xbox 360 GPU texture format byte, without going through its name.
+    /// </summary>
+    public static int GetGpuBytesPerBlock(int formatByte)
+    {
+        return (uint)formatByte < (uint)GpuBytesPerBlock.Length && GpuBytesPerBlock[formatByte] != 0
+            ? GpuBytesPerBlock[formatByte]
+            : 16;
+    }
+
+    private static string?[] BuildGpuFormatNames()
+    {
+        var names = new string?[256];
+        foreach (var (formatByte, name) in Xbox360GpuTextureFormats)
+        {
+            names[formatByte] = name;
+        }
+
+        return names;
+    }
 }
@@ -220,14 +220,20 @@ public static class EsmParser
         }
 
         var groupSize = ReadUInt32(data, 4, bigEndian);
+        // One copy of the label, reversed in place for big-endian files
         var label = data.Slice(8, 4).ToArray();
+        if (bigEndian)
+        {
+            label.AsSpan().Reverse();
+        }
+
         var groupType = (int)ReadUInt32(data, 12, bigEndian);
         var stamp = ReadUInt32(data, 16, bigEndian);
 
         return new GroupHeader
         {
             GroupSize = groupSize,
-            Label = bigEndian ? label.Reverse().ToArray() : label,
+            Label = label,
             GroupType = groupType,
             Stamp = stamp
         };
@@ -1,3 +1,6 @@
+using System.Globalization;
+using System.Text;
+
 namespace Xbox360MemoryCarver.Core.Formats.EsmRecord;
 
 /// <summary>
@@ -35,7 +38,7 @@ public static class EsmRecordExporter
         var edidLines = editorIds
             .OrderBy(e => e.Name)
             .Select(e => e.Name);
-        await File.WriteAllLinesAsync(edidPath, edidLines);
+        await WriteLinesAsync(edidPath, edidLines);
 
         Log.Debug($"  [ESM] Exported {editorIds.Count} editor IDs to editor_ids.txt");
     }
@@ -52,7 +55,7 @@ public static class EsmRecordExporter
             .Select(g => g.Name)
             .Distinct()
             .OrderBy(n => n);
-        await File.WriteAllLinesAsync(gmstPath, gmstLines);
+        await WriteLinesAsync(gmstPath, gmstLines);
 
         Log.Debug($"  [ESM] Exported {gameSettings.Count} game settings to game_settings.txt");
     }
@@ -85,11 +88,17 @@ public static class EsmRecordExporter
         }
 
         var formIdPath = Path.Combine(outputDir, "formid_map.csv");
-        var formIdLines = new List<string> { "FormID,EditorID" };
-        formIdLines.AddRange(formIdMap
-            .OrderBy(kv => kv.Key)
-            .Select(kv => $"0x{kv.Key:X8},{kv.Value}"));
-        await File.WriteAllLinesAsync(formIdPath, formIdLines);
+        var formIds = formIdMap.Keys.ToArray();
+        Array.Sort(formIds);
+
+        var sb = new StringBuilder();
+        sb.AppendLine("FormID,EditorID");
+        foreach (var formId in formIds)
+        {
+            sb.Append(CultureInfo.InvariantCulture, $"0x{formId:X8},").AppendLine(formIdMap[formId]);
+        }
+
+        await File.WriteAllTextAsync(formIdPath, sb.ToString());
 
         Log.Debug($"  [ESM] Exported {formIdMap.Count} FormID correlations to formid_map.csv");
     }
@@ -105,15 +114,44 @@ public static class EsmRecordExporter
         }
 
         var scroPath = Path.Combine(outputDir, "formid_references.txt");
-        var scroLines = formIdReferences
-            .OrderBy(s => s.FormId)
-            .Select(s =>
+        var formIds = new uint[formIdReferences.Count];
+        for (var i = 0; i < formIds.Length; i++)
+        {
+            formIds[i] = formIdReferences[i].FormId;
+        }
+
+        Array.Sort(formIds);
+
+        // Lines are appended straight into one buffer rather than formatted as separate strings
+        var sb = new StringBuilder();
+        foreach (var formId in formIds)
+        {
+            sb.Append(CultureInfo.InvariantCulture, $"0x{formId:X8}");
+            if (formIdMap.TryGetValue(formId, out var name))
             {
-                var name = formIdMap.TryGetValue(s.FormId, out var n) ? $" ({n})" : "";
-                return $"0x{s.FormId:X8}{name}";
-            });
-        await File.WriteAllLinesAsync(scroPath, scroLines);
+                sb.Append(" (").Append(name).Append(')');
+            }
+
+            sb.AppendLine();
+        }
+
+        await File.WriteAllTextAsync(scroPath, sb.ToString());
 
         Log.Debug($"  [ESM] Exported {formIdReferences.Count} FormID references to formid_references.txt");
     }
+
+    /// <summary>
+    ///     Write one line per item (same output as File.WriteAllLinesAsync), assembling the text in memory
+    ///     so the file is written in a single call instead of one awaited write per line.
+    /// </summary>
+    private static Task WriteLinesAsync(string path, IEnumerable<string> lines)
+    {
+        var sb = new StringBuilder();
+        foreach (var line in lines)
+        {
+            sb.AppendLine(line);
+        }
+
+        return File.WriteAllTextAsync(path, sb.ToString());
+    }
 }
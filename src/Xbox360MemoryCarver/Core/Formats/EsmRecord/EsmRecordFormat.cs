@@ -1,7 +1,7 @@
 using System.Buffers;
-using System.Globalization;
 using System.IO.MemoryMappedFiles;
 using System.Text;
+using System.Text.RegularExpressions;
 using Xbox360MemoryCarver.Core.Utils;
 
 namespace Xbox360MemoryCarver.Core.Formats.EsmRecord;
@@ -12,8 +12,19 @@ namespace Xbox360MemoryCarver.Core.Formats.EsmRecord;
 ///     This format doesn't participate in normal carving (ShowInFilterUI = false)
 ///     but provides dump analysis capabilities.
 /// </summary>
-public sealed class EsmRecordFormat : FileFormatBase, IDumpScanner
+public sealed partial class EsmRecordFormat : FileFormatBase, IDumpScanner
 {
+    /// <summary>Chunk size used when walking a dump for ESM records.</summary>
+    internal const int ScanChunkSize = 16 * 1024 * 1024;
+
+    /// <summary>Bytes of the following chunk appended to each chunk so boundary records are seen whole.</summary>
+    internal const int ScanOverlapSize = 1024;
+
+    private static readonly SearchValues<byte> RecordSignatureFirstBytes = SearchValues.Create("EGS"u8);
+
+    private static readonly SearchValues<byte> IdentifierBytes =
+        SearchValues.Create("ABCDEFGHIJKLMNOPQRSTUVWXYZabcdefghijklmnopqrstuvwxyz0123456789_"u8);
+
     public override string FormatId => "esmrecord";
     public override string DisplayName => "ESM Records";
     public override string Extension => ".esm";
@@ -43,7 +54,8 @@ public sealed class EsmRecordFormat : FileFormatBase, IDumpScanner
         var seenEdids = new HashSet<string>();
         var seenFormIds = new HashSet<uint>();
 
-        for (var i = 0; i <= data.Length - 8; i++)
+        var searchLimit = data.Length - 8;
+        for (var i = FindCandidate(data, 0, searchLimit); i >= 0; i = FindCandidate(data, i + 1, searchLimit))
         {
             if (MatchesSignature(data, i, "EDID"u8))
             {
@@ -72,58 +84,53 @@ public sealed class EsmRecordFormat : FileFormatBase, IDumpScanner
     /// </summary>
     public static EsmRecordScanResult ScanForRecordsMemoryMapped(MemoryMappedViewAccessor accessor, long fileSize)
     {
-        const int chunkSize = 16 * 1024 * 1024; // 16MB chunks
-        const int overlapSize = 1024; // Overlap to handle records at chunk boundaries
-
         var result = new EsmRecordScanResult();
         var seenEdids = new HashSet<string>();
         var seenFormIds = new HashSet<uint>();
-        var buffer = ArrayPool<byte>.Shared.Rent(chunkSize + overlapSize);
 
-        try
-        {
-            long offset = 0;
-            while (offset < fileSize)
-            {
-                var toRead = (int)Math.Min(chunkSize + overlapSize, fileSize - offset);
-                accessor.ReadArray(offset, buffer, 0, toRead);
-
-                // Determine the search limit for this chunk
-                // Only search up to chunkSize unless this is the last chunk
-                var searchLimit = offset + chunkSize >= fileSize ? toRead - 8 : chunkSize;
-
-                // Scan this chunk
-                for (var i = 0; i <= searchLimit; i++)
-                {
-                    if (MatchesSignature(buffer, i, "EDID"u8))
-                    {
-                        TryAddEdidRecordWithOffset(buffer, i, toRead, offset, result.EditorIds, seenEdids);
-                    }
-                    else if (MatchesSignature(buffer, i, "GMST"u8))
-                    {
-                        TryAddGmstRecordWithOffset(buffer, i, toRead, offset, result.GameSettings);
-                    }
-                    else if (MatchesSignature(buffer, i, "SCTX"u8))
-                    {
-                        TryAddSctxRecordWithOffset(buffer, i, toRead, offset, result.ScriptSources);
-                    }
-                    else if (MatchesSignature(buffer, i, "SCRO"u8))
-                    {
-                        TryAddScroRecordWithOffset(buffer, i, toRead, offset, result.FormIdReferences, seenFormIds);
-                    }
-                }
-
-                offset += chunkSize;
-            }
-        }
-        finally
+        // Each chunk is scanned in place in the mapping, never copied into a managed buffer
+        using var reader = new MemoryMappedSpanReader(accessor, fileSize);
+        for (long offset = 0; offset < fileSize; offset += ScanChunkSize)
         {
-            ArrayPool<byte>.Shared.Return(buffer);
+            var chunk = reader.GetSpan(offset, (int)Math.Min(ScanChunkSize + ScanOverlapSize, fileSize - offset));
+            ScanChunk(chunk, offset, ScanChunkSize, fileSize, result, seenEdids, seenFormIds);
         }
 
         return result;
     }
 
+    /// <summary>
+    ///     Scan one chunk of a dump walk into <paramref name="result" />.
+    ///     Lets other dump scans share the same chunk pass.
+    /// </summary>
+    internal static void ScanChunk(ReadOnlySpan<byte> buffer, long offset, int chunkSize, long fileSize,
+        EsmRecordScanResult result, HashSet<string> seenEdids, HashSet<uint> seenFormIds)
+    {
+        // Only search up to the chunk size unless this is the last chunk
+        var toRead = buffer.Length;
+        var searchLimit = offset + chunkSize >= fileSize ? toRead - 8 : chunkSize;
+
+        for (var i = FindCandidate(buffer, 0, searchLimit); i >= 0; i = FindCandidate(buffer, i + 1, searchLimit))
+        {
+            if (MatchesSignature(buffer, i, "EDID"u8))
+            {
+                TryAddEdidRecordWithOffset(buffer, i, toRead, offset, result.EditorIds, seenEdids);
+            }
+            else if (MatchesSignature(buffer, i, "GMST"u8))
+            {
+                TryAddGmstRecordWithOffset(buffer, i, toRead, offset, result.GameSettings);
+            }
+            else if (MatchesSignature(buffer, i, "SCTX"u8))
+            {
+                TryAddSctxRecordWithOffset(buffer, i, toRead, offset, result.ScriptSources);
+            }
+            else if (MatchesSignature(buffer, i, "SCRO"u8))
+            {
+                TryAddScroRecordWithOffset(buffer, i, toRead, offset, result.FormIdReferences, seenFormIds);
+            }
+        }
+    }
+
     public static Dictionary<uint, string> CorrelateFormIdsToNames(byte[] data,
         EsmRecordScanResult? existingScan = null)
     {
@@ -150,40 +157,29 @@ public sealed class EsmRecordFormat : FileFormatBase, IDumpScanner
         long fileSize,
         EsmRecordScanResult existingScan)
     {
-        // fileSize parameter kept for API consistency, not needed for correlation
-        _ = fileSize;
-
         var correlations = new Dictionary<uint, string>();
-        var buffer = ArrayPool<byte>.Shared.Rent(256); // Small buffer for searching backward
+        using var reader = new MemoryMappedSpanReader(accessor, fileSize);
 
-        try
+        foreach (var edid in existingScan.EditorIds)
         {
-            foreach (var edid in existingScan.EditorIds)
-            {
-                var edidOffset = edid.Offset;
-                var searchStart = Math.Max(0, edidOffset - 200);
-                var toRead = (int)Math.Min(256, edidOffset - searchStart + 50);
+            // Search backward from the EDID for its record header, reading the window in place
+            var edidOffset = edid.Offset;
+            var searchStart = Math.Max(0, edidOffset - 200);
+            var toRead = (int)Math.Min(Math.Min(256, edidOffset - searchStart + 50), fileSize - searchStart);
 
-                if (toRead <= 0)
-                {
-                    continue;
-                }
-
-                accessor.ReadArray(searchStart, buffer, 0, toRead);
+            if (toRead <= 0)
+            {
+                continue;
+            }
 
-                var localEdidOffset = (int)(edidOffset - searchStart);
-                var formId = FindRecordFormIdInBuffer(buffer, localEdidOffset, toRead);
+            var window = reader.GetSpan(searchStart, toRead);
+            var formId = FindRecordFormIdInBuffer(window, (int)(edidOffset - searchStart), toRead);
 
-                if (formId != 0 && !correlations.ContainsKey(formId))
-                {
-                    correlations[formId] = edid.Name;
-                }
+            if (formId != 0 && !correlations.ContainsKey(formId))
+            {
+                correlations[formId] = edid.Name;
             }
         }
-        finally
-        {
-            ArrayPool<byte>.Shared.Return(buffer);
-        }
 
         return correlations;
     }
@@ -203,12 +199,27 @@ public sealed class EsmRecordFormat : FileFormatBase, IDumpScanner
 
     #region Private Implementation
 
-    private static bool MatchesSignature(byte[] data, int i, ReadOnlySpan<byte> sig)
+    /// <summary>
+    ///     Position of the next byte in [start, searchLimit] that can begin EDID/GMST/SCTX/SCRO, or -1.
+    ///     The vectorized IndexOfAny skips runs of unrelated bytes instead of testing each position.
+    /// </summary>
+    private static int FindCandidate(ReadOnlySpan<byte> data, int start, int searchLimit)
+    {
+        if (start > searchLimit)
+        {
+            return -1;
+        }
+
+        var index = data.Slice(start, searchLimit - start + 1).IndexOfAny(RecordSignatureFirstBytes);
+        return index < 0 ? -1 : start + index;
+    }
+
+    private static bool MatchesSignature(ReadOnlySpan<byte> data, int i, ReadOnlySpan<byte> sig)
     {
         return data[i] == sig[0] && data[i + 1] == sig[1] && data[i + 2] == sig[2] && data[i + 3] == sig[3];
     }
 
-    private static void TryAddEdidRecord(byte[] data, int i, int dataLength, List<EdidRecord> records,
+    private static void TryAddEdidRecord(ReadOnlySpan<byte> data, int i, int dataLength, List<EdidRecord> records,
         HashSet<string> seen)
     {
         if (i + 6 > dataLength)
@@ -222,14 +233,20 @@ public sealed class EsmRecordFormat : FileFormatBase, IDumpScanner
             return;
         }
 
-        var name = ReadNullTermString(data, i + 6, len);
-        if (IsValidEditorId(name) && seen.Add(name))
+        var nameBytes = ReadNullTermBytes(data, i + 6, len);
+        if (!IsValidEditorId(nameBytes))
+        {
+            return;
+        }
+
+        var name = Encoding.ASCII.GetString(nameBytes);
+        if (seen.Add(name))
         {
             records.Add(new EdidRecord(name, i));
         }
     }
 
-    private static void TryAddEdidRecordWithOffset(byte[] data, int i, int dataLength, long baseOffset,
+    private static void TryAddEdidRecordWithOffset(ReadOnlySpan<byte> data, int i, int dataLength, long baseOffset,
         List<EdidRecord> records, HashSet<string> seen)
     {
         if (i + 6 > dataLength)
@@ -243,14 +260,20 @@ public sealed class EsmRecordFormat : FileFormatBase, IDumpScanner
             return;
         }
 
-        var name = ReadNullTermString(data, i + 6, len);
-        if (IsValidEditorId(name) && seen.Add(name))
+        var nameBytes = ReadNullTermBytes(data, i + 6, len);
+        if (!IsValidEditorId(nameBytes))
+        {
+            return;
+        }
+
+        var name = Encoding.ASCII.GetString(nameBytes);
+        if (seen.Add(name))
         {
             records.Add(new EdidRecord(name, baseOffset + i));
         }
     }
 
-    private static void TryAddGmstRecord(byte[] data, int i, int dataLength, List<GmstRecord> records)
+    private static void TryAddGmstRecord(ReadOnlySpan<byte> data, int i, int dataLength, List<GmstRecord> records)
     {
         if (i + 6 > dataLength)
         {
@@ -263,14 +286,15 @@ public sealed class EsmRecordFormat : FileFormatBase, IDumpScanner
             return;
         }
 
-        var name = ReadNullTermString(data, i + 6, len);
-        if (IsValidSettingName(name))
+        var nameBytes = ReadNullTermBytes(data, i + 6, len);
+        if (IsValidSettingName(nameBytes))
         {
+            var name = Encoding.ASCII.GetString(nameBytes);
             records.Add(new GmstRecord(name, i, len));
         }
     }
 
-    private static void TryAddGmstRecordWithOffset(byte[] data, int i, int dataLength, long baseOffset,
+    private static void TryAddGmstRecordWithOffset(ReadOnlySpan<byte> data, int i, int dataLength, long baseOffset,
         List<GmstRecord> records)
     {
         if (i + 6 > dataLength)
@@ -284,14 +308,15 @@ public sealed class EsmRecordFormat : FileFormatBase, IDumpScanner
             return;
         }
 
-        var name = ReadNullTermString(data, i + 6, len);
-        if (IsValidSettingName(name))
+        var nameBytes = ReadNullTermBytes(data, i + 6, len);
+        if (IsValidSettingName(nameBytes))
         {
+            var name = Encoding.ASCII.GetString(nameBytes);
             records.Add(new GmstRecord(name, baseOffset + i, len));
         }
     }
 
-    private static void TryAddSctxRecord(byte[] data, int i, int dataLength, List<SctxRecord> records)
+    private static void TryAddSctxRecord(ReadOnlySpan<byte> data, int i, int dataLength, List<SctxRecord> records)
     {
         if (i + 6 > dataLength)
         {
@@ -304,14 +329,14 @@ public sealed class EsmRecordFormat : FileFormatBase, IDumpScanner
             return;
         }
 
-        var text = Encoding.ASCII.GetString(data, i + 6, len).TrimEnd('\0');
+        var text = Encoding.ASCII.GetString(data.Slice(i + 6, len)).TrimEnd('\0');
         if (text.Length > 5 && ContainsScriptKeywords(text))
         {
             records.Add(new SctxRecord(text, i, len));
         }
     }
 
-    private static void TryAddSctxRecordWithOffset(byte[] data, int i, int dataLength, long baseOffset,
+    private static void TryAddSctxRecordWithOffset(ReadOnlySpan<byte> data, int i, int dataLength, long baseOffset,
         List<SctxRecord> records)
     {
         if (i + 6 > dataLength)
@@ -325,14 +350,14 @@ public sealed class EsmRecordFormat : FileFormatBase, IDumpScanner
             return;
         }
 
-        var text = Encoding.ASCII.GetString(data, i + 6, len).TrimEnd('\0');
+        var text = Encoding.ASCII.GetString(data.Slice(i + 6, len)).TrimEnd('\0');
         if (text.Length > 5 && ContainsScriptKeywords(text))
         {
             records.Add(new SctxRecord(text, baseOffset + i, len));
         }
     }
 
-    private static void TryAddScroRecord(byte[] data, int i, int dataLength, List<ScroRecord> records,
+    private static void TryAddScroRecord(ReadOnlySpan<byte> data, int i, int dataLength, List<ScroRecord> records,
         HashSet<uint> seen)
     {
         if (i + 10 > dataLength)
@@ -358,7 +383,7 @@ public sealed class EsmRecordFormat : FileFormatBase, IDumpScanner
         }
     }
 
-    private static void TryAddScroRecordWithOffset(byte[] data, int i, int dataLength, long baseOffset,
+    private static void TryAddScroRecordWithOffset(ReadOnlySpan<byte> data, int i, int dataLength, long baseOffset,
         List<ScroRecord> records, HashSet<uint> seen)
     {
         if (i + 10 > dataLength)
@@ -399,7 +424,7 @@ public sealed class EsmRecordFormat : FileFormatBase, IDumpScanner
         return 0;
     }
 
-    private static uint FindRecordFormIdInBuffer(byte[] data, int edidLocalOffset, int dataLength)
+    private static uint FindRecordFormIdInBuffer(ReadOnlySpan<byte> data, int edidLocalOffset, int dataLength)
     {
         var searchStart = Math.Max(0, edidLocalOffset - 200);
         for (var checkOffset = edidLocalOffset - 4; checkOffset >= searchStart; checkOffset--)
@@ -414,7 +439,7 @@ public sealed class EsmRecordFormat : FileFormatBase, IDumpScanner
         return 0;
     }
 
-    private static uint TryExtractFormIdFromRecordHeader(byte[] data, int checkOffset, int edidOffset, int dataLength)
+    private static uint TryExtractFormIdFromRecordHeader(ReadOnlySpan<byte> data, int checkOffset, int edidOffset, int dataLength)
     {
         if (checkOffset + 24 >= dataLength)
         {
@@ -441,7 +466,7 @@ public sealed class EsmRecordFormat : FileFormatBase, IDumpScanner
         return 0;
     }
 
-    private static bool IsRecordTypeMarker(byte[] data, int offset)
+    private static bool IsRecordTypeMarker(ReadOnlySpan<byte> data, int offset)
     {
         for (var b = 0; b < 4; b++)
         {
@@ -454,77 +479,66 @@ public sealed class EsmRecordFormat : FileFormatBase, IDumpScanner
         return true;
     }
 
-    private static string ReadNullTermString(byte[] data, int offset, int maxLen)
+    private static ReadOnlySpan<byte> ReadNullTermBytes(ReadOnlySpan<byte> data, int offset, int maxLen)
     {
-        var end = offset;
-        while (end < offset + maxLen && end < data.Length && data[end] != 0)
-        {
-            end++;
-        }
-
-        return Encoding.ASCII.GetString(data, offset, end - offset);
+        // Vectorized search for the terminator instead of stepping byte by byte
+        var field = data.Slice(offset, Math.Min(maxLen, data.Length - offset));
+        var end = field.IndexOf((byte)0);
+        return end < 0 ? field : field[..end];
     }
 
-    private static bool IsValidEditorId(string name)
+    /// <summary>
+    ///     Editor IDs start with a letter and are at least 90% [A-Za-z0-9_]. Checked on the raw bytes,
+    ///     so rejected candidates are never decoded.
+    /// </summary>
+    private static bool IsValidEditorId(ReadOnlySpan<byte> name)
     {
-        if (string.IsNullOrEmpty(name) || name.Length < 2 || name.Length > 200)
+        if (name.Length < 2 || name.Length > 200 || !char.IsAsciiLetter((char)name[0]))
         {
             return false;
         }
 
-        if (!char.IsLetter(name[0]))
+        // Invalid bytes are rare in real IDs, so count them by jumping between them
+        var invalidCount = 0;
+        var rest = name;
+        int next;
+        while ((next = rest.IndexOfAnyExcept(IdentifierBytes)) >= 0)
         {
-            return false;
+            invalidCount++;
+            rest = rest[(next + 1)..];
         }
 
-        // Direct iteration instead of LINQ Count to avoid delegate allocation
-        var validChars = 0;
-        foreach (var c in name)
-        {
-            if (char.IsLetterOrDigit(c) || c == '_')
-            {
-                validChars++;
-            }
-        }
-
-        return validChars >= name.Length * 0.9;
+        return name.Length - invalidCount >= name.Length * 0.9;
     }
 
-    private static bool IsValidSettingName(string name)
+    private static bool IsValidSettingName(ReadOnlySpan<byte> name)
     {
-        if (string.IsNullOrEmpty(name) || name.Length < 2)
+        if (name.Length < 2)
         {
             return false;
         }
 
-        var firstChar = char.ToLower(name[0], CultureInfo.InvariantCulture);
-        if (firstChar is not ('f' or 'i' or 's' or 'b'))
+        if (name[0] is not ((byte)'f' or (byte)'i' or (byte)'s' or (byte)'b' or
+            (byte)'F' or (byte)'I' or (byte)'S' or (byte)'B'))
         {
             return false;
         }
 
-        foreach (var c in name)
-        {
-            if (!char.IsLetterOrDigit(c) && c != '_')
-            {
-                return false;
-            }
-        }
-
-        return true;
+        return name.IndexOfAnyExcept(IdentifierBytes) < 0;
     }
 
     private static bool ContainsScriptKeywords(string text)
     {
-        return text.Contains("Enable", StringComparison.OrdinalIgnoreCase) ||
-               text.Contains("Disable", StringComparison.OrdinalIgnoreCase) ||
-               text.Contains("MoveTo", StringComparison.OrdinalIgnoreCase) ||
-               text.Contains("SetStage", StringComparison.OrdinalIgnoreCase) ||
-               text.Contains("GetStage", StringComparison.OrdinalIgnoreCase) ||
-               text.Contains("if ", StringComparison.OrdinalIgnoreCase) ||
-               text.Contains("endif", StringComparison.OrdinalIgnoreCase) ||
-               text.Contains("REF", StringComparison.OrdinalIgnoreCase);
+        return ScriptKeywordPattern().IsMatch(text);
     }
 
+    /// <summary>
+    ///     Keywords that mark SCTX text as script source, matched in one pass over the text
+    ///     instead of a separate case-insensitive search per keyword.
+    /// </summary>
+    [GeneratedRegex("Enable|Disable|MoveTo|SetStage|GetStage|if |endif|REF",
+        RegexOptions.IgnoreCase | RegexOptions.CultureInvariant)]
+    private static partial Regex ScriptKeywordPattern();
+
     #endregion
 }
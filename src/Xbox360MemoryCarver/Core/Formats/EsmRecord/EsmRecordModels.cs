@@ -40,22 +40,25 @@ public record EsmFileScanResult
     public Dictionary<RecordCategory, int> RecordsByCategory { get; init; } = [];
 }
 
+// The fragment records below are value types: a dump scan can produce hundreds of thousands of them,
+// and the scan lists then hold them inline instead of as one heap object each.
+
 /// <summary>
 ///     Game Setting (GMST) record.
 /// </summary>
-public record GmstRecord(string Name, long Offset, int Length);
+public readonly record struct GmstRecord(string Name, long Offset, int Length);
 
 /// <summary>
 ///     Editor ID (EDID) record.
 /// </summary>
-public record EdidRecord(string Name, long Offset);
+public readonly record struct EdidRecord(string Name, long Offset);
 
 /// <summary>
 ///     Script Source Text (SCTX) record.
 /// </summary>
-public record SctxRecord(string Text, long Offset, int Length);
+public readonly record struct SctxRecord(string Text, long Offset, int Length);
 
 /// <summary>
 ///     Script Object Reference (SCRO) record.
 /// </summary>
-public record ScroRecord(uint FormId, long Offset);
+public readonly record struct ScroRecord(uint FormId, long Offset);
@@ -7,6 +7,24 @@ namespace Xbox360MemoryCarver.Core.Formats.Esp;
 /// </summary>
 public sealed class EspFormat : FileFormatBase
 {
+    /// <summary>
+    ///     Signatures that end a plugin; another TES4 (a new plugin file) must also have a plausible size.
+    /// </summary>
+    private static readonly SignatureBoundaryScanner.SignatureTable BoundarySignatures =
+        SignatureBoundaryScanner.CreateSignatureTable(
+            ("TES4"u8.ToArray(), IsValidNextTes4Header),
+            ("3XDO"u8.ToArray(), null),
+            ("3XDR"u8.ToArray(), null),
+            ("RIFF"u8.ToArray(), null),
+            ("XEX2"u8.ToArray(), null),
+            ("XUIS"u8.ToArray(), null),
+            ("XUIB"u8.ToArray(), null),
+            ("XDBF"u8.ToArray(), null),
+            ("LIPS"u8.ToArray(), null),
+            ("DDS "u8.ToArray(), null),
+            ([0x89, (byte)'P', (byte)'N', (byte)'G'], null),
+            ("Gamebryo File Format"u8.ToArray(), null));
+
     public override string FormatId => "esp";
     public override string DisplayName => "ESP";
     public override string Extension => ".esp";
@@ -119,44 +137,25 @@ public sealed class EspFormat : FileFormatBase
         var maxScan = Math.Min(data.Length - offset, 50 * 1024 * 1024);
 
         // Look for another TES4 (new plugin file) or other file signatures
-        for (var i = scanStart; i < offset + maxScan - 4; i++)
+        var boundary =
+            SignatureBoundaryScanner.FindNextSignature(data, scanStart, offset + maxScan - 4, BoundarySignatures);
+        if (boundary >= 0)
         {
-            var slice = data.Slice(i, 4);
-
-            // Another TES4 would indicate a new plugin file
-            if (slice.SequenceEqual("TES4"u8) && i + 24 <= data.Length)
-            {
-                // Validate it looks like a real TES4 header
-                var nextDataSize = BinaryUtils.ReadUInt32LE(data, i + 4);
-                if (nextDataSize is > 0 and < 500 * 1024 * 1024)
-                {
-                    return i - offset;
-                }
-            }
-
-            // Check for other known file signatures
-            if (slice.SequenceEqual("3XDO"u8) ||
-                slice.SequenceEqual("3XDR"u8) ||
-                slice.SequenceEqual("RIFF"u8) ||
-                slice.SequenceEqual("XEX2"u8) ||
-                slice.SequenceEqual("XUIS"u8) ||
-                slice.SequenceEqual("XUIB"u8) ||
-                slice.SequenceEqual("XDBF"u8) ||
-                slice.SequenceEqual("LIPS"u8) ||
-                slice.SequenceEqual("DDS "u8) ||
-                SignatureBoundaryScanner.IsPngSignature(data, i))
-            {
-                return i - offset;
-            }
-
-            // Check for NIF
-            if (i + 20 <= data.Length && data.Slice(i, 20).SequenceEqual("Gamebryo File Format"u8))
-            {
-                return i - offset;
-            }
+            return boundary - offset;
         }
 
         // No boundary found, use header data size or cap at available data
         return Math.Min(headerDataSize, maxScan);
     }
+
+    private static bool IsValidNextTes4Header(ReadOnlySpan<byte> data, int position)
+    {
+        if (position + 24 > data.Length)
+        {
+            return false;
+        }
+
+        var nextDataSize = BinaryUtils.ReadUInt32LE(data, position + 4);
+        return nextDataSize is > 0 and < 500 * 1024 * 1024;
+    }
 }
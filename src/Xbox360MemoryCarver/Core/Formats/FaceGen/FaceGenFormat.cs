@@ -129,23 +129,18 @@ public sealed class FaceGenFormat : FileFormatBase
             return (null, null);
         }
 
-        var magic5 = data.Slice(offset, 5);
-
-        if (magic5.SequenceEqual("FREGM"u8))
-        {
-            return ("EGM", ".egm");
-        }
-
-        if (magic5.SequenceEqual("FREGT"u8))
+        // Every FaceGen magic starts with 'F'; the next four bytes select the type in one switch
+        if (data[offset] != (byte)'F')
         {
-            return ("EGT", ".egt");
+            return (null, null);
         }
 
-        if (magic5.SequenceEqual("FRTRI"u8))
+        return BinaryUtils.ReadUInt32BE(data, offset + 1) switch
         {
-            return ("TRI", ".tri");
-        }
-
-        return (null, null);
+            0x5245474D => ("EGM", ".egm"), // "REGM"
+            0x52454754 => ("EGT", ".egt"), // "REGT"
+            0x52545249 => ("TRI", ".tri"), // "RTRI"
+            _ => (null, null)
+        };
     }
 }
@@ -35,12 +35,21 @@ public static class FormatRegistry
     private static readonly Lazy<FrozenDictionary<string, IFileFormat>> FormatsBySignatureIdLazy =
         new(BuildFormatsBySignatureId);
 
+    private static readonly Lazy<FrozenDictionary<string, FormatSignature>> SignaturesByIdLazy =
+        new(BuildSignaturesById);
+
     private static readonly Lazy<FrozenDictionary<string, IFileFormat>> FormatsByExtensionLazy =
         new(BuildFormatsByExtension);
 
     private static readonly Lazy<FrozenDictionary<FileCategory, uint>> CategoryColorsLazy =
         new(BuildCategoryColors);
 
+    private static readonly Lazy<FrozenSet<string>> ScannableSignatureIdsLazy =
+        new(() => FormatsLazy.Value
+            .Where(f => f.EnableSignatureScanning)
+            .SelectMany(f => f.Signatures.Select(s => s.Id))
+            .ToFrozenSet(StringComparer.OrdinalIgnoreCase));
+
     /// <summary>
     ///     All registered file format modules.
     /// </summary>
@@ -56,6 +65,11 @@ public static class FormatRegistry
     /// </summary>
     public static FrozenDictionary<string, IFileFormat> BySignatureId => FormatsBySignatureIdLazy.Value;
 
+    /// <summary>
+    ///     Signature definitions keyed by SignatureId.
+    /// </summary>
+    public static FrozenDictionary<string, FormatSignature> SignaturesById => SignaturesByIdLazy.Value;
+
     /// <summary>
     ///     Formats keyed by file extension (e.g., ".ddx", ".xma", ".nif").
     /// </summary>
@@ -66,6 +80,20 @@ public static class FormatRegistry
     /// </summary>
     public static FrozenDictionary<FileCategory, uint> CategoryColors => CategoryColorsLazy.Value;
 
+    /// <summary>
+    ///     Signature IDs of every format with signature scanning enabled (the default carve set).
+    /// </summary>
+    public static FrozenSet<string> ScannableSignatureIds => ScannableSignatureIdsLazy.Value;
+
+    /// <summary>
+    ///     Format IDs of every format with signature scanning enabled, sorted for display.
+    /// </summary>
+    public static IReadOnlyList<string> ScannableFormatIds { get; } = FormatsLazy.Value
+        .Where(f => f.EnableSignatureScanning)
+        .Select(f => f.FormatId)
+        .Order(StringComparer.OrdinalIgnoreCase)
+        .ToArray();
+
     /// <summary>
     ///     Display names for UI filter checkboxes.
     /// </summary>
@@ -90,6 +118,14 @@ public static class FormatRegistry
         return BySignatureId.GetValueOrDefault(signatureId);
     }
 
+    /// <summary>
+    ///     Get the signature definition for a signature ID.
+    /// </summary>
+    public static FormatSignature? GetSignature(string signatureId)
+    {
+        return SignaturesById.GetValueOrDefault(signatureId);
+    }
+
     /// <summary>
     ///     Get a format by file extension.
     /// </summary>
@@ -308,6 +344,22 @@ public static class FormatRegistry
         return dict.ToFrozenDictionary(StringComparer.OrdinalIgnoreCase);
     }
 
+    private static FrozenDictionary<string, FormatSignature> BuildSignaturesById()
+    {
+        var dict = new Dictionary<string, FormatSignature>(StringComparer.OrdinalIgnoreCase);
+
+        foreach (var format in FormatsLazy.Value)
+        {
+            // Ids differing only in case (script_scn / script_Scn) resolve to the first definition
+            foreach (var sig in format.Signatures)
+            {
+                dict.TryAdd(sig.Id, sig);
+            }
+        }
+
+        return dict.ToFrozenDictionary(StringComparer.OrdinalIgnoreCase);
+    }
+
     private static FrozenDictionary<string, IFileFormat> BuildFormatsByExtension()
     {
         var dict = new Dictionary<string, IFileFormat>(StringComparer.OrdinalIgnoreCase);
@@ -73,6 +73,16 @@ public sealed class ParseResult
     /// </summary>
     public string? ExtensionOverride { get; init; }
 
+    /// <summary>
+    ///     Optional filesystem-safe name (without extension) to carve the file under instead of its offset.
+    /// </summary>
+    public string? SafeName { get; init; }
+
+    /// <summary>
+    ///     Optional original in-game path (e.g., DDX texture path or XMA embedded path), recorded in the manifest.
+    /// </summary>
+    public string? OriginalPath { get; init; }
+
     /// <summary>
     ///     Additional metadata (dimensions, format details, flags, etc.).
     /// </summary>
@@ -1,3 +1,7 @@
+using System.Buffers;
+using System.Buffers.Binary;
+using System.Collections.Frozen;
+using System.Runtime.InteropServices;
 using System.Text;
 using System.Text.RegularExpressions;
 using Xbox360MemoryCarver.Core.Utils;
@@ -39,22 +43,28 @@ namespace Xbox360MemoryCarver.Core.Formats.Nif;
 public sealed partial class NifFormat : FileFormatBase, IFileConverter
 {
     // Block type names that indicate geometry meshes
-    private static readonly HashSet<string> GeometryBlockTypes = new(StringComparer.OrdinalIgnoreCase)
-    {
+    private static readonly string[] GeometryBlockTypes =
+    [
         "BSFadeNode", "NiNode", "NiTriStrips", "NiTriStripsData", "NiTriShape", "NiTriShapeData",
         "bhkRigidBody", "bhkCollisionObject", "bhkCompressedMeshShape", "bhkMoppBvTreeShape",
         "BSShaderPPLightingProperty", "BSShaderTextureSet", "NiMaterialProperty",
         "BSPackedAdditionalGeometryData", "NiSkinInstance", "NiSkinData", "NiSkinPartition"
-    };
+    ];
 
     // Block type names that indicate animation controllers
-    private static readonly HashSet<string> AnimationBlockTypes = new(StringComparer.OrdinalIgnoreCase)
-    {
+    private static readonly string[] AnimationBlockTypes =
+    [
         "NiControllerSequence", "NiTransformInterpolator", "NiTransformData",
         "NiBSplineCompTransformInterpolator", "NiBSplineData", "NiBSplineBasisData",
         "NiTextKeyExtraData", "NiStringPalette", "NiControllerManager",
         "NiMultiTargetTransformController", "NiBlendTransformInterpolator"
-    };
+    ];
+
+    // Both tables folded into one lookup so classification is a single probe per block type
+    private static readonly FrozenDictionary<string, NifContentKind> BlockTypeKinds = GeometryBlockTypes
+        .Select(bt => KeyValuePair.Create(bt, NifContentKind.Geometry))
+        .Concat(AnimationBlockTypes.Select(bt => KeyValuePair.Create(bt, NifContentKind.Animation)))
+        .ToFrozenDictionary(StringComparer.OrdinalIgnoreCase);
 
     public override string FormatId => "nif";
     public override string DisplayName => "NIF";
@@ -174,15 +184,10 @@ public sealed partial class NifFormat : FileFormatBase, IFileConverter
 
     private static int FindNewlinePosition(ReadOnlySpan<byte> data, int start)
     {
-        for (var i = start; i < Math.Min(start + 20, data.Length); i++)
-        {
-            if (data[i] == 0x0A)
-            {
-                return i;
-            }
-        }
-
-        return -1;
+        // Bounded vectorized search; the version string is at most 20 bytes
+        var window = data.Slice(start, Math.Min(20, data.Length - start));
+        var index = window.IndexOf((byte)0x0A);
+        return index < 0 ? -1 : start + index;
     }
 
     private static int ExtractMajorVersion(string versionString)
@@ -203,18 +208,37 @@ public sealed partial class NifFormat : FileFormatBase, IFileConverter
     private static (string contentType, string outputFolder, string? extension) ClassifyNifContent(
         List<string> blockTypes)
     {
-        var hasGeometry = blockTypes.Any(bt => GeometryBlockTypes.Contains(bt));
-        var hasAnimation = blockTypes.Any(bt => AnimationBlockTypes.Contains(bt));
+        var kinds = NifContentKind.None;
+        foreach (var blockType in blockTypes)
+        {
+            if (BlockTypeKinds.TryGetValue(blockType, out var kind))
+            {
+                kinds |= kind;
+                if (kinds == NifContentKind.Mixed)
+                {
+                    break;
+                }
+            }
+        }
 
-        return (hasGeometry, hasAnimation) switch
+        return kinds switch
         {
-            (true, false) => ("geometry", "meshes", null), // Geometry only
-            (false, true) => ("animation", "anims", ".kf"), // Animation only (.kf extension)
-            (true, true) => ("mixed", "meshes", null), // Mixed content - prefer meshes
+            NifContentKind.Geometry => ("geometry", "meshes", null), // Geometry only
+            NifContentKind.Animation => ("animation", "anims", ".kf"), // Animation only (.kf extension)
+            NifContentKind.Mixed => ("mixed", "meshes", null), // Mixed content - prefer meshes
             _ => ("unknown", "models", null) // Fallback for unknown content
         };
     }
 
+    [Flags]
+    private enum NifContentKind
+    {
+        None = 0,
+        Geometry = 1,
+        Animation = 2,
+        Mixed = Geometry | Animation
+    }
+
     /// <summary>
     ///     Parse the NIF header to calculate accurate file size and extract block type names.
     ///     Returns NifHeaderInfo with size=-1 if the file is not a valid NIF.
@@ -512,6 +536,8 @@ public sealed partial class NifFormat : FileFormatBase, IFileConverter
 
     /// <summary>
     ///     Read block sizes and calculate total.
+    ///     The table is reinterpreted as a uint span (byte-swapped in one pass when it is not in host order),
+    ///     so the size limit is checked with a single vectorized range search instead of per-block reads.
     /// </summary>
     private static bool TryReadBlockSizes(
         ReadOnlySpan<byte> data,
@@ -520,27 +546,47 @@ public sealed partial class NifFormat : FileFormatBase, IFileConverter
         uint numBlocks,
         out long totalBlockSize)
     {
+        const uint maxBlockSize = 50 * 1024 * 1024;
+
         totalBlockSize = 0;
         if (pos + numBlocks * 4 > data.Length)
         {
             return false;
         }
 
-        for (var i = 0; i < numBlocks; i++)
+        var tableSize = (int)numBlocks * 4;
+        var blockSizes = MemoryMarshal.Cast<byte, uint>(data.Slice(pos, tableSize));
+        uint[]? swapped = null;
+
+        try
         {
-            var blockSize = isBigEndian
-                ? BinaryUtils.ReadUInt32BE(data, pos)
-                : BinaryUtils.ReadUInt32LE(data, pos);
-            pos += 4;
+            if (isBigEndian == BitConverter.IsLittleEndian)
+            {
+                swapped = ArrayPool<uint>.Shared.Rent(blockSizes.Length);
+                var destination = swapped.AsSpan(0, blockSizes.Length);
+                BinaryPrimitives.ReverseEndianness(blockSizes, destination);
+                blockSizes = destination;
+            }
 
-            if (blockSize > 50 * 1024 * 1024)
+            if (blockSizes.IndexOfAnyInRange(maxBlockSize + 1, uint.MaxValue) >= 0)
             {
                 return false;
             }
 
-            totalBlockSize += blockSize;
+            foreach (var blockSize in blockSizes)
+            {
+                totalBlockSize += blockSize;
+            }
+        }
+        finally
+        {
+            if (swapped != null)
+            {
+                ArrayPool<uint>.Shared.Return(swapped);
+            }
         }
 
+        pos += tableSize;
         return true;
     }
 
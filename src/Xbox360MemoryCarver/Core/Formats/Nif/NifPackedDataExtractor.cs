@@ -622,7 +622,7 @@ internal static class NifPackedDataExtractor
         var e = exp - 15 + 127;
         var m = mant << 13;
         var bits = (sign << 31) | (e << 23) | m;
-        return BitConverter.ToSingle(BitConverter.GetBytes(bits), 0);
+        return BitConverter.Int32BitsToSingle(bits);
     }
 
     private sealed record CategorizedStreams(
@@ -1,3 +1,6 @@
+using System.Buffers;
+using System.Buffers.Binary;
+
 namespace Xbox360MemoryCarver.Core.Formats.Png;
 
 /// <summary>
@@ -5,8 +8,20 @@ namespace Xbox360MemoryCarver.Core.Formats.Png;
 /// </summary>
 public sealed class PngFormat : FileFormatBase
 {
-    private static readonly byte[] PngMagic = [0x89, 0x50, 0x4E, 0x47, 0x0D, 0x0A, 0x1A, 0x0A];
-    private static readonly byte[] IendMagic = "IEND"u8.ToArray();
+    /// <summary>The 8-byte PNG signature read as one big-endian integer.</summary>
+    private const ulong PngMagic = 0x89504E470D0A1A0A;
+
+    /// <summary>"IHDR" read as a big-endian chunk type.</summary>
+    private const uint IhdrChunkType = 0x49484452;
+
+    /// <summary>"IEND" read as a big-endian chunk type.</summary>
+    private const uint IendChunkType = 0x49454E44;
+
+    private const int MaxScanSize = 50 * 1024 * 1024;
+
+    /// <summary>PNG chunk types are four ASCII letters.</summary>
+    private static readonly SearchValues<byte> ChunkTypeBytes =
+        SearchValues.Create("ABCDEFGHIJKLMNOPQRSTUVWXYZabcdefghijklmnopqrstuvwxyz"u8);
 
     public override string FormatId => "png";
     public override string DisplayName => "PNG";
@@ -33,51 +48,43 @@ public sealed class PngFormat : FileFormatBase
             return null;
         }
 
-        if (!data.Slice(offset, 8).SequenceEqual(PngMagic))
+        if (BinaryPrimitives.ReadUInt64BigEndian(data[offset..]) != PngMagic)
         {
             return null;
         }
 
-        try
+        // Read dimensions from the IHDR chunk (at offset 8, inside the length checked above) in one place,
+        // only when the first chunk really is IHDR
+        var width = 0;
+        var height = 0;
+        if (BinaryPrimitives.ReadUInt32BigEndian(data[(offset + 12)..]) == IhdrChunkType)
         {
-            // Find IEND chunk to determine file size
-            var size = FindIendChunk(data, offset);
-            if (size <= 0)
-            {
-                return null;
-            }
-
-            // Try to extract dimensions from IHDR chunk (at offset 8)
-            var width = 0;
-            var height = 0;
-            if (data.Length >= offset + 24)
-            {
-                // IHDR chunk: 4 bytes length, 4 bytes "IHDR", then width/height as big-endian uint32
-                var ihdrData = data.Slice(offset + 16, 8);
-                width = (ihdrData[0] << 24) | (ihdrData[1] << 16) | (ihdrData[2] << 8) | ihdrData[3];
-                height = (ihdrData[4] << 24) | (ihdrData[5] << 16) | (ihdrData[6] << 8) | ihdrData[7];
-            }
-
-            var metadata = new Dictionary<string, object>();
-            if (width > 0 && height > 0)
-            {
-                metadata["width"] = width;
-                metadata["height"] = height;
-                metadata["dimensions"] = $"{width}x{height}";
-            }
-
-            return new ParseResult
-            {
-                Format = "PNG",
-                EstimatedSize = size,
-                Metadata = metadata
-            };
+            // IHDR chunk: 4 bytes length, 4 bytes "IHDR", then width/height as big-endian uint32
+            width = BinaryPrimitives.ReadInt32BigEndian(data[(offset + 16)..]);
+            height = BinaryPrimitives.ReadInt32BigEndian(data[(offset + 20)..]);
         }
-        catch (Exception ex)
+
+        // Find IEND chunk to determine file size
+        var size = FindIendChunk(data, offset);
+        if (size <= 0)
         {
-            Console.WriteLine($"[PngFormat] Exception at offset {offset}: {ex.GetType().Name}: {ex.Message}");
             return null;
         }
+
+        var metadata = new Dictionary<string, object>();
+        if (width > 0 && height > 0)
+        {
+            metadata["width"] = width;
+            metadata["height"] = height;
+            metadata["dimensions"] = $"{width}x{height}";
+        }
+
+        return new ParseResult
+        {
+            Format = "PNG",
+            EstimatedSize = size,
+            Metadata = metadata
+        };
     }
 
     public override string GetDisplayDescription(string signatureId,
@@ -93,19 +100,60 @@ public sealed class PngFormat : FileFormatBase
 
     private static int FindIendChunk(ReadOnlySpan<byte> data, int offset)
     {
-        // Scan for IEND chunk - need 4 bytes for IEND + 4 bytes for CRC after the match position
-        var maxScan = Math.Min(data.Length - offset, 50 * 1024 * 1024);
+        var maxScan = Math.Min(data.Length - offset, MaxScanSize);
+        var size = WalkChunksToIend(data, offset, maxScan);
+        return size > 0 ? size : ScanForIend(data, offset, maxScan);
+    }
+
+    /// <summary>
+    ///     Follow the chunk length fields from the signature to the IEND chunk, touching only chunk headers.
+    ///     Returns the total size, or -1 if the chain is broken or runs past the scan window.
+    /// </summary>
+    private static int WalkChunksToIend(ReadOnlySpan<byte> data, int offset, int maxScan)
+    {
+        var end = (long)offset + maxScan;
+        long pos = offset + 8;
 
-        for (var i = offset + 8; i <= offset + maxScan - 8; i++)
+        // Each chunk is 4 bytes length, 4 bytes type, the data, then 4 bytes CRC
+        while (pos + 12 <= end)
         {
-            if (data.Slice(i, 4).SequenceEqual(IendMagic))
-                // IEND chunk includes 4 byte length (before), 4 byte type, and 4 byte CRC (after)
-                // The position i is at "IEND", so total size is i - offset + 4 (type) + 4 (CRC)
+            var chunkStart = (int)pos;
+            if (BinaryPrimitives.ReadUInt32BigEndian(data[(chunkStart + 4)..]) == IendChunkType)
             {
-                return i - offset + 8;
+                return chunkStart + 12 - offset;
             }
+
+            if (data.Slice(chunkStart + 4, 4).IndexOfAnyExcept(ChunkTypeBytes) >= 0)
+            {
+                return -1;
+            }
+
+            pos += 12L + BinaryPrimitives.ReadUInt32BigEndian(data[chunkStart..]);
         }
 
         return -1;
     }
+
+    /// <summary>
+    ///     Fallback for a damaged chunk chain: search the window for the IEND type bytes directly.
+    /// </summary>
+    private static int ScanForIend(ReadOnlySpan<byte> data, int offset, int maxScan)
+    {
+        // Scan for IEND chunk - need 4 bytes for IEND + 4 bytes for CRC after the match position
+        if (maxScan < 12)
+        {
+            return -1;
+        }
+
+        // Vectorized search over the whole window instead of comparing at every byte position
+        var index = data.Slice(offset + 8, maxScan - 12).IndexOf("IEND"u8);
+        if (index < 0)
+        {
+            return -1;
+        }
+
+        // IEND chunk includes 4 byte length (before), 4 byte type, and 4 byte CRC (after)
+        // The match is at offset + 8 + index, so total size is that minus offset + 4 (type) + 4 (CRC)
+        return index + 16;
+    }
 }
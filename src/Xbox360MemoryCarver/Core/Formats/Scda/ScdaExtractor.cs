@@ -1,5 +1,7 @@
-using System.Text;
+using System.Buffers;
+using System.IO.MemoryMappedFiles;
 using System.Text.RegularExpressions;
+using Xbox360MemoryCarver.Core.Utils;
 
 namespace Xbox360MemoryCarver.Core.Formats.Scda;
 
@@ -11,17 +13,56 @@ public static partial class ScdaExtractor
 {
     private static readonly Logger Log = Logger.Instance;
 
-    // Cached invalid filename characters to avoid repeated array allocation
-    private static readonly HashSet<char> InvalidFileNameChars = [.. Path.GetInvalidFileNameChars()];
+    private static readonly SearchValues<char> NameTerminators = SearchValues.Create(" .(\r\n");
 
     /// <summary>
     ///     Extract all SCDA records from a dump, grouping by quest name.
     /// </summary>
-    public static async Task<ScdaExtractionResult> ExtractGroupedAsync(
+    public static Task<ScdaExtractionResult> ExtractGroupedAsync(
         byte[] dumpData,
         string outputDir,
         IProgress<string>? progress = null,
         string? opcodeTablePath = null)
+    {
+        return ExtractGroupedAsync(() => ScdaFormat.ScanForRecords(dumpData), outputDir, progress, opcodeTablePath);
+    }
+
+    /// <summary>
+    ///     Extract all SCDA records from a memory-mapped dump, grouping by quest name.
+    ///     Scans the existing mapping instead of reading the whole dump into memory.
+    /// </summary>
+    public static Task<ScdaExtractionResult> ExtractGroupedAsync(
+        MemoryMappedViewAccessor accessor,
+        long fileSize,
+        string outputDir,
+        IProgress<string>? progress = null,
+        string? opcodeTablePath = null)
+    {
+        return ExtractGroupedAsync(() => ScdaFormat.ScanForRecordsMemoryMapped(accessor, fileSize), outputDir,
+            progress, opcodeTablePath);
+    }
+
+    /// <summary>
+    ///     Extract SCDA records at signature offsets found by an earlier scan of the mapped dump,
+    ///     grouping by quest name.
+    /// </summary>
+    public static Task<ScdaExtractionResult> ExtractGroupedAsync(
+        MemoryMappedViewAccessor accessor,
+        long fileSize,
+        IEnumerable<long> signatureOffsets,
+        string outputDir,
+        IProgress<string>? progress = null,
+        string? opcodeTablePath = null)
+    {
+        return ExtractGroupedAsync(() => ScdaFormat.ParseRecordsAtOffsets(accessor, fileSize, signatureOffsets),
+            outputDir, progress, opcodeTablePath);
+    }
+
+    private static async Task<ScdaExtractionResult> ExtractGroupedAsync(
+        Func<ScdaScanResult> scanRecords,
+        string outputDir,
+        IProgress<string>? progress,
+        string? opcodeTablePath)
     {
         Directory.CreateDirectory(outputDir);
 
@@ -30,7 +71,7 @@ public static partial class ScdaExtractor
         await ScdaFormatter.InitializeAsync(opcodeTablePath);
 
         progress?.Report("Scanning for SCDA records...");
-        var records = ScdaFormat.ScanForRecords(dumpData);
+        var records = scanRecords();
 
         if (records.Records.Count == 0)
         {
@@ -39,6 +80,8 @@ public static partial class ScdaExtractor
 
         progress?.Report($"Found {records.Records.Count} SCDA records, grouping by quest...");
 
+        AssignScriptNames(records.Records);
+
         var (groups, ungrouped) = GroupRecordsByQuest(records.Records);
         progress?.Report($"Grouped into {groups.Count} quests, {ungrouped.Count} ungrouped");
 
@@ -48,13 +91,25 @@ public static partial class ScdaExtractor
         // Build script info list for analysis
         var scripts = BuildScriptInfoList(groups, ungrouped);
 
+        // Summary totals in one pass over the records
+        var totalBytecodeBytes = 0;
+        var recordsWithSource = 0;
+        foreach (var record in records.Records)
+        {
+            totalBytecodeBytes += record.BytecodeLength;
+            if (record.HasAssociatedSctx)
+            {
+                recordsWithSource++;
+            }
+        }
+
         return new ScdaExtractionResult
         {
             TotalRecords = records.Records.Count,
             GroupedQuests = groups.Count,
             UngroupedScripts = ungrouped.Count,
-            TotalBytecodeBytes = records.Records.Sum(r => r.BytecodeLength),
-            RecordsWithSource = records.Records.Count(r => r.HasAssociatedSctx),
+            TotalBytecodeBytes = totalBytecodeBytes,
+            RecordsWithSource = recordsWithSource,
             Scripts = scripts
         };
     }
@@ -69,12 +124,11 @@ public static partial class ScdaExtractor
         foreach (var (questName, records) in groups)
         foreach (var record in records)
         {
-            var scriptName = ExtractScriptNameFromSource(record.SourceText);
             scripts.Add(new ScriptInfo
             {
                 Offset = record.Offset,
                 BytecodeSize = record.BytecodeLength,
-                ScriptName = scriptName,
+                ScriptName = record.ScriptName,
                 QuestName = questName,
                 HasSource = record.HasAssociatedSctx
             });
@@ -83,12 +137,11 @@ public static partial class ScdaExtractor
         // Add ungrouped scripts
         foreach (var record in ungrouped)
         {
-            var scriptName = ExtractScriptNameFromSource(record.SourceText);
             scripts.Add(new ScriptInfo
             {
                 Offset = record.Offset,
                 BytecodeSize = record.BytecodeLength,
-                ScriptName = scriptName,
+                ScriptName = record.ScriptName,
                 QuestName = null,
                 HasSource = record.HasAssociatedSctx
             });
@@ -202,7 +255,7 @@ public static partial class ScdaExtractor
     {
         foreach (var (questName, stages) in groups.OrderBy(g => g.Value[0].Offset))
         {
-            var scriptPath = Path.Combine(outputDir, $"{SanitizeFilename(questName)}_stages.txt");
+            var scriptPath = Path.Combine(outputDir, $"{BinaryUtils.SanitizeFilename(questName)}_stages.txt");
             var content = ScdaFormatter.FormatGroupedScript(questName, stages);
             await File.WriteAllTextAsync(scriptPath, content);
 
@@ -216,24 +269,13 @@ public static partial class ScdaExtractor
         foreach (var record in ungrouped)
         {
             // Use script name from source if available, otherwise use offset as hex identifier
-            var baseName = ExtractScriptNameFromSource(record.SourceText) ?? $"{record.Offset:X8}";
-            var scriptPath = Path.Combine(outputDir, $"{SanitizeFilename(baseName)}.txt");
+            var baseName = record.ScriptName ?? $"{record.Offset:X8}";
+            var scriptPath = Path.Combine(outputDir, $"{BinaryUtils.SanitizeFilename(baseName)}.txt");
             var content = ScdaFormatter.FormatSingleScript(record);
             await File.WriteAllTextAsync(scriptPath, content);
         }
     }
 
-    private static string SanitizeFilename(string name)
-    {
-        var sb = new StringBuilder(name.Length);
-        foreach (var c in name)
-        {
-            sb.Append(InvalidFileNameChars.Contains(c) ? '_' : c);
-        }
-
-        return sb.ToString();
-    }
-
     [GeneratedRegex(@"\b(V(?:MS|CG|Free|Dialogue|ES|MQ)\d{2,4}[A-Za-z0-9]*|NVDLC\d+[A-Za-z0-9]+)\b",
         RegexOptions.Compiled)]
     private static partial Regex QuestNamePattern();
@@ -245,6 +287,12 @@ public static partial class ScdaExtractor
     [GeneratedRegex(@"([A-Z][a-zA-Z0-9]+)\.[a-z][A-Za-z0-9]+", RegexOptions.Compiled)]
     private static partial Regex VariableAccessPattern();
 
+    /// <summary>
+    ///     Name-bearing commands, one group each in priority order: set, get, if.
+    /// </summary>
+    [GeneratedRegex("(set )|(get)|(if )", RegexOptions.IgnoreCase | RegexOptions.CultureInvariant)]
+    private static partial Regex NameCommandPattern();
+
     #region Quest Name Extraction
 
     private static string? ExtractQuestName(string? source)
@@ -297,6 +345,32 @@ public static partial class ScdaExtractor
                !name.StartsWith("Set", StringComparison.OrdinalIgnoreCase);
     }
 
+    /// <summary>
+    ///     Set <see cref="ScdaRecord.ScriptName" /> on every record. A dump often holds several copies of
+    ///     the same script, so names are memoized by source text and each distinct text is matched once.
+    /// </summary>
+    public static void AssignScriptNames(List<ScdaRecord> records)
+    {
+        var namesBySource = new Dictionary<string, string?>(StringComparer.Ordinal);
+        foreach (var record in records)
+        {
+            var source = record.SourceText;
+            if (string.IsNullOrEmpty(source))
+            {
+                record.ScriptName = null;
+                continue;
+            }
+
+            if (!namesBySource.TryGetValue(source, out var name))
+            {
+                name = ExtractScriptNameFromSource(source);
+                namesBySource[source] = name;
+            }
+
+            record.ScriptName = name;
+        }
+    }
+
     /// <summary>
     ///     Public wrapper for extracting script name from source text.
     /// </summary>
@@ -312,10 +386,24 @@ public static partial class ScdaExtractor
             return null;
         }
 
-        var patterns = new[] { "set ", "Set ", "Get", "If ", "if " };
-        foreach (var p in patterns)
+        // One pass records where each command first appears; the commands can't overlap, so no hit is missed
+        Span<int> firstEnd = [-1, -1, -1];
+        var found = 0;
+        for (var match = NameCommandPattern().Match(source); match.Success && found < 3; match = match.NextMatch())
+        {
+            for (var group = 0; group < 3; group++)
+            {
+                if (match.Groups[group + 1].Success && firstEnd[group] < 0)
+                {
+                    firstEnd[group] = match.Index + match.Length;
+                    found++;
+                }
+            }
+        }
+
+        foreach (var start in firstEnd)
         {
-            var name = TryExtractNameAfterPattern(source, p);
+            var name = start < 0 ? null : TryExtractNameAt(source, start);
             if (name != null)
             {
                 return name;
@@ -325,23 +413,11 @@ public static partial class ScdaExtractor
         return null;
     }
 
-    private static string? TryExtractNameAfterPattern(string source, string pattern)
+    private static string? TryExtractNameAt(string source, int start)
     {
-        var idx = source.IndexOf(pattern, StringComparison.OrdinalIgnoreCase);
-        if (idx < 0)
-        {
-            return null;
-        }
-
-        var start = idx + pattern.Length;
-        var end = source.IndexOfAny([' ', '.', '(', '\r', '\n'], start);
-        if (end <= start)
-        {
-            return null;
-        }
-
-        var name = source[start..end];
-        return name.Length is > 3 and < 50 ? name : null;
+        // Not found (-1) or an empty name both fall outside the accepted length range
+        var length = source.AsSpan(start).IndexOfAny(NameTerminators);
+        return length is > 3 and < 50 ? source.Substring(start, length) : null;
     }
 
     #endregion
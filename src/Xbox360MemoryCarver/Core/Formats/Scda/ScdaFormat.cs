@@ -1,4 +1,3 @@
-using System.Buffers;
 using System.IO.MemoryMappedFiles;
 using System.Text;
 using Xbox360MemoryCarver.Core.Utils;
@@ -10,6 +9,12 @@ namespace Xbox360MemoryCarver.Core.Formats.Scda;
 /// </summary>
 public sealed class ScdaFormat : FileFormatBase, IDumpScanner
 {
+    /// <summary>Chunk size used when walking a dump for SCDA records.</summary>
+    internal const int ScanChunkSize = 16 * 1024 * 1024;
+
+    /// <summary>Bytes of the following chunk appended to each chunk so boundary records are seen whole.</summary>
+    internal const int ScanOverlapSize = 512;
+
     public override string FormatId => "scda";
     public override string DisplayName => "SCDA";
     public override string Extension => ".scda";
@@ -80,22 +85,20 @@ public sealed class ScdaFormat : FileFormatBase, IDumpScanner
     public static ScdaScanResult ScanForRecords(byte[] data)
     {
         var records = new List<ScdaRecord>();
-        var i = 0;
+        var searchLimit = data.Length - 10;
+        var i = FindScdaSignature(data, 0, searchLimit);
 
-        while (i <= data.Length - 10)
+        while (i >= 0)
         {
-            if (MatchesScdaSignature(data, i))
+            var next = i + 1;
+            var record = TryParseScdaRecord(data, i);
+            if (record != null)
             {
-                var record = TryParseScdaRecord(data, i);
-                if (record != null)
-                {
-                    records.Add(record);
-                    i += 6 + record.BytecodeSize;
-                    continue;
-                }
+                records.Add(record);
+                next = i + 6 + record.BytecodeSize;
             }
 
-            i++;
+            i = FindScdaSignature(data, next, searchLimit);
         }
 
         return new ScdaScanResult { Records = records };
@@ -107,39 +110,64 @@ public sealed class ScdaFormat : FileFormatBase, IDumpScanner
     /// </summary>
     public static ScdaScanResult ScanForRecordsMemoryMapped(MemoryMappedViewAccessor accessor, long fileSize)
     {
-        const int chunkSize = 16 * 1024 * 1024; // 16MB chunks
-        const int overlapSize = 512; // Overlap to handle records at chunk boundaries
-
         var records = new List<ScdaRecord>();
-        var buffer = ArrayPool<byte>.Shared.Rent(chunkSize + overlapSize);
 
-        try
+        // Each chunk is scanned in place in the mapping, never copied into a managed buffer
+        using var reader = new MemoryMappedSpanReader(accessor, fileSize);
+        for (long offset = 0; offset < fileSize; offset += ScanChunkSize)
         {
-            long offset = 0;
-            while (offset < fileSize)
-            {
-                var toRead = (int)Math.Min(chunkSize + overlapSize, fileSize - offset);
-                accessor.ReadArray(offset, buffer, 0, toRead);
-
-                // Scan this chunk
-                var chunkRecords = ScanChunkForRecords(buffer, toRead, offset);
+            var chunk = reader.GetSpan(offset, (int)Math.Min(ScanChunkSize + ScanOverlapSize, fileSize - offset));
+            ScanChunk(chunk, offset, ScanChunkSize, fileSize, records);
+        }
 
-                foreach (var record in chunkRecords)
-                    // Only add records that start within the main chunk area (not in overlap)
-                    // unless this is the last chunk
-                {
-                    if (record.Offset - offset < chunkSize || offset + chunkSize >= fileSize)
-                    {
-                        records.Add(record);
-                    }
-                }
+        return new ScdaScanResult { Records = records };
+    }
 
-                offset += chunkSize;
+    /// <summary>
+    ///     Scan one chunk of a dump walk, adding records that start in the chunk
+    ///     proper (or anywhere in the last chunk). Lets other dump scans share the same chunk pass.
+    /// </summary>
+    internal static void ScanChunk(ReadOnlySpan<byte> buffer, long offset, int chunkSize, long fileSize,
+        List<ScdaRecord> records)
+    {
+        foreach (var record in ScanChunkForRecords(buffer, offset))
+        {
+            if (record.Offset - offset < chunkSize || offset + chunkSize >= fileSize)
+            {
+                records.Add(record);
             }
         }
-        finally
+    }
+
+    /// <summary>
+    ///     Parse SCDA records at signature offsets already found by another scan (e.g. the carver's
+    ///     signature pass), so the dump does not need a second full pass just to locate records.
+    ///     Offsets inside an accepted record's bytecode are skipped, matching the sequential scan.
+    /// </summary>
+    public static ScdaScanResult ParseRecordsAtOffsets(MemoryMappedViewAccessor accessor, long fileSize,
+        IEnumerable<long> signatureOffsets)
+    {
+        // Header + max bytecode + SCTX search distance + SCTX header + max source text
+        const int recordWindowSize = 6 + ushort.MaxValue + 200 + 6 + ushort.MaxValue;
+
+        var records = new List<ScdaRecord>();
+        using var reader = new MemoryMappedSpanReader(accessor, fileSize);
+        long nextAllowed = 0;
+
+        foreach (var offset in signatureOffsets.Order())
         {
-            ArrayPool<byte>.Shared.Return(buffer);
+            if (offset < nextAllowed || fileSize - offset < 10)
+            {
+                continue;
+            }
+
+            var window = reader.GetSpan(offset, (int)Math.Min(recordWindowSize, fileSize - offset));
+            var record = TryParseScdaRecordFromChunk(window, 0, window.Length, offset);
+            if (record != null)
+            {
+                records.Add(record);
+                nextAllowed = offset + 6 + record.BytecodeSize;
+            }
         }
 
         return new ScdaScanResult { Records = records };
@@ -148,26 +176,24 @@ public sealed class ScdaFormat : FileFormatBase, IDumpScanner
     /// <summary>
     ///     Scan a chunk of data for SCDA records.
     /// </summary>
-    private static List<ScdaRecord> ScanChunkForRecords(byte[] data, int dataLength, long baseOffset)
+    private static List<ScdaRecord> ScanChunkForRecords(ReadOnlySpan<byte> data, long baseOffset)
     {
         var records = new List<ScdaRecord>();
-        var i = 0;
+        var dataLength = data.Length;
         var searchLimit = dataLength - 10;
+        var i = FindScdaSignature(data, 0, searchLimit);
 
-        while (i <= searchLimit)
+        while (i >= 0)
         {
-            if (MatchesScdaSignature(data, i))
+            var next = i + 1;
+            var record = TryParseScdaRecordFromChunk(data, i, dataLength, baseOffset);
+            if (record != null)
             {
-                var record = TryParseScdaRecordFromChunk(data, i, dataLength, baseOffset);
-                if (record != null)
-                {
-                    records.Add(record);
-                    i += 6 + record.BytecodeSize;
-                    continue;
-                }
+                records.Add(record);
+                next = i + 6 + record.BytecodeSize;
             }
 
-            i++;
+            i = FindScdaSignature(data, next, searchLimit);
         }
 
         return records;
@@ -177,12 +203,19 @@ public sealed class ScdaFormat : FileFormatBase, IDumpScanner
 
     #region Private Implementation
 
-    private static bool MatchesScdaSignature(byte[] data, int offset)
+    /// <summary>
+    ///     Position of the next "SCDA" starting in [start, searchLimit], or -1.
+    ///     Uses the vectorized span search instead of testing every byte position.
+    /// </summary>
+    private static int FindScdaSignature(ReadOnlySpan<byte> data, int start, int searchLimit)
     {
-        return data[offset] == 'S' &&
-               data[offset + 1] == 'C' &&
-               data[offset + 2] == 'D' &&
-               data[offset + 3] == 'A';
+        if (start > searchLimit)
+        {
+            return -1;
+        }
+
+        var index = data.Slice(start, searchLimit - start + 4).IndexOf("SCDA"u8);
+        return index < 0 ? -1 : start + index;
     }
 
     private static ScdaRecord? TryParseScdaRecord(byte[] data, int offset)
@@ -215,7 +248,7 @@ public sealed class ScdaFormat : FileFormatBase, IDumpScanner
         };
     }
 
-    private static ScdaRecord? TryParseScdaRecordFromChunk(byte[] data, int localOffset, int dataLength,
+    private static ScdaRecord? TryParseScdaRecordFromChunk(ReadOnlySpan<byte> data, int localOffset, int dataLength,
         long baseOffset)
     {
         if (localOffset + 6 > dataLength)
@@ -229,14 +262,13 @@ public sealed class ScdaFormat : FileFormatBase, IDumpScanner
             return null;
         }
 
-        var bytecodeSpan = data.AsSpan(localOffset + 6, length);
+        var bytecodeSpan = data.Slice(localOffset + 6, length);
         if (!ValidateBytecode(bytecodeSpan))
         {
             return null;
         }
 
-        var bytecode = new byte[length];
-        Array.Copy(data, localOffset + 6, bytecode, 0, length);
+        var bytecode = bytecodeSpan.ToArray();
 
         var searchStart = localOffset + 6 + length;
         var (sourceText, sourceLocalOffset) = FindAssociatedSctxInChunk(data, searchStart, dataLength);
@@ -272,8 +304,8 @@ public sealed class ScdaFormat : FileFormatBase, IDumpScanner
         return (null, 0);
     }
 
-    private static (string? Text, int LocalOffset) FindAssociatedSctxInChunk(byte[] data, int searchStart,
-        int dataLength)
+    private static (string? Text, int LocalOffset) FindAssociatedSctxInChunk(ReadOnlySpan<byte> data,
+        int searchStart, int dataLength)
     {
         var searchEnd = Math.Min(searchStart + 200, dataLength - 10);
 
@@ -289,7 +321,7 @@ public sealed class ScdaFormat : FileFormatBase, IDumpScanner
                 var length = BinaryUtils.ReadUInt16LE(data, i + 4);
                 if (length is > 0 and < 65535 && i + 6 + length <= dataLength)
                 {
-                    var text = Encoding.ASCII.GetString(data, i + 6, length).TrimEnd('\0');
+                    var text = Encoding.ASCII.GetString(data.Slice(i + 6, length)).TrimEnd('\0');
                     return (text, i);
                 }
             }
@@ -322,7 +354,7 @@ public sealed class ScdaFormat : FileFormatBase, IDumpScanner
         return formIds;
     }
 
-    private static List<uint> FindAssociatedScroInChunk(byte[] data, int searchStart, int dataLength)
+    private static List<uint> FindAssociatedScroInChunk(ReadOnlySpan<byte> data, int searchStart, int dataLength)
     {
         var formIds = new List<uint>();
         var searchEnd = Math.Min(searchStart + 500, dataLength - 10);
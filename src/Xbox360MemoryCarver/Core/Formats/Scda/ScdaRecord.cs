@@ -12,7 +12,7 @@ public record ScdaRecord
     public List<uint> FormIdReferences { get; init; } = [];
 
     /// <summary>
-    ///     Script/quest name extracted from source text (populated during grouping).
+    ///     Script/quest name extracted from source text (populated by ScdaExtractor.AssignScriptNames).
     /// </summary>
     public string? ScriptName { get; set; }
 
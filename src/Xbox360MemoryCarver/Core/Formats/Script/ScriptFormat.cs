@@ -1,4 +1,6 @@
+using System.Buffers;
 using System.Text;
+using Xbox360MemoryCarver.Core.Utils;
 
 namespace Xbox360MemoryCarver.Core.Formats.Script;
 
@@ -7,6 +9,21 @@ namespace Xbox360MemoryCarver.Core.Formats.Script;
 /// </summary>
 public sealed class ScriptFormat : FileFormatBase
 {
+    private static readonly SearchValues<byte> NameTerminators = SearchValues.Create(";\r\t "u8);
+
+    private static readonly SearchValues<byte> IdentifierBytes =
+        SearchValues.Create("ABCDEFGHIJKLMNOPQRSTUVWXYZabcdefghijklmnopqrstuvwxyz0123456789_"u8);
+
+    /// <summary>
+    ///     Script headers that start the next script, found in one pass instead of a search per header.
+    ///     Both keywords start with 's' in some case; the validator matches them case-insensitively,
+    ///     like the header check in <see cref="HasKeyword" />.
+    /// </summary>
+    private static readonly SignatureBoundaryScanner.SignatureTable NextScriptHeaders =
+        SignatureBoundaryScanner.CreateSignatureTable(
+            ("s"u8.ToArray(), IsScriptHeaderAtLineStart),
+            ("S"u8.ToArray(), IsScriptHeaderAtLineStart));
+
     public override string FormatId => "script";
     public override string DisplayName => "ObScript";
     public override string Extension => ".txt";
@@ -54,36 +71,41 @@ public sealed class ScriptFormat : FileFormatBase
                 return null;
             }
 
-            var firstLine = Encoding.ASCII.GetString(scriptData[..firstLineEnd]).Trim();
-            var scriptName = ExtractScriptName(firstLine);
-            if (string.IsNullOrEmpty(scriptName))
-            {
-                return null;
-            }
-
-            var invalidChar = scriptName.IndexOfAny([';', '\r', '\t', ' ']);
+            // The header is pure ASCII, so it is matched and validated on bytes; only the accepted name is decoded
+            var nameBytes = ExtractScriptName(TrimWhitespace(scriptData[..firstLineEnd]));
+            var invalidChar = nameBytes.IndexOfAny(NameTerminators);
             if (invalidChar >= 0)
             {
-                scriptName = scriptName[..invalidChar];
+                nameBytes = nameBytes[..invalidChar];
             }
 
-            if (string.IsNullOrEmpty(scriptName) || !IsValidScriptName(scriptName))
+            if (nameBytes.IsEmpty || !IsValidScriptName(nameBytes))
             {
                 return null;
             }
 
+            var scriptName = Encoding.ASCII.GetString(nameBytes);
+
             var endPos = FindScriptEnd(scriptData, firstLineEnd);
-            var safeName = SanitizeScriptName(scriptName);
+
+            // Scripts stored back to back: stop where the next one begins
+            var nextScript = SignatureBoundaryScanner.FindNextSignature(scriptData, firstLineEnd, endPos, NextScriptHeaders);
+            if (nextScript >= 0)
+            {
+                endPos = nextScript;
+            }
 
             return new ParseResult
             {
                 Format = "Script",
                 EstimatedSize = endPos,
                 FileName = scriptName + ".txt",
+                // The name was validated as [A-Za-z0-9_], so it is already safe for a file name
+                SafeName = scriptName,
                 Metadata = new Dictionary<string, object>
                 {
                     ["scriptName"] = scriptName,
-                    ["safeName"] = safeName
+                    ["safeName"] = scriptName
                 }
             };
         }
@@ -96,113 +118,94 @@ public sealed class ScriptFormat : FileFormatBase
 
     private static int FindLineEnd(ReadOnlySpan<byte> data)
     {
-        for (var i = 0; i < data.Length; i++)
-        {
-            if (data[i] == '\r' || data[i] == '\n')
-            {
-                return i;
-            }
-        }
-
-        return -1;
+        return data.IndexOfAny((byte)'\r', (byte)'\n');
     }
 
-    private static string? ExtractScriptName(string firstLine)
+    private static ReadOnlySpan<byte> ExtractScriptName(ReadOnlySpan<byte> firstLine)
     {
-        const string? scriptName = null;
-        var lower = firstLine.ToLowerInvariant();
-
-        if (lower.StartsWith("scn ", StringComparison.Ordinal) || lower.StartsWith("scn\t", StringComparison.Ordinal))
+        if (HasKeyword(firstLine, "scn"u8))
         {
-            return firstLine[4..].Trim();
+            return TrimWhitespace(firstLine[4..]);
         }
 
-        if (lower.StartsWith("scriptname ", StringComparison.Ordinal) ||
-            lower.StartsWith("scriptname\t", StringComparison.Ordinal))
+        if (HasKeyword(firstLine, "scriptname"u8))
         {
-            return firstLine[11..].Trim();
+            return TrimWhitespace(firstLine[11..]);
         }
 
-        return scriptName;
+        return [];
+    }
+
+    /// <summary>
+    ///     Whether the line starts with the keyword (any case) followed by a space or tab.
+    /// </summary>
+    private static bool HasKeyword(ReadOnlySpan<byte> line, ReadOnlySpan<byte> keyword)
+    {
+        return line.Length > keyword.Length &&
+               Ascii.EqualsIgnoreCase(line[..keyword.Length], keyword) &&
+               line[keyword.Length] is (byte)' ' or (byte)'\t';
+    }
+
+    private static ReadOnlySpan<byte> TrimWhitespace(ReadOnlySpan<byte> data)
+    {
+        return data.Trim(" \t\n\v\f\r"u8);
     }
 
     private static int FindScriptEnd(ReadOnlySpan<byte> data, int startPos)
     {
-        var maxLen = Math.Min(data.Length, 100000);
+        var text = data[..Math.Min(data.Length, 100000)];
         var lastValidPos = startPos;
-        var consecutiveNonPrintable = 0;
+        var i = startPos;
 
-        for (var i = startPos; i < maxLen; i++)
+        // Jump over printable runs and only inspect the runs of other bytes between them
+        while (i < text.Length)
         {
-            var b = data[i];
-
-            if (b < 0x20 || b > 0x7E)
+            var binaryStart = text[i..].IndexOfAnyExcept(BinaryUtils.PrintableTextBytes);
+            if (binaryStart < 0)
             {
-                if (b == '\r' || b == '\n' || b == '\t')
-                {
-                    consecutiveNonPrintable = 0;
-                    lastValidPos = i + 1;
-                }
-                else
-                {
-                    consecutiveNonPrintable++;
-                    if (consecutiveNonPrintable > 3)
-                    {
-                        return lastValidPos;
-                    }
-                }
+                return text.Length;
             }
-            else
+
+            i += binaryStart;
+            if (binaryStart > 0)
             {
-                consecutiveNonPrintable = 0;
-                lastValidPos = i + 1;
+                lastValidPos = i;
             }
-        }
 
-        return lastValidPos;
-    }
+            var binaryLength = text[i..].IndexOfAny(BinaryUtils.PrintableTextBytes);
+            if (binaryLength < 0)
+            {
+                binaryLength = text.Length - i;
+            }
 
-    private static bool IsValidScriptName(string name)
-    {
-        foreach (var c in name)
-        {
-            if (!char.IsLetterOrDigit(c) && c != '_')
+            // More than three non-text bytes in a row ends the script
+            if (binaryLength > 3)
             {
-                return false;
+                return lastValidPos;
             }
+
+            i += binaryLength;
         }
 
-        return true;
+        return lastValidPos;
     }
 
-    private static string SanitizeScriptName(string name)
+    /// <summary>
+    ///     A "scn" or "scriptname" header (any case) at the beginning of a line (not e.g. inside "myscn ").
+    /// </summary>
+    private static bool IsScriptHeaderAtLineStart(ReadOnlySpan<byte> data, int position)
     {
-        // Use stackalloc for short names to avoid allocations
-        if (name.Length <= 260)
+        if (position == 0 || data[position - 1] is not ((byte)'\n' or (byte)'\r'))
         {
-            Span<char> buffer = stackalloc char[name.Length];
-            var pos = 0;
-            foreach (var c in name)
-            {
-                if (char.IsLetterOrDigit(c) || c == '_' || c == '-')
-                {
-                    buffer[pos++] = c;
-                }
-            }
-
-            return new string(buffer[..pos]);
+            return false;
         }
 
-        // Fallback for very long names
-        var sb = new StringBuilder(name.Length);
-        foreach (var c in name)
-        {
-            if (char.IsLetterOrDigit(c) || c == '_' || c == '-')
-            {
-                sb.Append(c);
-            }
-        }
+        var line = data[position..];
+        return HasKeyword(line, "scn"u8) || HasKeyword(line, "scriptname"u8);
+    }
 
-        return sb.ToString();
+    private static bool IsValidScriptName(ReadOnlySpan<byte> name)
+    {
+        return name.IndexOfAnyExcept(IdentifierBytes) < 0;
     }
 }
@@ -1,3 +1,5 @@
+using System.Buffers.Binary;
+using System.Runtime.InteropServices;
 using Xbox360MemoryCarver.Core.Utils;
 
 namespace Xbox360MemoryCarver.Core.Formats.Xdbf;
@@ -7,6 +9,13 @@ namespace Xbox360MemoryCarver.Core.Formats.Xdbf;
 /// </summary>
 public sealed class XdbfFormat : FileFormatBase
 {
+    // Big-endian header dwords following the magic
+    private const int VersionField = 0;
+    private const int EntryCountField = 1;
+    private const int EntryTableOffsetField = 2;
+    private const int FreeCountField = 3;
+    private const int HeaderFieldCount = 4;
+
     public override string FormatId => "xdbf";
     public override string DisplayName => "XDBF";
     public override string Extension => ".xdbf";
@@ -41,10 +50,15 @@ public sealed class XdbfFormat : FileFormatBase
 
         try
         {
-            var version = BinaryUtils.ReadUInt32BE(data, offset + 4);
-            var entryCount = BinaryUtils.ReadUInt32BE(data, offset + 8);
-            var entryTableOffset = BinaryUtils.ReadUInt32BE(data, offset + 12);
-            var freeCount = BinaryUtils.ReadUInt32BE(data, offset + 16);
+            // Load the header dwords in one copy (little-endian host) and byte-swap them together
+            Span<uint> fields = stackalloc uint[HeaderFieldCount];
+            MemoryMarshal.Cast<byte, uint>(data.Slice(offset + 4, HeaderFieldCount * 4)).CopyTo(fields);
+            BinaryPrimitives.ReverseEndianness(fields, fields);
+
+            var version = fields[VersionField];
+            var entryCount = fields[EntryCountField];
+            var entryTableOffset = fields[EntryTableOffsetField];
+            var freeCount = fields[FreeCountField];
 
             if (entryCount > 10000 || freeCount > 10000)
             {
@@ -57,29 +57,22 @@ public sealed class XmaFormat : FileFormatBase, IFileRepairer, IFileConverter
             return null;
         }
 
-        try
-        {
-            var riffSize = BinaryUtils.ReadUInt32LE(data, offset + 4);
-            var reportedFileSize = (int)(riffSize + 8);
-            var formatType = data.Slice(offset + 8, 4);
+        var riffSize = BinaryUtils.ReadUInt32LE(data, offset + 4);
+        var reportedFileSize = (int)(riffSize + 8);
+        var formatType = data.Slice(offset + 8, 4);
 
-            if (!formatType.SequenceEqual("WAVE"u8))
-            {
-                return null;
-            }
-
-            if (reportedFileSize < 44 || reportedFileSize > 100 * 1024 * 1024)
-            {
-                return null;
-            }
-
-            var boundarySize = ValidateAndAdjustSize(data, offset, reportedFileSize);
-            return XmaParser.ParseXmaChunks(data, offset, reportedFileSize, boundarySize);
+        if (!formatType.SequenceEqual("WAVE"u8))
+        {
+            return null;
         }
-        catch
+
+        if (reportedFileSize < 44 || reportedFileSize > 100 * 1024 * 1024)
         {
             return null;
         }
+
+        var boundarySize = ValidateAndAdjustSize(data, offset, reportedFileSize);
+        return XmaParser.ParseXmaChunks(data, offset, reportedFileSize, boundarySize);
     }
 
     public override string GetDisplayDescription(string signatureId,
@@ -1,3 +1,4 @@
+using System.Buffers;
 using System.Text;
 using Xbox360MemoryCarver.Core.Utils;
 
@@ -8,10 +9,21 @@ namespace Xbox360MemoryCarver.Core.Formats.Xma;
 /// </summary>
 internal static class XmaParser
 {
-    private static readonly ushort[] XmaFormatCodes = [0x0165, 0x0166];
-
-    // Cached invalid filename characters to avoid repeated array allocation
-    private static readonly HashSet<char> InvalidFileNameChars = [.. Path.GetInvalidFileNameChars()];
+    // RIFF chunk ids as big-endian dwords, so a chunk header is classified with one load and a switch
+    private const uint FmtChunkId = 0x666D7420; // "fmt "
+    private const uint Xma2ChunkId = 0x584D4132; // "XMA2"
+    private const uint DataChunkId = 0x64617461; // "data"
+    private const uint SeekChunkId = 0x7365656B; // "seek"
+
+    /// <summary>
+    ///     Printable ASCII other than the characters Windows forbids in paths ("&lt;&gt;|).
+    /// </summary>
+    private static readonly SearchValues<byte> PrintablePathBytes = SearchValues.Create(
+    [
+        .. Enumerable.Range(0x20, 0x7F - 0x20)
+            .Select(b => (byte)b)
+            .Where(b => b is not ((byte)'"' or (byte)'<' or (byte)'>' or (byte)'|'))
+    ]);
 
     public static ParseResult? ParseXmaChunks(ReadOnlySpan<byte> data, int offset, int reportedSize, int boundarySize)
     {
@@ -22,7 +34,7 @@ internal static class XmaParser
 
         while (searchOffset < maxSearchOffset - 8)
         {
-            var chunkId = data.Slice(searchOffset, 4);
+            var chunkId = BinaryUtils.ReadUInt32BE(data, searchOffset);
             var chunkSize = BinaryUtils.ReadUInt32LE(data, searchOffset + 4);
 
             if (chunkSize > int.MaxValue - 16)
@@ -41,7 +53,7 @@ internal static class XmaParser
             searchOffset = nextOffset;
         }
 
-        if (parseState.FormatTag == null || !XmaFormatCodes.Contains(parseState.FormatTag.Value))
+        if (parseState.FormatTag is not (0x0165 or 0x0166))
         {
             return null;
         }
@@ -52,26 +64,25 @@ internal static class XmaParser
     private static void ProcessChunk(
         ReadOnlySpan<byte> data,
         int searchOffset,
-        ReadOnlySpan<byte> chunkId,
+        uint chunkId,
         uint chunkSize,
         ref XmaParseState state)
     {
-        if (chunkId.SequenceEqual("fmt "u8))
-        {
-            ProcessFmtChunk(data, searchOffset, ref state);
-        }
-        else if (chunkId.SequenceEqual("XMA2"u8))
-        {
-            state.FormatTag ??= 0x0166;
-        }
-        else if (chunkId.SequenceEqual("data"u8))
+        switch (chunkId)
         {
-            state.DataChunkOffset = searchOffset;
-            state.DataChunkSize = (int)chunkSize;
-        }
-        else if (chunkId.SequenceEqual("seek"u8))
-        {
-            state.HasSeekChunk = true;
+            case FmtChunkId:
+                ProcessFmtChunk(data, searchOffset, ref state);
+                break;
+            case Xma2ChunkId:
+                state.FormatTag ??= 0x0166;
+                break;
+            case DataChunkId:
+                state.DataChunkOffset = searchOffset;
+                state.DataChunkSize = (int)chunkSize;
+                break;
+            case SeekChunkId:
+                state.HasSeekChunk = true;
+                break;
         }
     }
 
@@ -82,7 +93,7 @@ internal static class XmaParser
             return;
         }
 
-        state.FormatTag = (ushort)(BinaryUtils.ReadUInt32LE(data, searchOffset + 8) & 0xFFFF);
+        state.FormatTag = BinaryUtils.ReadUInt16LE(data, searchOffset + 8);
 
         var fmtDataStart = searchOffset + 12;
         var fmtDataEnd = Math.Min(searchOffset + 256, data.Length);
@@ -134,10 +145,12 @@ internal static class XmaParser
             ["usablePercent"] = usablePercent
         };
 
+        string? safeName = null;
         if (state.EmbeddedPath != null)
         {
+            safeName = SanitizeFilename(state.EmbeddedPath);
             metadata["embeddedPath"] = state.EmbeddedPath;
-            metadata["safeName"] = SanitizeFilename(state.EmbeddedPath);
+            metadata["safeName"] = safeName;
         }
 
         if (state.NeedsRepair)
@@ -151,17 +164,13 @@ internal static class XmaParser
             metadata["likelyCorrupted"] = true;
         }
 
-        string? fileName = null;
-        if (metadata.TryGetValue("safeName", out var safeName) && safeName is string safeNameStr)
-        {
-            fileName = safeNameStr + ".xma";
-        }
-
         return new ParseResult
         {
             Format = "XMA",
             EstimatedSize = actualSize,
-            FileName = fileName,
+            FileName = safeName != null ? safeName + ".xma" : null,
+            SafeName = safeName,
+            OriginalPath = state.EmbeddedPath,
             Metadata = metadata
         };
     }
@@ -177,40 +186,31 @@ internal static class XmaParser
         }
 
         var corruptBytes = 0;
-        var endOffset = Math.Min(dataStart + dataSize, data.Length);
+        // A corrupt data chunk size can push the sum past int.MaxValue
+        var endOffset = (int)Math.Min((long)dataStart + dataSize, data.Length);
         var firstCorruptionOffset = -1;
 
-        var runLength = 0;
-        byte? runByte = null;
-        var runStart = dataStart;
-
-        for (var i = dataStart; i < endOffset; i++)
+        // Jump between 0x00/0xFF bytes and measure each run of one of them with vectorized searches
+        var region = data[..endOffset];
+        var i = dataStart;
+        while (i < endOffset)
         {
-            var b = data[i];
-
-            if (b == 0xFF || b == 0x00)
+            var skip = region[i..].IndexOfAny((byte)0x00, (byte)0xFF);
+            if (skip < 0)
             {
-                if (runByte == b)
-                {
-                    runLength++;
-                }
-                else
-                {
-                    CountCorruptRun(ref corruptBytes, ref firstCorruptionOffset, runLength, runStart);
-                    runByte = b;
-                    runLength = 1;
-                    runStart = i;
-                }
+                break;
             }
-            else
+
+            i += skip;
+            var runLength = region[i..].IndexOfAnyExcept(region[i]);
+            if (runLength < 0)
             {
-                CountCorruptRun(ref corruptBytes, ref firstCorruptionOffset, runLength, runStart);
-                runByte = null;
-                runLength = 0;
+                runLength = endOffset - i;
             }
-        }
 
-        CountCorruptRun(ref corruptBytes, ref firstCorruptionOffset, runLength, runStart);
+            CountCorruptRun(ref corruptBytes, ref firstCorruptionOffset, runLength, i);
+            i += runLength;
+        }
 
         var totalQuality = Math.Max(0, 100 - corruptBytes * 100 / dataSize);
 
@@ -276,19 +276,11 @@ internal static class XmaParser
             return null;
         }
 
-        // Find the start of the path by walking backwards
-        var start = idx;
-        while (start > 0 && IsPrintablePathChar((char)data[start - 1]))
-        {
-            start--;
-        }
+        // The path extends both ways from the indicator until the first non-path byte
+        var start = data[..idx].LastIndexOfAnyExcept(PrintablePathBytes) + 1;
 
-        // Find the end of the path by walking forwards
-        var end = idx + 1;
-        while (end < data.Length && IsPrintablePathChar((char)data[end]))
-        {
-            end++;
-        }
+        var tail = data[(idx + 1)..].IndexOfAnyExcept(PrintablePathBytes);
+        var end = tail < 0 ? data.Length : idx + 1 + tail;
 
         var pathLength = end - start;
         if (pathLength <= 5)
@@ -337,11 +329,6 @@ internal static class XmaParser
         return -1;
     }
 
-    private static bool IsPrintablePathChar(char c)
-    {
-        return c >= 0x20 && c < 0x7F && c != '"' && c != '<' && c != '>' && c != '|';
-    }
-
     private static string SanitizeFilename(string path)
     {
         var filename = Path.GetFileNameWithoutExtension(path);
@@ -350,13 +337,7 @@ internal static class XmaParser
             filename = path.Replace('\\', '_').Replace('/', '_');
         }
 
-        var sb = new StringBuilder(filename.Length);
-        foreach (var c in filename)
-        {
-            sb.Append(InvalidFileNameChars.Contains(c) ? '_' : c);
-        }
-
-        return sb.ToString();
+        return BinaryUtils.SanitizeFilename(filename);
     }
 
     private struct XmaParseState
@@ -14,6 +14,8 @@ namespace Xbox360MemoryCarver.Core.Json;
 [JsonSerializable(typeof(List<CarveEntry>))]
 [JsonSerializable(typeof(CarveEntry))]
 [JsonSerializable(typeof(JsonAnalysisResult))]
+[JsonSerializable(typeof(JsonCarvedFileInfo))]
+[JsonSerializable(typeof(JsonEsmScanResult))]
 [JsonSerializable(typeof(Dictionary<string, object>))]
 internal partial class CarverJsonContext : JsonSerializerContext;
 
@@ -66,3 +68,27 @@ public sealed class JsonScdaRecordInfo
     public int BytecodeLength { get; set; }
     public string? ScriptName { get; set; }
 }
+
+/// <summary>
+///     ESM/ESP file scan summary for JSON serialization.
+/// </summary>
+public sealed class JsonEsmScanResult
+{
+    public JsonEsmFileHeader? Header { get; set; }
+    public int TotalRecords { get; set; }
+    public int UniqueEditorIds { get; set; }
+    public Dictionary<string, int> RecordTypeCounts { get; set; } = [];
+    public Dictionary<string, int> RecordsByCategory { get; set; } = [];
+}
+
+/// <summary>
+///     ESM file header (TES4 record) for JSON serialization.
+/// </summary>
+public sealed class JsonEsmFileHeader
+{
+    public float Version { get; set; }
+    public string? Author { get; set; }
+    public string? Description { get; set; }
+    public uint NextObjectId { get; set; }
+    public List<string> Masters { get; set; } = [];
+}
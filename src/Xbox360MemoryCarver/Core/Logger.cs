@@ -1,4 +1,5 @@
 using System.Globalization;
+using System.Runtime.CompilerServices;
 
 namespace Xbox360MemoryCarver.Core;
 
@@ -36,6 +37,12 @@ public sealed class Logger
 
     private TextWriter _output = Console.Out;
 
+    /// <summary>
+    ///     Last formatted timestamp. Bursts of log lines usually land in the same millisecond,
+    ///     so the formatted text is reused until the clock moves on.
+    /// </summary>
+    private TimestampText? _lastTimestamp;
+
     private Logger()
     {
     }
@@ -111,7 +118,10 @@ public sealed class Logger
     /// </summary>
     public void Error(string format, params object[] args)
     {
-        Log(LogLevel.Error, string.Format(CultureInfo.InvariantCulture, format, args));
+        if (IsEnabled(LogLevel.Error))
+        {
+            Log(LogLevel.Error, string.Format(CultureInfo.InvariantCulture, format, args));
+        }
     }
 
     /// <summary>
@@ -127,7 +137,10 @@ public sealed class Logger
     /// </summary>
     public void Warn(string format, params object[] args)
     {
-        Log(LogLevel.Warn, string.Format(CultureInfo.InvariantCulture, format, args));
+        if (IsEnabled(LogLevel.Warn))
+        {
+            Log(LogLevel.Warn, string.Format(CultureInfo.InvariantCulture, format, args));
+        }
     }
 
     /// <summary>
@@ -143,7 +156,10 @@ public sealed class Logger
     /// </summary>
     public void Info(string format, params object[] args)
     {
-        Log(LogLevel.Info, string.Format(CultureInfo.InvariantCulture, format, args));
+        if (IsEnabled(LogLevel.Info))
+        {
+            Log(LogLevel.Info, string.Format(CultureInfo.InvariantCulture, format, args));
+        }
     }
 
     /// <summary>
@@ -154,12 +170,26 @@ public sealed class Logger
         Log(LogLevel.Debug, message);
     }
 
+    /// <summary>
+    ///     Log an interpolated debug/verbose message. The string is only built when Debug output is enabled.
+    /// </summary>
+    public void Debug([InterpolatedStringHandlerArgument("")] ref LogInterpolatedStringHandler<DebugLevel> message)
+    {
+        if (message.IsEnabled)
+        {
+            Log(LogLevel.Debug, message.ToStringAndClear());
+        }
+    }
+
     /// <summary>
     ///     Log a debug/verbose message with format args.
     /// </summary>
     public void Debug(string format, params object[] args)
     {
-        Log(LogLevel.Debug, string.Format(CultureInfo.InvariantCulture, format, args));
+        if (IsEnabled(LogLevel.Debug))
+        {
+            Log(LogLevel.Debug, string.Format(CultureInfo.InvariantCulture, format, args));
+        }
     }
 
     /// <summary>
@@ -170,12 +200,26 @@ public sealed class Logger
         Log(LogLevel.Trace, message);
     }
 
+    /// <summary>
+    ///     Log an interpolated trace message. The string is only built when Trace output is enabled.
+    /// </summary>
+    public void Trace([InterpolatedStringHandlerArgument("")] ref LogInterpolatedStringHandler<TraceLevel> message)
+    {
+        if (message.IsEnabled)
+        {
+            Log(LogLevel.Trace, message.ToStringAndClear());
+        }
+    }
+
     /// <summary>
     ///     Log a trace message with format args.
     /// </summary>
     public void Trace(string format, params object[] args)
     {
-        Log(LogLevel.Trace, string.Format(CultureInfo.InvariantCulture, format, args));
+        if (IsEnabled(LogLevel.Trace))
+        {
+            Log(LogLevel.Trace, string.Format(CultureInfo.InvariantCulture, format, args));
+        }
     }
 
     /// <summary>
@@ -198,7 +242,7 @@ public sealed class Logger
 
         if (IncludeTimestamp)
         {
-            parts.Add(string.Format(CultureInfo.InvariantCulture, "[{0:HH:mm:ss.fff}]", DateTime.Now));
+            parts.Add(FormatTimestamp(DateTime.Now));
         }
 
         if (IncludeLevel)
@@ -217,6 +261,20 @@ public sealed class Logger
         return parts.Count > 0 ? string.Join(" ", parts) + " " : "";
     }
 
+    private string FormatTimestamp(DateTime now)
+    {
+        var millisecond = now.Ticks / TimeSpan.TicksPerMillisecond;
+        var cached = _lastTimestamp;
+        if (cached != null && cached.Millisecond == millisecond)
+        {
+            return cached.Text;
+        }
+
+        var text = string.Format(CultureInfo.InvariantCulture, "[{0:HH:mm:ss.fff}]", now);
+        _lastTimestamp = new TimestampText(millisecond, text);
+        return text;
+    }
+
     /// <summary>
     ///     Reset logger to defaults (for testing).
     /// </summary>
@@ -227,4 +285,93 @@ public sealed class Logger
         IncludeTimestamp = false;
         IncludeLevel = true;
     }
+
+    private sealed record TimestampText(long Millisecond, string Text);
+}
+
+/// <summary>
+///     Compile-time log level for <see cref="LogInterpolatedStringHandler{TLevel}" />.
+/// </summary>
+public interface ILogLevel
+{
+    static abstract LogLevel Level { get; }
+}
+
+/// <summary>
+///     <see cref="LogLevel.Debug" /> as a type argument.
+/// </summary>
+public readonly struct DebugLevel : ILogLevel
+{
+    public static LogLevel Level => LogLevel.Debug;
+}
+
+/// <summary>
+///     <see cref="LogLevel.Trace" /> as a type argument.
+/// </summary>
+public readonly struct TraceLevel : ILogLevel
+{
+    public static LogLevel Level => LogLevel.Trace;
+}
+
+/// <summary>
+///     Interpolated string handler for the level-specific <see cref="Logger" /> overloads
+///     (<see cref="Logger.Debug(ref LogInterpolatedStringHandler{DebugLevel})" />,
+///     <see cref="Logger.Trace(ref LogInterpolatedStringHandler{TraceLevel})" />).
+///     Skips formatting entirely when <typeparamref name="TLevel" /> output is disabled.
+/// </summary>
+[InterpolatedStringHandler]
+public ref struct LogInterpolatedStringHandler<TLevel>
+    where TLevel : struct, ILogLevel
+{
+    private DefaultInterpolatedStringHandler _inner;
+
+    public LogInterpolatedStringHandler(int literalLength, int formattedCount, Logger logger, out bool isEnabled)
+    {
+        IsEnabled = isEnabled = logger.IsEnabled(TLevel.Level);
+        _inner = isEnabled
+            ? new DefaultInterpolatedStringHandler(literalLength, formattedCount, CultureInfo.InvariantCulture)
+            : default;
+    }
+
+    internal bool IsEnabled { get; }
+
+    public void AppendLiteral(string value)
+    {
+        _inner.AppendLiteral(value);
+    }
+
+    public void AppendFormatted<T>(T value)
+    {
+        _inner.AppendFormatted(value);
+    }
+
+    public void AppendFormatted<T>(T value, string? format)
+    {
+        _inner.AppendFormatted(value, format);
+    }
+
+    public void AppendFormatted<T>(T value, int alignment)
+    {
+        _inner.AppendFormatted(value, alignment);
+    }
+
+    public void AppendFormatted<T>(T value, int alignment, string? format)
+    {
+        _inner.AppendFormatted(value, alignment, format);
+    }
+
+    public void AppendFormatted(ReadOnlySpan<char> value)
+    {
+        _inner.AppendFormatted(value);
+    }
+
+    public void AppendFormatted(string? value)
+    {
+        _inner.AppendFormatted(value);
+    }
+
+    internal string ToStringAndClear()
+    {
+        return _inner.ToStringAndClear();
+    }
 }
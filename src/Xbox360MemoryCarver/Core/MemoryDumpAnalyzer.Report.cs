@@ -10,6 +10,22 @@ public sealed partial class MemoryDumpAnalyzer
     ///     Generate a markdown report from analysis results.
     /// </summary>
     public static string GenerateReport(AnalysisResult result)
+    {
+        return BuildReport(result).ToString();
+    }
+
+    /// <summary>
+    ///     Generate a brief text summary suitable for console output.
+    /// </summary>
+    public static string GenerateSummary(AnalysisResult result)
+    {
+        return BuildSummary(result).ToString();
+    }
+
+    /// <summary>
+    ///     Build the markdown report without copying it into a string, so it can be written out chunk by chunk.
+    /// </summary>
+    internal static StringBuilder BuildReport(AnalysisResult result)
     {
         var sb = new StringBuilder();
 
@@ -20,13 +36,13 @@ public sealed partial class MemoryDumpAnalyzer
         AppendEsmSection(sb, result);
         AppendFormIdSection(sb, result);
 
-        return sb.ToString();
+        return sb;
     }
 
     /// <summary>
-    ///     Generate a brief text summary suitable for console output.
+    ///     Build the text summary without copying it into a string.
     /// </summary>
-    public static string GenerateSummary(AnalysisResult result)
+    internal static StringBuilder BuildSummary(AnalysisResult result)
     {
         var sb = new StringBuilder();
 
@@ -67,7 +83,7 @@ public sealed partial class MemoryDumpAnalyzer
             sb.AppendLine(CultureInfo.InvariantCulture, $"FormID Map: {result.FormIdMap.Count}");
         }
 
-        return sb.ToString();
+        return sb;
     }
 
     private static void AppendHeader(StringBuilder sb, AnalysisResult result)
@@ -94,10 +110,9 @@ public sealed partial class MemoryDumpAnalyzer
         sb.AppendLine();
 
         // Group by type
-        var byType = result.TypeCounts.OrderByDescending(kv => kv.Value).ToList();
         sb.AppendLine("| File Type | Count |");
         sb.AppendLine("|-----------|-------|");
-        foreach (var (type, count) in byType)
+        foreach (var (type, count) in result.TypeCounts.OrderByDescending(kv => kv.Value))
         {
             sb.AppendLine(CultureInfo.InvariantCulture, $"| {type} | {count} |");
         }
@@ -146,8 +161,21 @@ public sealed partial class MemoryDumpAnalyzer
         sb.AppendLine();
         sb.AppendLine(CultureInfo.InvariantCulture, $"**Total SCDA Records**: {result.ScdaRecords.Count}");
 
-        var withSource = result.ScdaRecords.Count(s => s.HasAssociatedSctx);
-        var withNames = result.ScdaRecords.Count(s => !string.IsNullOrEmpty(s.ScriptName));
+        var withSource = 0;
+        var withNames = 0;
+        foreach (var scda in result.ScdaRecords)
+        {
+            if (scda.HasAssociatedSctx)
+            {
+                withSource++;
+            }
+
+            if (!string.IsNullOrEmpty(scda.ScriptName))
+            {
+                withNames++;
+            }
+        }
+
         sb.AppendLine(CultureInfo.InvariantCulture, $"**With Source (SCTX)**: {withSource}");
         sb.AppendLine(CultureInfo.InvariantCulture, $"**With Script Names**: {withNames}");
         sb.AppendLine();
@@ -1,10 +1,10 @@
-using System.Buffers;
 using System.Diagnostics;
 using System.IO.MemoryMappedFiles;
 using Xbox360MemoryCarver.Core.Formats;
 using Xbox360MemoryCarver.Core.Formats.EsmRecord;
 using Xbox360MemoryCarver.Core.Formats.Scda;
 using Xbox360MemoryCarver.Core.Minidump;
+using Xbox360MemoryCarver.Core.Utils;
 
 namespace Xbox360MemoryCarver.Core;
 
@@ -14,21 +14,56 @@ namespace Xbox360MemoryCarver.Core;
 /// </summary>
 public sealed partial class MemoryDumpAnalyzer
 {
+    /// <summary>
+    ///     The analyzer always searches every registered signature, so one built matcher is shared by all instances.
+    /// </summary>
+    private static readonly Lazy<SignatureMatcher> SharedSignatureMatcher = new(BuildSignatureMatcher);
+
+    /// <summary>
+    ///     Format and signature for each matcher pattern id, so a match dispatches with one array index
+    ///     instead of resolving its signature name through the registry dictionaries.
+    /// </summary>
+    private static readonly Lazy<MatchTarget[]> SharedMatchTargets =
+        new(() => BuildMatchTargets(SharedSignatureMatcher.Value));
+
+    private readonly MatchTarget[] _matchTargets;
     private readonly SignatureMatcher _signatureMatcher;
 
     public MemoryDumpAnalyzer()
     {
-        _signatureMatcher = new SignatureMatcher();
+        _signatureMatcher = SharedSignatureMatcher.Value;
+        _matchTargets = SharedMatchTargets.Value;
+    }
+
+    private static SignatureMatcher BuildSignatureMatcher()
+    {
+        var matcher = new SignatureMatcher();
 
         // Register all signatures from the format registry for analysis
         // (includes all formats for visualization, even those with scanning disabled)
         foreach (var format in FormatRegistry.All)
         foreach (var sig in format.Signatures)
         {
-            _signatureMatcher.AddPattern(sig.Id, sig.MagicBytes);
+            matcher.AddPattern(sig.Id, sig.MagicBytes);
+        }
+
+        matcher.Build();
+        return matcher;
+    }
+
+    private static MatchTarget[] BuildMatchTargets(SignatureMatcher matcher)
+    {
+        var targets = new MatchTarget[matcher.PatternCount];
+        for (var id = 0; id < targets.Length; id++)
+        {
+            var signatureId = matcher.GetPatternName(id);
+            targets[id] = new MatchTarget(
+                signatureId,
+                FormatRegistry.GetBySignatureId(signatureId),
+                FormatRegistry.GetSignature(signatureId));
         }
 
-        _signatureMatcher.Build();
+        return targets;
     }
 
     /// <summary>
@@ -70,7 +105,7 @@ public sealed partial class MemoryDumpAnalyzer
 
         // Phase 2: Parsing matches (50-70%)
         progress?.Report(new AnalysisProgress { Phase = "Parsing", FilesFound = matches.Count, PercentComplete = 50 });
-        await ParseMatchesAsync(accessor, result, matches, moduleOffsets, progress, cancellationToken);
+        await ParseMatchesAsync(accessor, result, matches, _matchTargets, moduleOffsets, progress, cancellationToken);
 
         // Sort all results by offset
         SortCarvedFilesByOffset(result);
@@ -155,22 +190,25 @@ public sealed partial class MemoryDumpAnalyzer
     private static async Task ParseMatchesAsync(
         MemoryMappedViewAccessor accessor,
         AnalysisResult result,
-        List<(string signatureId, long offset)> matches,
+        List<(int PatternId, long Offset)> matches,
+        MatchTarget[] targets,
         HashSet<long> moduleOffsets,
         IProgress<AnalysisProgress>? progress,
         CancellationToken cancellationToken)
     {
         await Task.Run(() =>
         {
+            using var reader = new MemoryMappedSpanReader(accessor, result.FileSize);
             var processed = 0;
-            foreach (var (signatureId, offset) in matches)
+            foreach (var (patternId, offset) in matches)
             {
                 cancellationToken.ThrowIfCancellationRequested();
 
-                if (TryParseMatch(accessor, result, signatureId, offset, moduleOffsets))
+                var target = targets[patternId];
+                if (TryParseMatch(reader, result, target, offset, moduleOffsets))
                 {
-                    result.TypeCounts.TryGetValue(signatureId, out var count);
-                    result.TypeCounts[signatureId] = count + 1;
+                    result.TypeCounts.TryGetValue(target.SignatureId, out var count);
+                    result.TypeCounts[target.SignatureId] = count + 1;
                 }
 
                 processed++;
@@ -180,9 +218,9 @@ public sealed partial class MemoryDumpAnalyzer
     }
 
     private static bool TryParseMatch(
-        MemoryMappedViewAccessor accessor,
+        MemoryMappedSpanReader reader,
         AnalysisResult result,
-        string signatureId,
+        MatchTarget target,
         long offset,
         HashSet<long> moduleOffsets)
     {
@@ -192,20 +230,13 @@ public sealed partial class MemoryDumpAnalyzer
             return false;
         }
 
-        var format = FormatRegistry.GetBySignatureId(signatureId);
-        if (format == null)
+        var (signatureId, format, signature) = target;
+        if (format == null || signature == null)
         {
             return false;
         }
 
-        var signature =
-            format.Signatures.FirstOrDefault(s => s.Id.Equals(signatureId, StringComparison.OrdinalIgnoreCase));
-        if (signature == null)
-        {
-            return false;
-        }
-
-        var (length, fileName) = EstimateFileSizeAndExtractName(accessor, result.FileSize, offset, signatureId, format);
+        var (length, fileName) = EstimateFileSizeAndExtractName(reader, offset, signatureId, format);
         if (length <= 0)
         {
             return false;
@@ -252,26 +283,15 @@ public sealed partial class MemoryDumpAnalyzer
         IProgress<AnalysisProgress>? progress,
         CancellationToken cancellationToken)
     {
-        // Phase 3: SCDA scan (70-80%) - now using memory-mapped access
+        // Phase 3: SCDA + ESM scan (70-90%) - one memory-mapped pass feeds both scanners
         progress?.Report(new AnalysisProgress
             { Phase = "Scripts", FilesFound = result.CarvedFiles.Count, PercentComplete = 70 });
         await Task.Run(() =>
         {
-            var scdaScanResult = ScdaFormat.ScanForRecordsMemoryMapped(accessor, result.FileSize);
-            foreach (var record in scdaScanResult.Records)
-            {
-                record.ScriptName = ScdaExtractor.ExtractScriptNameFromSourcePublic(record.SourceText);
-            }
-
-            result.ScdaRecords = scdaScanResult.Records;
-        }, cancellationToken);
+            var (scdaRecords, esmRecords) = ScanScriptsAndEsmRecords(accessor, result.FileSize);
+            ScdaExtractor.AssignScriptNames(scdaRecords);
 
-        // Phase 4: ESM scan (80-90%) - now using memory-mapped access
-        progress?.Report(new AnalysisProgress
-            { Phase = "ESM Records", FilesFound = result.CarvedFiles.Count, PercentComplete = 80 });
-        await Task.Run(() =>
-        {
-            var esmRecords = EsmRecordFormat.ScanForRecordsMemoryMapped(accessor, result.FileSize);
+            result.ScdaRecords = scdaRecords;
             result.EsmRecords = esmRecords;
         }, cancellationToken);
 
@@ -288,6 +308,77 @@ public sealed partial class MemoryDumpAnalyzer
             cancellationToken);
     }
 
+    /// <summary>
+    ///     Walk the dump once, scanning each chunk for both SCDA and ESM records, instead of paging
+    ///     the whole dump in twice. The overlap covers the larger of the two scanners' needs.
+    ///     Chunks are independent, so they are scanned in parallel and merged in file order; the ESM
+    ///     de-duplication is applied during the merge, keeping the first occurrence as a sequential scan would.
+    /// </summary>
+    private static (List<ScdaRecord> scdaRecords, EsmRecordScanResult esmRecords) ScanScriptsAndEsmRecords(
+        MemoryMappedViewAccessor accessor, long fileSize)
+    {
+        // Both scanners are fed the same chunks; take the smaller of their tuned chunk sizes
+        const int chunkSize = ScdaFormat.ScanChunkSize < EsmRecordFormat.ScanChunkSize
+            ? ScdaFormat.ScanChunkSize
+            : EsmRecordFormat.ScanChunkSize;
+        const int overlapSize = ScdaFormat.ScanOverlapSize > EsmRecordFormat.ScanOverlapSize
+            ? ScdaFormat.ScanOverlapSize
+            : EsmRecordFormat.ScanOverlapSize;
+
+        var chunkCount = (int)((fileSize + chunkSize - 1) / chunkSize);
+        var scdaChunks = new List<ScdaRecord>[chunkCount];
+        var esmChunks = new EsmRecordScanResult[chunkCount];
+
+        // Workers scan their chunk in place in the mapping; nothing is copied into managed buffers
+        using (var reader = new MemoryMappedSpanReader(accessor, fileSize))
+        {
+            Parallel.For(0, chunkCount, new ParallelOptions { MaxDegreeOfParallelism = Environment.ProcessorCount },
+                chunk =>
+                {
+                    var offset = (long)chunk * chunkSize;
+                    var span = reader.GetSpan(offset, (int)Math.Min(chunkSize + overlapSize, fileSize - offset));
+
+                    var scda = new List<ScdaRecord>();
+                    var esm = new EsmRecordScanResult();
+                    ScdaFormat.ScanChunk(span, offset, chunkSize, fileSize, scda);
+                    EsmRecordFormat.ScanChunk(span, offset, chunkSize, fileSize, esm, [], []);
+
+                    scdaChunks[chunk] = scda;
+                    esmChunks[chunk] = esm;
+                });
+        }
+
+        var scdaRecords = new List<ScdaRecord>();
+        var esmRecords = new EsmRecordScanResult();
+        var seenEdids = new HashSet<string>();
+        var seenFormIds = new HashSet<uint>();
+        for (var chunk = 0; chunk < chunkCount; chunk++)
+        {
+            scdaRecords.AddRange(scdaChunks[chunk]);
+
+            var esm = esmChunks[chunk];
+            esmRecords.GameSettings.AddRange(esm.GameSettings);
+            esmRecords.ScriptSources.AddRange(esm.ScriptSources);
+            foreach (var edid in esm.EditorIds)
+            {
+                if (seenEdids.Add(edid.Name))
+                {
+                    esmRecords.EditorIds.Add(edid);
+                }
+            }
+
+            foreach (var scro in esm.FormIdReferences)
+            {
+                if (seenFormIds.Add(scro.FormId))
+                {
+                    esmRecords.FormIdReferences.Add(scro);
+                }
+            }
+        }
+
+        return (scdaRecords, esmRecords);
+    }
+
     private static void AddModulesFromMinidump(AnalysisResult result, MinidumpInfo minidumpInfo)
     {
         foreach (var module in minidumpInfo.Modules)
@@ -321,60 +412,39 @@ public sealed partial class MemoryDumpAnalyzer
         }
     }
 
-    private List<(string SignatureId, long Offset)> FindAllMatches(
+    private List<(int PatternId, long Offset)> FindAllMatches(
         MemoryMappedViewAccessor accessor,
         long fileSize,
         IProgress<AnalysisProgress>? progress)
     {
         const int chunkSize = 64 * 1024 * 1024; // 64MB chunks
-        var maxPatternLength = _signatureMatcher.MaxPatternLength;
 
-        var allMatches = new List<(string SignatureId, long Offset)>();
-        var buffer = ArrayPool<byte>.Shared.Rent(chunkSize + maxPatternLength);
-        var progressData = new AnalysisProgress { TotalBytes = fileSize };
+        // Scan windows directly over the mapped pages instead of copying each chunk (and its overlap) out first;
+        // windows are searched in parallel
+        using var reader = new MemoryMappedSpanReader(accessor, fileSize);
+        var allMatches = _signatureMatcher.SearchMapped(reader, chunkSize,
+            progress == null
+                ? null
+                : scanned => progress.Report(new AnalysisProgress { TotalBytes = fileSize, BytesProcessed = scanned }));
 
-        try
-        {
-            long offset = 0;
-            while (offset < fileSize)
-            {
-                var toRead = (int)Math.Min(chunkSize + maxPatternLength, fileSize - offset);
-                accessor.ReadArray(offset, buffer, 0, toRead);
-
-                var span = buffer.AsSpan(0, toRead);
-                var matches = _signatureMatcher.Search(span, offset);
-
-                foreach (var (name, _, position) in matches)
-                {
-                    allMatches.Add((name, position));
-                }
-
-                offset += chunkSize;
-
-                progressData.BytesProcessed = Math.Min(offset, fileSize);
-                progressData.FilesFound = allMatches.Count;
-                progress?.Report(progressData);
-            }
-        }
-        finally
-        {
-            ArrayPool<byte>.Shared.Return(buffer);
-        }
+        progress?.Report(new AnalysisProgress
+            { TotalBytes = fileSize, BytesProcessed = fileSize, FilesFound = allMatches.Count });
 
         // Sort by offset and deduplicate
         return allMatches
-            .DistinctBy(m => m.Offset)
-            .OrderBy(m => m.Offset)
+            .DistinctBy(m => m.Position)
+            .OrderBy(m => m.Position)
             .ToList();
     }
 
     private static (long length, string? fileName) EstimateFileSizeAndExtractName(
-        MemoryMappedViewAccessor accessor,
-        long fileSize,
+        MemoryMappedSpanReader reader,
         long offset,
         string signatureId,
         IFileFormat format)
     {
+        var fileSize = reader.Length;
+
         // For DDX files, we need to read some data before the signature to find the path
         // Read up to 512 bytes before and the header after
         const int preReadSize = 512;
@@ -390,56 +460,47 @@ public sealed partial class MemoryDumpAnalyzer
         var headerSize = (int)Math.Min(headerScanSize, fileSize - offset);
         var totalRead = actualPreRead + headerSize;
 
-        var buffer = ArrayPool<byte>.Shared.Rent(totalRead);
-        try
-        {
-            accessor.ReadArray(readStart, buffer, 0, totalRead);
-            var span = buffer.AsSpan(0, totalRead);
+        var span = reader.GetSpan(readStart, totalRead);
 
-            // The signature starts at actualPreRead offset in our buffer
-            var sigOffset = actualPreRead;
+        // The signature starts at actualPreRead offset in our buffer
+        var sigOffset = actualPreRead;
 
-            // Use format module for accurate size estimation
-            var parseResult = format.Parse(span, sigOffset);
-            if (parseResult != null)
+        // Use format module for accurate size estimation
+        var parseResult = format.Parse(span, sigOffset);
+        if (parseResult != null)
+        {
+            var estimatedSize = parseResult.EstimatedSize;
+            if (estimatedSize >= format.MinSize && estimatedSize <= format.MaxSize)
             {
-                var estimatedSize = parseResult.EstimatedSize;
-                if (estimatedSize >= format.MinSize && estimatedSize <= format.MaxSize)
+                var length = Math.Min(estimatedSize, (int)(fileSize - offset));
+
+                // Extract filename for display in the file table
+                // Priority: fileName > scriptName > texturePath filename portion
+                string? fileName = null;
+
+                if (parseResult.Metadata.TryGetValue("fileName", out var fileNameObj) &&
+                    fileNameObj is string fn && !string.IsNullOrEmpty(fn))
                 {
-                    var length = Math.Min(estimatedSize, (int)(fileSize - offset));
-
-                    // Extract filename for display in the file table
-                    // Priority: fileName > scriptName > texturePath filename portion
-                    string? fileName = null;
-
-                    if (parseResult.Metadata.TryGetValue("fileName", out var fileNameObj) &&
-                        fileNameObj is string fn && !string.IsNullOrEmpty(fn))
-                    {
-                        fileName = fn;
-                    }
-                    else if (parseResult.Metadata.TryGetValue("scriptName", out var scriptNameObj) &&
-                             scriptNameObj is string sn && !string.IsNullOrEmpty(sn))
-                    {
-                        fileName = sn;
-                    }
-                    else if (parseResult.Metadata.TryGetValue("texturePath", out var pathObj) &&
-                             pathObj is string texturePath)
-                        // Fall back to extracting filename from path
-                    {
-                        fileName = Path.GetFileName(texturePath);
-                    }
-
-                    return (length, fileName);
+                    fileName = fn;
+                }
+                else if (parseResult.Metadata.TryGetValue("scriptName", out var scriptNameObj) &&
+                         scriptNameObj is string sn && !string.IsNullOrEmpty(sn))
+                {
+                    fileName = sn;
+                }
+                else if (parseResult.Metadata.TryGetValue("texturePath", out var pathObj) &&
+                         pathObj is string texturePath)
+                    // Fall back to extracting filename from path
+                {
+                    fileName = Path.GetFileName(texturePath);
                 }
-            }
 
-            // Format returned null - invalid file, skip it
-            return (0, null);
-        }
-        finally
-        {
-            ArrayPool<byte>.Shared.Return(buffer);
+                return (length, fileName);
+            }
         }
+
+        // Format returned null - invalid file, skip it
+        return (0, null);
     }
 
     #region Build Type Detection
@@ -490,4 +551,9 @@ public sealed partial class MemoryDumpAnalyzer
     }
 
     #endregion
+
+    /// <summary>
+    ///     What a matcher pattern id resolves to; the format or signature is null if the registry lacks it.
+    /// </summary>
+    private readonly record struct MatchTarget(string SignatureId, IFileFormat? Format, FormatSignature? Signature);
 }
@@ -2,6 +2,7 @@ using System.IO.MemoryMappedFiles;
 using Xbox360MemoryCarver.Core.Carving;
 using Xbox360MemoryCarver.Core.Formats.Scda;
 using Xbox360MemoryCarver.Core.Minidump;
+using Xbox360MemoryCarver.Core.Utils;
 
 namespace Xbox360MemoryCarver.Core;
 
@@ -11,9 +12,6 @@ namespace Xbox360MemoryCarver.Core;
 /// </summary>
 public static class MemoryDumpExtractor
 {
-    // Cached invalid filename characters to avoid repeated array allocation
-    private static readonly HashSet<char> InvalidFileNameChars = [.. Path.GetInvalidFileNameChars()];
-
     /// <summary>
     ///     Extract files from a memory dump based on prior analysis.
     /// </summary>
@@ -26,8 +24,13 @@ public static class MemoryDumpExtractor
 
         Directory.CreateDirectory(options.OutputPath);
 
+        // Map the dump once and share the view between module, signature and script extraction
+        var fileSize = new FileInfo(filePath).Length;
+        using var mmf = MemoryMappedFile.CreateFromFile(filePath, FileMode.Open, null, 0, MemoryMappedFileAccess.Read);
+        using var accessor = mmf.CreateViewAccessor(0, fileSize, MemoryMappedFileAccess.Read);
+
         // Extract modules from minidump first
-        var (moduleCount, moduleOffsets) = await ExtractModulesAsync(filePath, options, progress);
+        var (moduleCount, moduleOffsets) = ExtractModules(filePath, accessor, fileSize, options, progress);
 
         // Create carver with options for signature-based extraction
         using var carver = new MemoryCarver(
@@ -36,7 +39,9 @@ public static class MemoryDumpExtractor
             options.ConvertDdx,
             options.FileTypes,
             options.Verbose,
-            options.SaveAtlas);
+            options.SaveAtlas,
+            options.ExtractScripts,
+            options.DeduplicateContent);
 
         // Progress wrapper
         var carverProgress = progress != null
@@ -48,7 +53,7 @@ public static class MemoryDumpExtractor
             : null;
 
         // Perform extraction using the full carver
-        var entries = await carver.CarveDumpAsync(filePath, carverProgress);
+        var entries = await carver.CarveDumpAsync(filePath, accessor, fileSize, carverProgress);
 
         // Build set of extracted offsets for UI update
         var extractedOffsets = entries
@@ -62,7 +67,8 @@ public static class MemoryDumpExtractor
         var scriptResult = new ScdaExtractionResult();
         if (options.ExtractScripts)
         {
-            scriptResult = await ExtractScriptsAsync(filePath, options, progress);
+            scriptResult = await ExtractScriptsAsync(filePath, accessor, fileSize, carver.ScriptSignatureOffsets,
+                options, progress);
         }
 
         // Return summary
@@ -74,6 +80,7 @@ public static class MemoryDumpExtractor
             XurConverted = carver.XurConvertedCount,
             XurFailed = carver.XurConvertFailedCount,
             TypeCounts = carver.Stats.ToDictionary(kvp => kvp.Key, kvp => kvp.Value),
+            DuplicatesSkipped = carver.DuplicatesSkipped,
             ExtractedOffsets = extractedOffsets,
             FailedConversionOffsets = failedConversionOffsets,
             ExtractedModuleOffsets = moduleOffsets,
@@ -88,6 +95,9 @@ public static class MemoryDumpExtractor
     /// </summary>
     private static async Task<ScdaExtractionResult> ExtractScriptsAsync(
         string filePath,
+        MemoryMappedViewAccessor accessor,
+        long fileSize,
+        IReadOnlyList<long> signatureOffsets,
         ExtractionOptions options,
         IProgress<ExtractionProgress>? progress)
     {
@@ -97,12 +107,9 @@ public static class MemoryDumpExtractor
             CurrentOperation = "Scanning for compiled scripts..."
         });
 
-        // Read the entire dump for SCDA scanning
-        var dumpData = await File.ReadAllBytesAsync(filePath);
-
         // Create scripts output directory
         var dumpName = Path.GetFileNameWithoutExtension(filePath);
-        var sanitizedName = SanitizeFilename(dumpName);
+        var sanitizedName = BinaryUtils.SanitizeFilename(dumpName);
         var scriptsDir = Path.Combine(options.OutputPath, sanitizedName, "scripts");
 
         var stringProgress = progress != null
@@ -113,7 +120,9 @@ public static class MemoryDumpExtractor
             }))
             : null;
 
-        var result = await ScdaExtractor.ExtractGroupedAsync(dumpData, scriptsDir, stringProgress);
+        // SCDA signatures were already located during the carving pass, so only those offsets are parsed
+        var result = await ScdaExtractor.ExtractGroupedAsync(accessor, fileSize, signatureOffsets, scriptsDir,
+            stringProgress);
 
         progress?.Report(new ExtractionProgress
         {
@@ -126,9 +135,13 @@ public static class MemoryDumpExtractor
 
     /// <summary>
     ///     Extract modules from minidump metadata.
+    ///     Module images are written straight from the mapped view into a preallocated file,
+    ///     without copying each image into a managed buffer first.
     /// </summary>
-    private static async Task<(int count, HashSet<long> offsets)> ExtractModulesAsync(
+    private static (int count, HashSet<long> offsets) ExtractModules(
         string filePath,
+        MemoryMappedViewAccessor accessor,
+        long fileSize,
         ExtractionOptions options,
         IProgress<ExtractionProgress>? progress)
     {
@@ -137,7 +150,7 @@ public static class MemoryDumpExtractor
         // Modules are always extracted from minidump metadata
         // (they don't use signature scanning, so they bypass the file type filter)
 
-        var minidumpInfo = MinidumpParser.Parse(filePath);
+        var minidumpInfo = MinidumpParser.Parse(accessor, fileSize);
         if (!minidumpInfo.IsValid)
         {
             if (options.Verbose)
@@ -166,15 +179,12 @@ public static class MemoryDumpExtractor
         // Create modules output directory matching the MemoryCarver pattern:
         // {output_dir}/{dmp_filename}/modules/
         var dumpName = Path.GetFileNameWithoutExtension(filePath);
-        var sanitizedName = SanitizeFilename(dumpName);
+        var sanitizedName = BinaryUtils.SanitizeFilename(dumpName);
         var modulesDir = Path.Combine(options.OutputPath, sanitizedName, "modules");
         Directory.CreateDirectory(modulesDir);
 
         var extractedCount = 0;
-        var fileInfo = new FileInfo(filePath);
-
-        using var mmf = MemoryMappedFile.CreateFromFile(filePath, FileMode.Open, null, 0, MemoryMappedFileAccess.Read);
-        using var accessor = mmf.CreateViewAccessor(0, fileInfo.Length, MemoryMappedFileAccess.Read);
+        using var reader = new MemoryMappedSpanReader(accessor, fileSize);
 
         foreach (var module in minidumpInfo.Modules)
         {
@@ -203,11 +213,13 @@ public static class MemoryDumpExtractor
 
             try
             {
-                var size = (int)Math.Min(fileRange.Value.size, fileInfo.Length - fileRange.Value.fileOffset);
-                var buffer = new byte[size];
-                accessor.ReadArray(fileRange.Value.fileOffset, buffer, 0, size);
+                var size = (int)Math.Min(fileRange.Value.size, fileSize - fileRange.Value.fileOffset);
+                using (var handle = File.OpenHandle(outputPath, FileMode.Create, FileAccess.Write,
+                           preallocationSize: size))
+                {
+                    RandomAccess.Write(handle, reader.GetSpan(fileRange.Value.fileOffset, size), 0);
+                }
 
-                await File.WriteAllBytesAsync(outputPath, buffer);
                 extractedCount++;
                 extractedOffsets.Add(fileRange.Value.fileOffset);
 
@@ -234,20 +246,6 @@ public static class MemoryDumpExtractor
 
         return (extractedCount, extractedOffsets);
     }
-
-    /// <summary>
-    ///     Sanitize a filename by removing invalid characters.
-    /// </summary>
-    private static string SanitizeFilename(string name)
-    {
-        var sanitized = new char[name.Length];
-        for (var i = 0; i < name.Length; i++)
-        {
-            sanitized[i] = InvalidFileNameChars.Contains(name[i]) ? '_' : name[i];
-        }
-
-        return new string(sanitized);
-    }
 }
 
 /// <summary>
@@ -263,6 +261,11 @@ public class ExtractionSummary
     public int ModulesExtracted { get; init; }
     public int ScriptsExtracted { get; init; }
     public int ScriptQuestsGrouped { get; init; }
+
+    /// <summary>
+    ///     Carved files not written because an earlier offset held identical bytes.
+    /// </summary>
+    public int DuplicatesSkipped { get; init; }
     public Dictionary<string, int> TypeCounts { get; init; } = [];
     public HashSet<long> ExtractedOffsets { get; init; } = [];
 
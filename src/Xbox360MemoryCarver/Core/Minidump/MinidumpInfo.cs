@@ -5,11 +5,19 @@ namespace Xbox360MemoryCarver.Core.Minidump;
 /// </summary>
 public class MinidumpInfo
 {
+    private RegionLookup? _regionsByFileOffset;
+    private RegionLookup? _regionsByVirtualAddress;
+
     public bool IsValid { get; init; }
     public ushort ProcessorArchitecture { get; set; }
     public uint NumberOfStreams { get; init; }
     public List<MinidumpModule> Modules { get; init; } = [];
-    public List<MinidumpMemoryRegion> MemoryRegions { get; init; } = [];
+
+    /// <summary>
+    ///     Captured memory ranges, in the order the dump lists them. Read-only, so the sorted lookups
+    ///     built on first use never go stale.
+    /// </summary>
+    public IReadOnlyList<MinidumpMemoryRegion> MemoryRegions { get; init; } = [];
 
     /// <summary>
     ///     True if this is an Xbox 360 (PowerPC) minidump.
@@ -38,16 +46,15 @@ public class MinidumpInfo
     /// </summary>
     public long? FileOffsetToVirtualAddress(long fileOffset)
     {
-        foreach (var region in MemoryRegions)
+        var lookup = _regionsByFileOffset ??= new RegionLookup(MemoryRegions, static r => r.FileOffset);
+        var index = lookup.Find(fileOffset);
+        if (index < 0)
         {
-            if (fileOffset >= region.FileOffset && fileOffset < region.FileOffset + region.Size)
-            {
-                var offsetInRegion = fileOffset - region.FileOffset;
-                return region.VirtualAddress + offsetInRegion;
-            }
+            return null;
         }
 
-        return null;
+        var region = lookup.Regions[index];
+        return region.VirtualAddress + (fileOffset - region.FileOffset);
     }
 
     /// <summary>
@@ -55,16 +62,15 @@ public class MinidumpInfo
     /// </summary>
     public long? VirtualAddressToFileOffset(long virtualAddress)
     {
-        foreach (var region in MemoryRegions)
+        var lookup = GetRegionsByVirtualAddress();
+        var index = lookup.Find(virtualAddress);
+        if (index < 0)
         {
-            if (virtualAddress >= region.VirtualAddress && virtualAddress < region.VirtualAddress + region.Size)
-            {
-                var offsetInRegion = virtualAddress - region.VirtualAddress;
-                return region.FileOffset + offsetInRegion;
-            }
+            return null;
         }
 
-        return null;
+        var region = lookup.Regions[index];
+        return region.FileOffset + (virtualAddress - region.VirtualAddress);
     }
 
     /// <summary>
@@ -72,45 +78,43 @@ public class MinidumpInfo
     /// </summary>
     public (long fileOffset, long size)? GetModuleFileRange(MinidumpModule module)
     {
-        var moduleStart = module.BaseAddress;
-
-        foreach (var region in MemoryRegions)
+        var regions = GetRegionsByVirtualAddress();
+        var index = regions.Find(module.BaseAddress);
+        if (index < 0)
         {
-            var regionStart = region.VirtualAddress;
-            var regionEnd = region.VirtualAddress + region.Size;
-
-            if (moduleStart >= regionStart && moduleStart < regionEnd)
-            {
-                var offsetInRegion = moduleStart - regionStart;
-                var fileOffset = region.FileOffset + offsetInRegion;
-                var capturedSize = CalculateContiguousCapturedSize(module, region);
-                return (fileOffset, capturedSize);
-            }
+            return null;
         }
 
-        return null;
+        var region = regions.Regions[index];
+        var fileOffset = region.FileOffset + (module.BaseAddress - region.VirtualAddress);
+        var capturedSize = CalculateContiguousCapturedSize(module, regions.Regions, index);
+        return (fileOffset, capturedSize);
     }
 
-    private long CalculateContiguousCapturedSize(MinidumpModule module, MinidumpMemoryRegion startRegion)
+    private static long CalculateContiguousCapturedSize(
+        MinidumpModule module,
+        MinidumpMemoryRegion[] regions,
+        int startIndex)
     {
         var moduleStart = module.BaseAddress;
         var moduleEnd = module.BaseAddress + module.Size;
 
+        var startRegion = regions[startIndex];
         var regionEnd = startRegion.VirtualAddress + startRegion.Size;
         var capturedEnd = Math.Min(regionEnd, moduleEnd);
         var totalCaptured = capturedEnd - moduleStart;
 
         var currentVa = regionEnd;
-        // Pre-sort regions once rather than using LINQ OrderBy in iteration
-        var sortedRegions = GetSortedRegionsAfter(regionEnd);
-        foreach (var region in sortedRegions)
+        for (var i = startIndex + 1; i < regions.Length && currentVa < moduleEnd; i++)
         {
-            if (region.VirtualAddress != currentVa)
+            var region = regions[i];
+            if (region.VirtualAddress < regionEnd)
             {
-                break;
+                // Empty or overlapping entries sorted before the end of the starting region
+                continue;
             }
 
-            if (region.VirtualAddress >= moduleEnd)
+            if (region.VirtualAddress != currentVa)
             {
                 break;
             }
@@ -118,33 +122,80 @@ public class MinidumpInfo
             var regionCapturedEnd = Math.Min(region.VirtualAddress + region.Size, moduleEnd);
             totalCaptured += regionCapturedEnd - region.VirtualAddress;
             currentVa = region.VirtualAddress + region.Size;
-
-            if (currentVa >= moduleEnd)
-            {
-                break;
-            }
         }
 
         return totalCaptured;
     }
 
+    private RegionLookup GetRegionsByVirtualAddress()
+    {
+        return _regionsByVirtualAddress ??= new RegionLookup(MemoryRegions, static r => r.VirtualAddress);
+    }
+
     /// <summary>
-    ///     Get memory regions after a given virtual address, sorted by address.
-    ///     Used to avoid repeated LINQ Where().OrderBy() allocations.
+    ///     Regions sorted by one key (virtual address or file offset), built once and reused for every lookup.
+    ///     A running maximum of region ends lets a lookup walk back past empty, nested or overlapping entries
+    ///     to the region that actually contains the key.
     /// </summary>
-    private List<MinidumpMemoryRegion> GetSortedRegionsAfter(long minVirtualAddress)
+    private sealed class RegionLookup
     {
-        // Sort once and filter - more efficient than Where().OrderBy() which allocates
-        var sorted = new List<MinidumpMemoryRegion>();
-        foreach (var r in MemoryRegions)
+        private readonly long[] _maxEnds;
+        private readonly int[] _listOrder;
+        private readonly long[] _starts;
+
+        public RegionLookup(IReadOnlyList<MinidumpMemoryRegion> regions, Func<MinidumpMemoryRegion, long> key)
         {
-            if (r.VirtualAddress >= minVirtualAddress)
+            _listOrder = [.. Enumerable.Range(0, regions.Count)];
+            Array.Sort(_listOrder, (a, b) =>
             {
-                sorted.Add(r);
+                var byKey = key(regions[a]).CompareTo(key(regions[b]));
+                return byKey != 0 ? byKey : a.CompareTo(b);
+            });
+
+            Regions = [.. _listOrder.Select(i => regions[i])];
+            _starts = [.. Regions.Select(key)];
+            _maxEnds = new long[Regions.Length];
+            for (var i = 0; i < Regions.Length; i++)
+            {
+                var end = _starts[i] + Regions[i].Size;
+                _maxEnds[i] = i > 0 ? Math.Max(_maxEnds[i - 1], end) : end;
             }
         }
 
-        sorted.Sort((a, b) => a.VirtualAddress.CompareTo(b.VirtualAddress));
-        return sorted;
+        public MinidumpMemoryRegion[] Regions { get; }
+
+        /// <summary>
+        ///     Index into <see cref="Regions" /> of the region containing the key, or -1. When several regions
+        ///     contain it, the one listed first in the dump wins, as with a linear scan of the list.
+        /// </summary>
+        public int Find(long value)
+        {
+            // Last region starting at or before the value
+            int lo = 0, hi = _starts.Length - 1, candidate = -1;
+            while (lo <= hi)
+            {
+                var mid = lo + (hi - lo) / 2;
+                if (_starts[mid] <= value)
+                {
+                    candidate = mid;
+                    lo = mid + 1;
+                }
+                else
+                {
+                    hi = mid - 1;
+                }
+            }
+
+            var found = -1;
+            for (var i = candidate; i >= 0 && _maxEnds[i] > value; i--)
+            {
+                if (value < _starts[i] + Regions[i].Size && (found < 0 || _listOrder[i] < _listOrder[found]))
+                {
+                    found = i;
+                }
+            }
+
+            return found;
+        }
     }
 }
@@ -19,8 +19,10 @@ public class MinidumpModule
 
 /// <summary>
 ///     Represents a memory region in the minidump.
+///     A value type: dumps carry thousands of descriptors, which are stored inline in the region list
+///     rather than as one heap object each.
 /// </summary>
-public class MinidumpMemoryRegion
+public readonly record struct MinidumpMemoryRegion
 {
     public long VirtualAddress { get; init; }
     public long Size { get; init; }
@@ -1,4 +1,6 @@
 using System.Buffers;
+using System.IO.MemoryMappedFiles;
+using System.Runtime.InteropServices;
 using System.Text;
 using Xbox360MemoryCarver.Core.Utils;
 
@@ -8,12 +10,23 @@ namespace Xbox360MemoryCarver.Core.Minidump;
 ///     Parses Microsoft Minidump files to extract module information.
 ///     Reference: https://docs.microsoft.com/en-us/windows/win32/api/minidumpapiset/
 /// </summary>
+/// <remarks>
+///     Each structure (header, stream directory, module table, memory descriptors) is read in one call
+///     at its absolute RVA and reinterpreted as fixed-layout records, rather than issuing a seek and a
+///     small read per field.
+/// </remarks>
 public static class MinidumpParser
 {
     private const uint ModuleListStream = 4;
     private const uint SystemInfoStream = 7;
     private const uint Memory64ListStream = 9;
 
+    private const int HeaderSize = 32;
+    private const int DirectoryEntrySize = 12;
+    private const int ModuleEntrySize = 108;
+    private const int MemoryDescriptorSize = 16;
+    private const int MaxModuleNameBytes = 520;
+
     private static readonly byte[] MinidumpSignature = "MDMP"u8.ToArray();
 
     /// <summary>
@@ -21,8 +34,24 @@ public static class MinidumpParser
     /// </summary>
     public static MinidumpInfo Parse(string filePath)
     {
-        using var fs = new FileStream(filePath, FileMode.Open, FileAccess.Read, FileShare.Read);
-        return Parse(fs);
+        var fileSize = new FileInfo(filePath).Length;
+        if (fileSize < HeaderSize)
+        {
+            return new MinidumpInfo { IsValid = false };
+        }
+
+        using var mmf = MemoryMappedFile.CreateFromFile(filePath, FileMode.Open, null, 0, MemoryMappedFileAccess.Read);
+        using var accessor = mmf.CreateViewAccessor(0, fileSize, MemoryMappedFileAccess.Read);
+        return Parse(accessor, fileSize);
+    }
+
+    /// <summary>
+    ///     Parse a minidump from an already mapped view of the file.
+    /// </summary>
+    public static MinidumpInfo Parse(MemoryMappedViewAccessor accessor, long fileSize)
+    {
+        using var reader = new MemoryMappedSpanReader(accessor, fileSize);
+        return Parse(new MappedSource(reader));
     }
 
     /// <summary>
@@ -30,75 +59,65 @@ public static class MinidumpParser
     /// </summary>
     public static MinidumpInfo Parse(Stream stream)
     {
-        var headerBuffer = new byte[32];
-        if (stream.Read(headerBuffer, 0, 32) < 32)
+        return Parse(new StreamSource(stream));
+    }
+
+    private static MinidumpInfo Parse(IDumpSource source)
+    {
+        Span<byte> header = stackalloc byte[HeaderSize];
+        if (!source.TryRead(0, header))
         {
             return new MinidumpInfo { IsValid = false };
         }
 
-        if (!headerBuffer.AsSpan(0, 4).SequenceEqual(MinidumpSignature))
+        if (!header[..4].SequenceEqual(MinidumpSignature))
         {
             return new MinidumpInfo { IsValid = false };
         }
 
-        var numberOfStreams = BinaryUtils.ReadUInt32LE(headerBuffer, 8);
-        var streamDirectoryRva = BinaryUtils.ReadUInt32LE(headerBuffer, 12);
+        var numberOfStreams = BinaryUtils.ReadUInt32LE(header, 8);
+        var streamDirectoryRva = BinaryUtils.ReadUInt32LE(header, 12);
 
         if (numberOfStreams == 0 || numberOfStreams > 100 || streamDirectoryRva == 0)
         {
             return new MinidumpInfo { IsValid = false };
         }
 
-        var directorySize = (int)(numberOfStreams * 12);
-        var directoryBuffer = ArrayPool<byte>.Shared.Rent(directorySize);
-        try
+        Span<byte> directory = stackalloc byte[(int)numberOfStreams * DirectoryEntrySize];
+        if (!source.TryRead(streamDirectoryRva, directory))
         {
-            stream.Seek(streamDirectoryRva, SeekOrigin.Begin);
-            if (stream.Read(directoryBuffer, 0, directorySize) < directorySize)
-            {
-                return new MinidumpInfo { IsValid = false };
-            }
+            return new MinidumpInfo { IsValid = false };
+        }
 
-            var result = new MinidumpInfo { IsValid = true, NumberOfStreams = numberOfStreams };
+        var regions = new List<MinidumpMemoryRegion>();
+        var result = new MinidumpInfo { IsValid = true, NumberOfStreams = numberOfStreams, MemoryRegions = regions };
 
-            for (var i = 0; i < numberOfStreams; i++)
+        foreach (ref readonly var entry in MemoryMarshal.Cast<byte, DirectoryEntryRecord>(directory))
+        {
+            switch (entry.StreamType)
             {
-                var entryOffset = i * 12;
-                var streamType = BinaryUtils.ReadUInt32LE(directoryBuffer, entryOffset);
-                var rva = BinaryUtils.ReadUInt32LE(directoryBuffer, entryOffset + 8);
-
-                switch (streamType)
-                {
-                    case SystemInfoStream: ParseSystemInfo(stream, rva, result); break;
-                    case ModuleListStream: ParseModuleList(stream, rva, result); break;
-                    case Memory64ListStream: ParseMemory64List(stream, rva, result); break;
-                }
+                case SystemInfoStream: ParseSystemInfo(source, entry.Rva, result); break;
+                case ModuleListStream: ParseModuleList(source, entry.Rva, result); break;
+                case Memory64ListStream: ParseMemory64List(source, entry.Rva, regions); break;
             }
-
-            return result;
-        }
-        finally
-        {
-            ArrayPool<byte>.Shared.Return(directoryBuffer);
         }
+
+        return result;
     }
 
-    private static void ParseSystemInfo(Stream stream, uint rva, MinidumpInfo result)
+    private static void ParseSystemInfo(IDumpSource source, uint rva, MinidumpInfo result)
     {
-        var buffer = new byte[4];
-        stream.Seek(rva, SeekOrigin.Begin);
-        if (stream.Read(buffer, 0, 4) >= 4)
+        Span<byte> buffer = stackalloc byte[4];
+        if (source.TryRead(rva, buffer))
         {
             result.ProcessorArchitecture = BinaryUtils.ReadUInt16LE(buffer);
         }
     }
 
-    private static void ParseModuleList(Stream stream, uint rva, MinidumpInfo result)
+    private static void ParseModuleList(IDumpSource source, uint rva, MinidumpInfo result)
     {
-        stream.Seek(rva, SeekOrigin.Begin);
-
-        var countBuffer = new byte[4];
-        if (stream.Read(countBuffer, 0, 4) < 4)
+        Span<byte> countBuffer = stackalloc byte[4];
+        if (!source.TryRead(rva, countBuffer))
         {
             return;
         }
@@ -109,21 +128,24 @@ public static class MinidumpParser
             return;
         }
 
-        const int moduleEntrySize = 108;
-        var modulesBuffer = ArrayPool<byte>.Shared.Rent((int)(numberOfModules * moduleEntrySize));
+        var bytesToRead = (int)(numberOfModules * ModuleEntrySize);
+        var modulesBuffer = ArrayPool<byte>.Shared.Rent(bytesToRead);
 
         try
         {
-            var bytesToRead = (int)(numberOfModules * moduleEntrySize);
-            if (stream.Read(modulesBuffer, 0, bytesToRead) < bytesToRead)
+            var modules = modulesBuffer.AsSpan(0, bytesToRead);
+            if (!source.TryRead(rva + 4L, modules))
             {
                 return;
             }
 
-            for (var i = 0; i < numberOfModules; i++)
+            // Reinterpret the whole table as fixed-layout records instead of decoding each field by offset
+            var records = MemoryMarshal.Cast<byte, ModuleRecord>(modules);
+            result.Modules.EnsureCapacity(result.Modules.Count + records.Length);
+
+            foreach (ref readonly var record in records)
             {
-                var offset = i * moduleEntrySize;
-                var module = ParseModule(stream, modulesBuffer, offset);
+                var module = ParseModule(source, in record);
                 if (module != null)
                 {
                     result.Modules.Add(module);
@@ -136,12 +158,10 @@ public static class MinidumpParser
         }
     }
 
-    private static void ParseMemory64List(Stream stream, uint rva, MinidumpInfo result)
+    private static void ParseMemory64List(IDumpSource source, uint rva, List<MinidumpMemoryRegion> regions)
     {
-        stream.Seek(rva, SeekOrigin.Begin);
-
-        var headerBuffer = new byte[16];
-        if (stream.Read(headerBuffer, 0, 16) < 16)
+        Span<byte> headerBuffer = stackalloc byte[16];
+        if (!source.TryRead(rva, headerBuffer))
         {
             return;
         }
@@ -154,28 +174,28 @@ public static class MinidumpParser
             return;
         }
 
-        const int descriptorSize = 16;
-        var descriptorsSize = (int)(numberOfRanges * descriptorSize);
+        var descriptorsSize = (int)numberOfRanges * MemoryDescriptorSize;
         var descriptorsBuffer = ArrayPool<byte>.Shared.Rent(descriptorsSize);
 
         try
         {
-            if (stream.Read(descriptorsBuffer, 0, descriptorsSize) < descriptorsSize)
+            var descriptors = descriptorsBuffer.AsSpan(0, descriptorsSize);
+            if (!source.TryRead(rva + 16L, descriptors))
             {
                 return;
             }
 
             var currentFileOffset = baseRva;
+            var records = MemoryMarshal.Cast<byte, MemoryDescriptorRecord>(descriptors);
+            regions.EnsureCapacity(regions.Count + records.Length);
 
-            for (var i = 0; i < (int)numberOfRanges; i++)
+            foreach (ref readonly var record in records)
             {
-                var offset = i * descriptorSize;
-                var virtualAddress = (long)BinaryUtils.ReadUInt64LE(descriptorsBuffer, offset);
-                var regionSize = (long)BinaryUtils.ReadUInt64LE(descriptorsBuffer, offset + 8);
+                var regionSize = (long)record.DataSize;
 
-                result.MemoryRegions.Add(new MinidumpMemoryRegion
+                regions.Add(new MinidumpMemoryRegion
                 {
-                    VirtualAddress = virtualAddress,
+                    VirtualAddress = (long)record.StartOfMemoryRange,
                     Size = regionSize,
                     FileOffset = currentFileOffset
                 });
@@ -189,20 +209,14 @@ public static class MinidumpParser
         }
     }
 
-    private static MinidumpModule? ParseModule(Stream stream, byte[] buffer, int offset)
+    private static MinidumpModule? ParseModule(IDumpSource source, in ModuleRecord record)
     {
-        var baseAddress = (long)BinaryUtils.ReadUInt64LE(buffer, offset);
-        var size = (int)BinaryUtils.ReadUInt32LE(buffer, offset + 0x08);
-        var checksum = BinaryUtils.ReadUInt32LE(buffer, offset + 0x0C);
-        var timestamp = BinaryUtils.ReadUInt32LE(buffer, offset + 0x10);
-        var nameRva = BinaryUtils.ReadUInt32LE(buffer, offset + 0x14);
-
-        if (nameRva == 0 || size == 0)
+        if (record.ModuleNameRva == 0 || record.SizeOfImage == 0)
         {
             return null;
         }
 
-        var name = ReadMinidumpString(stream, nameRva);
+        var name = ReadMinidumpString(source, record.ModuleNameRva);
         if (string.IsNullOrEmpty(name))
         {
             return null;
@@ -211,43 +225,106 @@ public static class MinidumpParser
         return new MinidumpModule
         {
             Name = name,
-            BaseAddress = baseAddress,
-            Size = size,
-            Checksum = checksum,
-            TimeDateStamp = timestamp
+            BaseAddress = (long)record.BaseOfImage,
+            Size = (int)record.SizeOfImage,
+            Checksum = record.CheckSum,
+            TimeDateStamp = record.TimeDateStamp
         };
     }
 
-    private static string? ReadMinidumpString(Stream stream, uint rva)
+    private static string? ReadMinidumpString(IDumpSource source, uint rva)
     {
-        var currentPos = stream.Position;
-        try
+        Span<byte> lengthBuffer = stackalloc byte[4];
+        if (!source.TryRead(rva, lengthBuffer))
         {
-            stream.Seek(rva, SeekOrigin.Begin);
+            return null;
+        }
 
-            var lengthBuffer = new byte[4];
-            if (stream.Read(lengthBuffer, 0, 4) < 4)
-            {
-                return null;
-            }
+        var length = (int)BinaryUtils.ReadUInt32LE(lengthBuffer);
+        if (length == 0 || length > MaxModuleNameBytes)
+        {
+            return null;
+        }
 
-            var length = (int)BinaryUtils.ReadUInt32LE(lengthBuffer);
-            if (length == 0 || length > 520)
-            {
-                return null;
-            }
+        Span<byte> stringBuffer = stackalloc byte[MaxModuleNameBytes];
+        var nameBytes = stringBuffer[..length];
+        if (!source.TryRead(rva + 4L, nameBytes))
+        {
+            return null;
+        }
+
+        return Encoding.Unicode.GetString(nameBytes).TrimEnd('\0');
+    }
 
-            var stringBuffer = new byte[length];
-            if (stream.Read(stringBuffer, 0, length) < length)
+    /// <summary>
+    ///     MINIDUMP_DIRECTORY: stream type followed by its MINIDUMP_LOCATION_DESCRIPTOR.
+    /// </summary>
+    [StructLayout(LayoutKind.Sequential, Size = DirectoryEntrySize)]
+    private readonly struct DirectoryEntryRecord
+    {
+        public readonly uint StreamType;
+        public readonly uint DataSize;
+        public readonly uint Rva;
+    }
+
+    /// <summary>
+    ///     Leading fields of MINIDUMP_MODULE; the version info and CodeView/misc records are not used.
+    ///     Minidump structures are little-endian, matching the x64/ARM64 hosts this tool runs on.
+    /// </summary>
+    [StructLayout(LayoutKind.Sequential, Pack = 4, Size = ModuleEntrySize)]
+    private readonly struct ModuleRecord
+    {
+        public readonly ulong BaseOfImage;
+        public readonly uint SizeOfImage;
+        public readonly uint CheckSum;
+        public readonly uint TimeDateStamp;
+        public readonly uint ModuleNameRva;
+    }
+
+    /// <summary>
+    ///     MINIDUMP_MEMORY_DESCRIPTOR64.
+    /// </summary>
+    [StructLayout(LayoutKind.Sequential, Size = MemoryDescriptorSize)]
+    private readonly struct MemoryDescriptorRecord
+    {
+        public readonly ulong StartOfMemoryRange;
+        public readonly ulong DataSize;
+    }
+
+    /// <summary>
+    ///     Random-access reads at absolute file offsets; returns false if the range is not fully available.
+    /// </summary>
+    private interface IDumpSource
+    {
+        bool TryRead(long offset, Span<byte> destination);
+    }
+
+    private sealed class StreamSource(Stream stream) : IDumpSource
+    {
+        public bool TryRead(long offset, Span<byte> destination)
+        {
+            // Out-of-range RVAs in a corrupt dump are rejected up front rather than seeking past the end
+            if (offset + destination.Length > stream.Length)
             {
-                return null;
+                return false;
             }
 
-            return Encoding.Unicode.GetString(stringBuffer).TrimEnd('\0');
+            stream.Seek(offset, SeekOrigin.Begin);
+            return stream.ReadAtLeast(destination, destination.Length, false) == destination.Length;
         }
-        finally
+    }
+
+    private sealed class MappedSource(MemoryMappedSpanReader reader) : IDumpSource
+    {
+        public bool TryRead(long offset, Span<byte> destination)
         {
-            stream.Seek(currentPos, SeekOrigin.Begin);
+            if (offset + destination.Length > reader.Length)
+            {
+                return false;
+            }
+
+            reader.GetSpan(offset, destination.Length).CopyTo(destination);
+            return true;
         }
     }
 }
@@ -41,7 +41,6 @@ public class CarvedFileInfo
     public long Length { get; set; }
     public string FileType { get; set; } = "";
     public string? FileName { get; set; }
-    public byte[]? Header { get; set; }
     public string? Error { get; set; }
 
     /// <summary>
@@ -73,6 +72,12 @@ public record ExtractionOptions
     ///     Scripts are grouped by quest name for easier analysis.
     /// </summary>
     public bool ExtractScripts { get; init; } = true;
+
+    /// <summary>
+    ///     Write identical carved payloads only once, keeping the copy at the lowest offset.
+    ///     Off by default, so every carved match is written.
+    /// </summary>
+    public bool DeduplicateContent { get; init; }
 }
 
 /// <summary>
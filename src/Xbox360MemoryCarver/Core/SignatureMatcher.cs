@@ -1,17 +1,39 @@
+using System.Buffers;
+using Xbox360MemoryCarver.Core.Utils;
+
 namespace Xbox360MemoryCarver.Core;
 
 /// <summary>
 ///     Multi-pattern search for efficient file signature matching.
 ///     Uses Aho-Corasick algorithm to find all occurrences of multiple patterns in a single pass.
+///     The automaton is compiled into a dense transition table so the scan loop does one array
+///     lookup per input byte with no dictionary lookups or failure-link walking.
+///     While the automaton sits in its start state, a vectorized search for the patterns' first bytes
+///     skips runs of bytes that cannot begin a match, so typical dump data is not walked byte by byte.
+///     Searches only read shared state and are safe to call concurrently, which <see cref="SearchMapped" />
+///     uses to scan large dumps on all cores. The automaton is compiled under a lock on first use if
+///     <see cref="Build" /> was not called; adding patterns is not thread-safe.
 /// </summary>
 public sealed class SignatureMatcher
 {
+    private const int AlphabetSize = 256;
+
+    private readonly Lock _buildLock = new();
     private readonly List<(string Name, byte[] Pattern)> _patterns = [];
     private readonly Node _root = new();
+    private volatile Automaton? _automaton;
 
     public int PatternCount => _patterns.Count;
 
-    public int MaxPatternLength => _patterns.Count > 0 ? _patterns.Max(p => p.Pattern.Length) : 0;
+    public int MaxPatternLength { get; private set; }
+
+    /// <summary>
+    ///     Name of the pattern with the given id (ids are assigned in the order patterns are added).
+    /// </summary>
+    public string GetPatternName(int patternId)
+    {
+        return _patterns[patternId].Name;
+    }
 
     /// <summary>
     ///     Add a pattern to search for.
@@ -22,6 +44,7 @@ public sealed class SignatureMatcher
 
         var patternIndex = _patterns.Count;
         _patterns.Add((name, pattern));
+        MaxPatternLength = Math.Max(MaxPatternLength, pattern.Length);
 
         var current = _root;
         foreach (var b in pattern)
@@ -36,52 +59,87 @@ public sealed class SignatureMatcher
         }
 
         current.Output.Add(patternIndex);
+        _automaton = null;
     }
 
     /// <summary>
-    ///     Build the failure links. Must be called after all patterns are added.
+    ///     Build the failure links and compile the transition table. Must be called after all patterns are added.
     /// </summary>
     public void Build()
     {
-        if (_patterns.Count == 0)
+        lock (_buildLock)
         {
-            return;
+            _automaton = Compile();
+        }
+    }
+
+    /// <summary>
+    ///     Get the compiled automaton, building it once if patterns were added since the last build.
+    /// </summary>
+    private Automaton GetAutomaton()
+    {
+        var automaton = _automaton;
+        if (automaton != null)
+        {
+            return automaton;
         }
 
-        var queue = new Queue<Node>();
+        lock (_buildLock)
+        {
+            return _automaton ??= Compile()!;
+        }
+    }
+
+    private Automaton? Compile()
+    {
+        if (_patterns.Count == 0)
+        {
+            return null;
+        }
 
-        // Initialize failure links for depth-1 nodes
-        foreach (var child in _root.Children.Values)
+        // Number trie nodes in BFS order so a node's failure target is always processed before it
+        var nodes = new List<Node> { _root };
+        for (var i = 0; i < nodes.Count; i++)
         {
-            child.Failure = _root;
-            queue.Enqueue(child);
+            foreach (var child in nodes[i].Children.Values)
+            {
+                child.Id = nodes.Count;
+                nodes.Add(child);
+            }
         }
 
-        // BFS to build failure links
-        while (queue.Count > 0)
+        var transitions = new int[nodes.Count * AlphabetSize];
+        var failures = new int[nodes.Count];
+        var outputs = new int[nodes.Count][];
+
+        foreach (var node in nodes)
         {
-            var current = queue.Dequeue();
+            var isRoot = node.Id == 0;
+            var row = node.Id * AlphabetSize;
+            var failureRow = failures[node.Id] * AlphabetSize;
 
-            foreach (var (b, child) in current.Children)
+            for (var b = 0; b < AlphabetSize; b++)
             {
-                queue.Enqueue(child);
+                // Missing edges follow the failure state's (already compiled) transition
+                var fallback = isRoot ? 0 : transitions[failureRow + b];
 
-                var failure = current.Failure;
-                while (failure?.Children.ContainsKey(b) == false)
+                if (node.Children.TryGetValue((byte)b, out var child))
                 {
-                    failure = failure.Failure;
+                    transitions[row + b] = child.Id;
+                    failures[child.Id] = fallback;
                 }
-
-                child.Failure = failure?.Children.GetValueOrDefault(b) ?? _root;
-                if (child.Failure == child)
+                else
                 {
-                    child.Failure = _root;
+                    transitions[row + b] = fallback;
                 }
-
-                // Merge output from failure link
-                child.Failure?.Output.ForEach(o => child.Output.Add(o));
             }
+
+            // Merge output from failure link
+            outputs[node.Id] = isRoot ? [.. node.Output] : [.. node.Output, .. outputs[failures[node.Id]]];
         }
+
+        var firstBytes = _root.Children.Keys.ToArray();
+        return new Automaton(transitions, outputs, SearchValues.Create(firstBytes));
     }
 
     /// <summary>
@@ -90,35 +148,154 @@ public sealed class SignatureMatcher
     /// </summary>
     public List<(string Name, byte[] Pattern, long Position)> Search(ReadOnlySpan<byte> data, long baseOffset = 0)
     {
-        var current = _root;
-        var results = new List<(string, byte[], long)>();
+        var matches = new List<(int PatternId, long Position)>();
+        SearchIds(data, baseOffset, matches);
+
+        var results = new List<(string, byte[], long)>(matches.Count);
+        foreach (var (patternId, position) in matches)
+        {
+            var (name, pattern) = _patterns[patternId];
+            results.Add((name, pattern, position));
+        }
+
+        return results;
+    }
+
+    private void SearchIds(ReadOnlySpan<byte> data, long baseOffset, List<(int PatternId, long Position)> results)
+    {
+        if (_patterns.Count == 0)
+        {
+            return;
+        }
+
+        var (transitions, outputs, firstBytes) = GetAutomaton();
+        var state = 0;
 
         for (var i = 0; i < data.Length; i++)
         {
-            var b = data[i];
+            if (state == 0)
+            {
+                // From the start state only a pattern's first byte leaves it, so jump to the next one
+                var skip = data[i..].IndexOfAny(firstBytes);
+                if (skip < 0)
+                {
+                    break;
+                }
+
+                i += skip;
+            }
 
-            while (current != _root && !current.Children.ContainsKey(b))
+            state = transitions[state * AlphabetSize + data[i]];
+
+            var matched = outputs[state];
+            if (matched.Length == 0)
             {
-                current = current.Failure!;
+                continue;
             }
 
-            current = current.Children.GetValueOrDefault(b) ?? _root;
+            foreach (var patternIndex in matched)
+            {
+                var matchPos = baseOffset + i - _patterns[patternIndex].Pattern.Length + 1;
+                results.Add((patternIndex, matchPos));
+            }
+        }
+    }
+
+    /// <summary>
+    ///     Check whether any pattern starts at the beginning of the data, walking the automaton once
+    ///     instead of comparing each pattern in turn.
+    /// </summary>
+    public bool MatchesAt(ReadOnlySpan<byte> data)
+    {
+        if (_patterns.Count == 0)
+        {
+            return false;
+        }
+
+        var (transitions, outputs, _) = GetAutomaton();
+        var state = 0;
+        var limit = Math.Min(data.Length, MaxPatternLength);
+
+        for (var i = 0; i < limit; i++)
+        {
+            state = transitions[state * AlphabetSize + data[i]];
+            if (state == 0)
+            {
+                return false;
+            }
 
-            foreach (var patternIndex in current.Output)
+            // Outputs also hold shorter patterns ending here (via failure links); only a full-length one starts at 0
+            foreach (var patternIndex in outputs[state])
             {
-                var (name, pattern) = _patterns[patternIndex];
-                var matchPos = baseOffset + i - pattern.Length + 1;
-                results.Add((name, pattern, matchPos));
+                if (_patterns[patternIndex].Pattern.Length == i + 1)
+                {
+                    return true;
+                }
             }
         }
 
+        return false;
+    }
+
+    /// <summary>
+    ///     Search a memory-mapped dump in fixed-size windows scanned in parallel.
+    ///     Windows overlap by the longest pattern so matches straddling a boundary are still found
+    ///     (and may be reported twice). Results are returned in ascending window order and identify the
+    ///     pattern by id, so callers can map matches through a precomputed table instead of by name.
+    /// </summary>
+    /// <param name="reader">Mapped view to scan.</param>
+    /// <param name="chunkSize">Bytes per window, excluding the overlap.</param>
+    /// <param name="bytesScanned">Optional callback with the running total of bytes scanned.</param>
+    internal List<(int PatternId, long Position)> SearchMapped(
+        MemoryMappedSpanReader reader,
+        int chunkSize,
+        Action<long>? bytesScanned = null)
+    {
+        var length = reader.Length;
+        if (_patterns.Count == 0 || length == 0)
+        {
+            return [];
+        }
+
+        // Compile once up front rather than racing to do so from the first windows
+        GetAutomaton();
+
+        var overlap = MaxPatternLength;
+        var chunkCount = (int)((length + chunkSize - 1) / chunkSize);
+        var chunkMatches = new List<(int PatternId, long Position)>[chunkCount];
+        long scanned = 0;
+
+        Parallel.For(0, chunkCount, i =>
+        {
+            var offset = (long)i * chunkSize;
+            var toRead = (int)Math.Min(chunkSize + overlap, length - offset);
+            var matches = new List<(int PatternId, long Position)>();
+            SearchIds(reader.GetSpan(offset, toRead), offset, matches);
+            chunkMatches[i] = matches;
+
+            var total = Interlocked.Add(ref scanned, Math.Min(chunkSize, length - offset));
+            bytesScanned?.Invoke(total);
+        });
+
+        var results = new List<(int PatternId, long Position)>(chunkMatches.Sum(m => m.Count));
+        foreach (var matches in chunkMatches)
+        {
+            results.AddRange(matches);
+        }
+
         return results;
     }
 
     private sealed class Node
     {
         public Dictionary<byte, Node> Children { get; } = [];
-        public Node? Failure { get; set; }
+        public int Id { get; set; }
         public List<int> Output { get; } = [];
     }
+
+    /// <summary>
+    ///     Compiled DFA: next state is Transitions[state * 256 + byte], matches for a state are Outputs[state].
+    ///     FirstBytes holds the bytes that move the start state anywhere else.
+    /// </summary>
+    private sealed record Automaton(int[] Transitions, int[][] Outputs, SearchValues<byte> FirstBytes);
 }
@@ -1,3 +1,6 @@
+using System.Buffers;
+using System.Buffers.Binary;
+using System.Numerics;
 using System.Runtime.InteropServices;
 using System.Text;
 
@@ -5,15 +8,26 @@ namespace Xbox360MemoryCarver.Core.Utils;
 
 /// <summary>
 ///     Binary reading utilities for little-endian and big-endian data.
+///     Readers go through BinaryPrimitives, so each is one bounds check and a single (byte-swapped) load.
 /// </summary>
 public static class BinaryUtils
 {
+    private static readonly string[] SizeUnits = ["B", "KB", "MB", "GB", "TB"];
+
+    private static readonly SearchValues<char> InvalidFileNameChars = SearchValues.Create(Path.GetInvalidFileNameChars());
+
+    /// <summary>
+    ///     Printable ASCII plus tab, CR and LF.
+    /// </summary>
+    internal static readonly SearchValues<byte> PrintableTextBytes =
+        SearchValues.Create([.. Enumerable.Range(0x20, 0x7F - 0x20).Select(b => (byte)b), (byte)'\t', (byte)'\r', (byte)'\n']);
+
     /// <summary>
     ///     Read a 32-bit unsigned integer in little-endian format.
     /// </summary>
     public static uint ReadUInt32LE(ReadOnlySpan<byte> data, int offset = 0)
     {
-        return (uint)(data[offset] | (data[offset + 1] << 8) | (data[offset + 2] << 16) | (data[offset + 3] << 24));
+        return BinaryPrimitives.ReadUInt32LittleEndian(data[offset..]);
     }
 
     /// <summary>
@@ -21,7 +35,7 @@ public static class BinaryUtils
     /// </summary>
     public static uint ReadUInt32BE(ReadOnlySpan<byte> data, int offset = 0)
     {
-        return (uint)((data[offset] << 24) | (data[offset + 1] << 16) | (data[offset + 2] << 8) | data[offset + 3]);
+        return BinaryPrimitives.ReadUInt32BigEndian(data[offset..]);
     }
 
     /// <summary>
@@ -29,14 +43,7 @@ public static class BinaryUtils
     /// </summary>
     public static ulong ReadUInt64LE(ReadOnlySpan<byte> data, int offset = 0)
     {
-        return data[offset]
-               | ((ulong)data[offset + 1] << 8)
-               | ((ulong)data[offset + 2] << 16)
-               | ((ulong)data[offset + 3] << 24)
-               | ((ulong)data[offset + 4] << 32)
-               | ((ulong)data[offset + 5] << 40)
-               | ((ulong)data[offset + 6] << 48)
-               | ((ulong)data[offset + 7] << 56);
+        return BinaryPrimitives.ReadUInt64LittleEndian(data[offset..]);
     }
 
     /// <summary>
@@ -44,14 +51,7 @@ public static class BinaryUtils
     /// </summary>
     public static ulong ReadUInt64BE(ReadOnlySpan<byte> data, int offset = 0)
     {
-        return ((ulong)data[offset] << 56)
-               | ((ulong)data[offset + 1] << 48)
-               | ((ulong)data[offset + 2] << 40)
-               | ((ulong)data[offset + 3] << 32)
-               | ((ulong)data[offset + 4] << 24)
-               | ((ulong)data[offset + 5] << 16)
-               | ((ulong)data[offset + 6] << 8)
-               | data[offset + 7];
+        return BinaryPrimitives.ReadUInt64BigEndian(data[offset..]);
     }
 
     /// <summary>
@@ -59,7 +59,7 @@ public static class BinaryUtils
     /// </summary>
     public static ushort ReadUInt16LE(ReadOnlySpan<byte> data, int offset = 0)
     {
-        return (ushort)(data[offset] | (data[offset + 1] << 8));
+        return BinaryPrimitives.ReadUInt16LittleEndian(data[offset..]);
     }
 
     /// <summary>
@@ -67,7 +67,7 @@ public static class BinaryUtils
     /// </summary>
     public static ushort ReadUInt16BE(ReadOnlySpan<byte> data, int offset = 0)
     {
-        return (ushort)((data[offset] << 8) | data[offset + 1]);
+        return BinaryPrimitives.ReadUInt16BigEndian(data[offset..]);
     }
 
     /// <summary>
@@ -80,18 +80,35 @@ public static class BinaryUtils
             return false;
         }
 
-#pragma warning disable S3267 // Loops should be simplified - intentionally avoiding LINQ for Span<T> performance
-        var printableCount = 0;
-        foreach (var b in data)
+        // Alternate vectorized searches over printable and non-printable runs, counting whole runs of
+        // the latter at once and stopping as soon as the ratio can no longer be met
+        var nonPrintableCount = 0;
+        var remaining = data;
+        int runStart;
+        while ((runStart = remaining.IndexOfAnyExcept(PrintableTextBytes)) >= 0)
         {
-            if (b is >= 32 and < 127 or 9 or 10 or 13)
+            remaining = remaining[runStart..];
+            var runLength = remaining.IndexOfAny(PrintableTextBytes);
+            if (runLength < 0)
             {
-                printableCount++;
+                runLength = remaining.Length;
             }
+
+            nonPrintableCount += runLength;
+            if (!MeetsPrintableRatio(data.Length, nonPrintableCount, minRatio))
+            {
+                return false;
+            }
+
+            remaining = remaining[runLength..];
         }
-#pragma warning restore S3267
 
-        return (double)printableCount / data.Length >= minRatio;
+        return MeetsPrintableRatio(data.Length, nonPrintableCount, minRatio);
+    }
+
+    private static bool MeetsPrintableRatio(int length, int nonPrintableCount, double minRatio)
+    {
+        return (double)(length - nonPrintableCount) / length >= minRatio;
     }
 
     /// <summary>
@@ -101,13 +118,25 @@ public static class BinaryUtils
     {
         ArgumentNullException.ThrowIfNull(filename);
 
-        var invalid = Path.GetInvalidFileNameChars();
-        foreach (var c in invalid)
+        // Single pass; names without invalid characters are returned as-is
+        var firstInvalid = filename.AsSpan().IndexOfAny(InvalidFileNameChars);
+        if (firstInvalid < 0)
         {
-            filename = filename.Replace(c, '_');
+            return filename;
         }
 
-        return filename;
+        return string.Create(filename.Length, (filename, firstInvalid), static (span, state) =>
+        {
+            state.filename.AsSpan().CopyTo(span);
+            var rest = span[state.firstInvalid..];
+            for (var i = 0; i < rest.Length; i++)
+            {
+                if (InvalidFileNameChars.Contains(rest[i]))
+                {
+                    rest[i] = '_';
+                }
+            }
+        });
     }
 
     /// <summary>
@@ -115,17 +144,13 @@ public static class BinaryUtils
     /// </summary>
     public static string FormatSize(long sizeBytes)
     {
-        string[] units = ["B", "KB", "MB", "GB", "TB"];
-        double size = sizeBytes;
-        var unitIndex = 0;
+        // Each unit is 2^10 of the previous one, so the unit follows directly from the highest set bit
+        var unitIndex = sizeBytes < 1024
+            ? 0
+            : Math.Min(BitOperations.Log2((ulong)sizeBytes) / 10, SizeUnits.Length - 1);
+        var size = (double)sizeBytes / (1L << (10 * unitIndex));
 
-        while (size >= 1024 && unitIndex < units.Length - 1)
-        {
-            size /= 1024;
-            unitIndex++;
-        }
-
-        return $"{size:F2} {units[unitIndex]}";
+        return $"{size:F2} {SizeUnits[unitIndex]}";
     }
 
     /// <summary>
@@ -138,41 +163,10 @@ public static class BinaryUtils
             return -1;
         }
 
-        if (pattern.Length == 1)
-        {
-            var idx = data[start..].IndexOf(pattern[0]);
-            return idx >= 0 ? start + idx : -1;
-        }
-
-        var firstByte = pattern[0];
-        var searchSpan = data[start..];
-        var searchOffset = 0;
-
-        while (searchOffset <= searchSpan.Length - pattern.Length)
-        {
-            var idx = searchSpan[searchOffset..].IndexOf(firstByte);
-            if (idx < 0)
-            {
-                return -1;
-            }
-
-            var candidateOffset = searchOffset + idx;
-
-            // Bounds check before slicing
-            if (candidateOffset + pattern.Length > searchSpan.Length)
-            {
-                return -1;
-            }
-
-            if (searchSpan.Slice(candidateOffset, pattern.Length).SequenceEqual(pattern))
-            {
-                return start + candidateOffset;
-            }
-
-            searchOffset = candidateOffset + 1;
-        }
-
-        return -1;
+        // The span search checks the pattern's first and last bytes with SIMD before comparing the rest,
+        // so candidates are rejected in bulk rather than one first-byte hit at a time
+        var idx = data[start..].IndexOf(pattern);
+        return idx >= 0 ? start + idx : -1;
     }
 
     /// <summary>
@@ -203,6 +197,12 @@ public static class BinaryUtils
     /// </summary>
     public static long AlignOffset(long offset, int alignment)
     {
+        // Sector and page alignments are powers of two: round up with a mask instead of a division
+        if (BitOperations.IsPow2(alignment))
+        {
+            return (offset + alignment - 1) & ~(long)(alignment - 1);
+        }
+
         var remainder = offset % alignment;
         return remainder == 0 ? offset : offset + (alignment - remainder);
     }
@@ -244,7 +244,7 @@ public static class BinaryUtils
     /// </summary>
     public static int ReadInt32LE(ReadOnlySpan<byte> data, int offset = 0)
     {
-        return data[offset] | (data[offset + 1] << 8) | (data[offset + 2] << 16) | (data[offset + 3] << 24);
+        return BinaryPrimitives.ReadInt32LittleEndian(data[offset..]);
     }
 
     /// <summary>
@@ -252,7 +252,6 @@ public static class BinaryUtils
     /// </summary>
     public static float ReadFloatLE(ReadOnlySpan<byte> data, int offset = 0)
     {
-        var value = ReadUInt32LE(data, offset);
-        return BitConverter.UInt32BitsToSingle(value);
+        return BinaryPrimitives.ReadSingleLittleEndian(data[offset..]);
     }
 }
@@ -0,0 +1,59 @@
+using System.IO.MemoryMappedFiles;
+using Microsoft.Win32.SafeHandles;
+
+namespace Xbox360MemoryCarver.Core.Utils;
+
+/// <summary>
+///     Zero-copy span access to a memory-mapped view.
+///     Scan windows are read directly from the mapped pages instead of being copied
+///     into managed buffers with ReadArray; the OS pages data in on demand.
+/// </summary>
+/// <remarks>
+///     Spans returned by <see cref="GetSpan" /> are only valid until the reader is disposed
+///     and must not be held across an await.
+/// </remarks>
+internal sealed unsafe class MemoryMappedSpanReader : IDisposable
+{
+    private readonly SafeMemoryMappedViewHandle _handle;
+    private byte* _pointer;
+
+    public MemoryMappedSpanReader(MemoryMappedViewAccessor accessor, long length)
+    {
+        ArgumentNullException.ThrowIfNull(accessor);
+        ArgumentOutOfRangeException.ThrowIfNegative(length);
+
+        _handle = accessor.SafeMemoryMappedViewHandle;
+        _handle.AcquirePointer(ref _pointer);
+        _pointer += accessor.PointerOffset;
+        Length = length;
+    }
+
+    /// <summary>
+    ///     Length of the mapped data in bytes.
+    /// </summary>
+    public long Length { get; }
+
+    public void Dispose()
+    {
+        if (_pointer == null)
+        {
+            return;
+        }
+
+        _pointer = null;
+        _handle.ReleasePointer();
+    }
+
+    /// <summary>
+    ///     Get a read-only span over a window of the mapped data.
+    /// </summary>
+    public ReadOnlySpan<byte> GetSpan(long offset, int length)
+    {
+        ObjectDisposedException.ThrowIf(_pointer == null, this);
+        ArgumentOutOfRangeException.ThrowIfNegative(offset);
+        ArgumentOutOfRangeException.ThrowIfNegative(length);
+        ArgumentOutOfRangeException.ThrowIfGreaterThan(offset + length, Length);
+
+        return new ReadOnlySpan<byte>(_pointer + offset, length);
+    }
+}
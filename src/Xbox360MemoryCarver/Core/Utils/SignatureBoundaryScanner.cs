@@ -1,12 +1,24 @@
+using System.Buffers;
+using System.Collections.Concurrent;
 using Xbox360MemoryCarver.Core.Formats;
 
 namespace Xbox360MemoryCarver.Core.Utils;
 
+/// <summary>
+///     Extra check run when a boundary signature's magic bytes match at <paramref name="position" />.
+/// </summary>
+internal delegate bool BoundaryValidator(ReadOnlySpan<byte> data, int position);
+
 /// <summary>
 ///     Utility for finding file boundaries by scanning for known signatures.
 /// </summary>
 public static class SignatureBoundaryScanner
 {
+    /// <summary>
+    ///     Number of bytes compared at each candidate position during boundary scanning.
+    /// </summary>
+    private const int BoundaryWindowSize = 4;
+
     /// <summary>
     ///     Gamebryo/NIF signature (20 bytes).
     /// </summary>
@@ -17,6 +29,17 @@ public static class SignatureBoundaryScanner
     /// </summary>
     private static readonly Lazy<byte[][]> CachedKnownSignatures = new(BuildKnownSignatures);
 
+    /// <summary>
+    ///     Registry-wide boundary tables, one per excluded signature (hex, empty for none) and RIFF validation setting.
+    /// </summary>
+    private static readonly ConcurrentDictionary<(string Exclude, bool ValidateRiff), SignatureTable>
+        CachedBoundarySignatures = new();
+
+    /// <summary>
+    ///     All known signatures (and Gamebryo's) compiled into one automaton for <see cref="IsKnownSignature" />.
+    /// </summary>
+    private static readonly Lazy<SignatureMatcher> CachedKnownSignatureMatcher = new(BuildKnownSignatureMatcher);
+
     /// <summary>
     ///     Build the known signatures array (called once via Lazy).
     /// </summary>
@@ -29,6 +52,53 @@ public static class SignatureBoundaryScanner
             .ToArray();
     }
 
+    private static SignatureMatcher BuildKnownSignatureMatcher()
+    {
+        var matcher = new SignatureMatcher();
+        foreach (var signature in GetKnownSignatures().Where(s => s.Length > 0))
+        {
+            matcher.AddPattern(string.Empty, signature);
+        }
+
+        matcher.AddPattern(string.Empty, GamebryoSignature);
+        matcher.Build();
+        return matcher;
+    }
+
+    private static SignatureTable BuildBoundarySignatures((string Exclude, bool ValidateRiff) key)
+    {
+        var excludeSignature = Convert.FromHexString(key.Exclude);
+        BoundaryValidator? validateRiff = key.ValidateRiff ? IsValidRiffHeader : null;
+
+        // The boundary scan compares a 4-byte window, so longer signatures never match there.
+        // Gamebryo is checked in full and is never excluded.
+        var signatures = GetKnownSignatures()
+            .Where(s => s.Length is > 0 and <= BoundaryWindowSize && !s.AsSpan().SequenceEqual(excludeSignature))
+            .Select(s => (s, s.AsSpan().SequenceEqual("RIFF"u8) ? validateRiff : null))
+            .Append((GamebryoSignature, null));
+
+        return CreateSignatureTable([.. signatures]);
+    }
+
+    /// <summary>
+    ///     Build a table of signatures that end a file, each with an optional validator.
+    ///     Formats with their own boundary rules declare a table once and scan it with
+    ///     <see cref="FindNextSignature(ReadOnlySpan{byte}, int, int, SignatureTable)" />.
+    /// </summary>
+    internal static SignatureTable CreateSignatureTable(params (byte[] Magic, BoundaryValidator? Validate)[] signatures)
+    {
+        var firstBytes = SearchValues.Create([.. signatures.Select(s => s.Magic[0]).Distinct()]);
+
+        // Bucket by first byte so a candidate position is only compared against signatures that can start there
+        var byFirstByte = new (byte[] Magic, BoundaryValidator? Validate)[256][];
+        for (var b = 0; b < byFirstByte.Length; b++)
+        {
+            byFirstByte[b] = [.. signatures.Where(s => s.Magic[0] == b)];
+        }
+
+        return new SignatureTable(byFirstByte, firstBytes);
+    }
+
     /// <summary>
     ///     Get all known signatures from the FormatRegistry for boundary scanning.
     /// </summary>
@@ -116,28 +186,7 @@ public static class SignatureBoundaryScanner
     /// </summary>
     public static bool IsKnownSignature(ReadOnlySpan<byte> data, int position)
     {
-        var knownSignatures = GetKnownSignatures();
-
-        foreach (var sig in knownSignatures)
-        {
-            if (position + sig.Length > data.Length)
-            {
-                continue;
-            }
-
-            if (data.Slice(position, sig.Length).SequenceEqual(sig))
-            {
-                return true;
-            }
-        }
-
-        // Check Gamebryo
-        if (position + 20 <= data.Length && data.Slice(position, 20).SequenceEqual(GamebryoSignature))
-        {
-            return true;
-        }
-
-        return false;
+        return position <= data.Length && CachedKnownSignatureMatcher.Value.MatchesAt(data[position..]);
     }
 
     /// <summary>
@@ -175,89 +224,71 @@ public static class SignatureBoundaryScanner
         return data.Slice(position + 8, 4).SequenceEqual("WAVE"u8);
     }
 
-    private static int FindNextSignatureCore(
-        ReadOnlySpan<byte> data,
-        int offset,
-        int minSize,
-        int maxSize,
-        ReadOnlySpan<byte> excludeSignature,
-        bool validateRiff)
+    /// <summary>
+    ///     Find the first position in [start, end) where a signature from the table matches and passes its validator.
+    ///     Returns the absolute position, or -1 if none does.
+    /// </summary>
+    internal static int FindNextSignature(ReadOnlySpan<byte> data, int start, int end, SignatureTable signatures)
     {
-        var scanStart = offset + minSize;
-        var scanEnd = Math.Min(offset + maxSize, data.Length - 4);
-        var knownSignatures = GetKnownSignatures();
-
-        for (var i = scanStart; i < scanEnd; i++)
+        var i = start;
+        while (i < end)
         {
-            var signatureMatch = TryMatchKnownSignature(data, i, knownSignatures, excludeSignature, validateRiff);
-            if (signatureMatch >= 0)
+            // Vectorized jump to the next byte that can start any signature, instead of testing every position
+            var skip = data[i..end].IndexOfAny(signatures.FirstBytes);
+            if (skip < 0)
             {
-                return signatureMatch - offset;
+                break;
             }
 
-            if (TryMatchGamebryoSignature(data, i))
+            i += skip;
+            if (MatchesAt(data, i, signatures.SignaturesByFirstByte[data[i]]))
             {
-                return i - offset;
+                return i;
             }
+
+            i++;
         }
 
         return -1;
     }
 
-    private static int TryMatchKnownSignature(
+    private static int FindNextSignatureCore(
         ReadOnlySpan<byte> data,
-        int position,
-        byte[][] knownSignatures,
+        int offset,
+        int minSize,
+        int maxSize,
         ReadOnlySpan<byte> excludeSignature,
         bool validateRiff)
     {
-        var slice = data.Slice(position, Math.Min(4, data.Length - position));
-
-        foreach (var sig in knownSignatures)
-        {
-            if (!IsSignatureMatch(slice, sig))
-            {
-                continue;
-            }
-
-            if (ShouldExcludeSignature(sig, excludeSignature))
-            {
-                continue;
-            }
-
-            if (validateRiff && slice.SequenceEqual("RIFF"u8) && !IsValidRiffHeader(data, position))
-            {
-                continue;
-            }
-
-            return position;
-        }
-
-        return -1;
-    }
-
-    private static bool IsSignatureMatch(ReadOnlySpan<byte> slice, byte[] signature)
-    {
-        if (signature.Length > slice.Length)
-        {
-            return false;
-        }
+        var scanStart = offset + minSize;
+        var scanEnd = Math.Min(offset + maxSize, data.Length - BoundaryWindowSize);
+        var signatures = CachedBoundarySignatures.GetOrAdd(
+            (Convert.ToHexString(excludeSignature), validateRiff), BuildBoundarySignatures);
 
-        return slice[..signature.Length].SequenceEqual(signature);
+        var match = FindNextSignature(data, scanStart, scanEnd, signatures);
+        return match >= 0 ? match - offset : -1;
     }
 
-    private static bool ShouldExcludeSignature(ReadOnlySpan<byte> signature, ReadOnlySpan<byte> excludeSignature)
+    private static bool MatchesAt(ReadOnlySpan<byte> data, int position,
+        (byte[] Magic, BoundaryValidator? Validate)[] candidates)
     {
-        if (excludeSignature.IsEmpty)
+        var candidate = data[position..];
+        foreach (var (magic, validate) in candidates)
         {
-            return false;
+            if (candidate.StartsWith(magic) && (validate == null || validate(data, position)))
+            {
+                return true;
+            }
         }
 
-        return signature.Length == excludeSignature.Length && excludeSignature.SequenceEqual(signature);
+        return false;
     }
 
-    private static bool TryMatchGamebryoSignature(ReadOnlySpan<byte> data, int position)
-    {
-        return position + 20 <= data.Length && data.Slice(position, 20).SequenceEqual(GamebryoSignature);
-    }
+    /// <summary>
+    ///     Boundary signatures grouped by first byte (SignaturesByFirstByte[b] start with b),
+    ///     plus the set of bytes any of them can start with.
+    /// </summary>
+    internal sealed record SignatureTable(
+        (byte[] Magic, BoundaryValidator? Validate)[][] SignaturesByFirstByte,
+        SearchValues<byte> FirstBytes);
 }
@@ -1,3 +1,4 @@
+using System.Buffers;
 using System.Text;
 
 namespace Xbox360MemoryCarver.Core.Utils;
@@ -8,6 +9,18 @@ namespace Xbox360MemoryCarver.Core.Utils;
 /// </summary>
 internal static class TexturePathExtractor
 {
+    /// <summary>
+    ///     Byte class of <see cref="IsValidPathChar" />, for vectorized path-boundary searches.
+    /// </summary>
+    private static readonly SearchValues<byte> PathBytes =
+        SearchValues.Create("abcdefghijklmnopqrstuvwxyzABCDEFGHIJKLMNOPQRSTUVWXYZ0123456789_-.\\/ "u8);
+
+    /// <summary>
+    ///     ASCII subset of the characters <see cref="SanitizeFilename" /> keeps.
+    /// </summary>
+    private static readonly SearchValues<char> AsciiNameChars =
+        SearchValues.Create("abcdefghijklmnopqrstuvwxyzABCDEFGHIJKLMNOPQRSTUVWXYZ0123456789_-");
+
     /// <summary>
     ///     Search backwards from a file header to find a path string with the specified extension.
     /// </summary>
@@ -30,17 +43,26 @@ internal static class TexturePathExtractor
         }
 
         var searchArea = data.Slice(searchStart, searchLength);
-        var extBytes = Encoding.ASCII.GetBytes(extension.ToLowerInvariant());
 
-        // Look for the extension - start from end of search area
-        for (var i = searchLength - extBytes.Length; i >= 0; i--)
+        // Look for the extension - start from end of search area, jumping between '.' bytes and comparing
+        // only the few characters after each one case-insensitively (no lowered copy of the extension)
+        var extName = extension.AsSpan(1);
+        var candidateEnd = searchLength - extension.Length + 1;
+        while (candidateEnd > 0)
         {
-            if (!IsExtensionMatch(searchArea, i, extBytes))
+            var i = searchArea[..candidateEnd].LastIndexOf((byte)'.');
+            if (i < 0)
+            {
+                break;
+            }
+
+            candidateEnd = i;
+            if (!Ascii.EqualsIgnoreCase(searchArea.Slice(i + 1, extName.Length), extName))
             {
                 continue;
             }
 
-            var path = TryExtractPath(searchArea, i, extBytes.Length, extension);
+            var path = TryExtractPath(searchArea, i, extension.Length, extension);
             if (path != null)
             {
                 return path;
@@ -92,33 +114,27 @@ internal static class TexturePathExtractor
     /// </summary>
     public static string SanitizeFilename(string filename)
     {
-        // Use stackalloc for short filenames to avoid allocations
-        if (filename.Length <= 260)
+        // Names that are already plain ASCII identifiers are returned as-is
+        var name = filename.AsSpan();
+        var firstUnsafe = name.IndexOfAnyExcept(AsciiNameChars);
+        if (firstUnsafe < 0)
         {
-            Span<char> buffer = stackalloc char[filename.Length];
-            var pos = 0;
-            foreach (var c in filename)
-            {
-                if (char.IsLetterOrDigit(c) || c == '_' || c == '-')
-                {
-                    buffer[pos++] = c;
-                }
-            }
-
-            return new string(buffer[..pos]);
+            return filename;
         }
 
-        // Fallback for very long filenames - use StringBuilder
-        var sb = new StringBuilder(filename.Length);
-        foreach (var c in filename)
+        // Use stackalloc for short filenames to avoid allocations
+        Span<char> buffer = name.Length <= 260 ? stackalloc char[name.Length] : new char[name.Length];
+        name[..firstUnsafe].CopyTo(buffer);
+        var pos = firstUnsafe;
+        foreach (var c in name[firstUnsafe..])
         {
             if (char.IsLetterOrDigit(c) || c == '_' || c == '-')
             {
-                sb.Append(c);
+                buffer[pos++] = c;
             }
         }
 
-        return sb.ToString();
+        return new string(buffer[..pos]);
     }
 
     /// <summary>
@@ -136,53 +152,10 @@ internal static class TexturePathExtractor
         };
     }
 
-    private static bool IsExtensionMatch(ReadOnlySpan<byte> data, int position, byte[] extBytes)
-    {
-        if (position + extBytes.Length > data.Length)
-        {
-            return false;
-        }
-
-        // First char must be '.'
-        if (data[position] != '.' && data[position] != 0x2E)
-        {
-            return false;
-        }
-
-        // Compare remaining chars case-insensitively
-        for (var j = 1; j < extBytes.Length; j++)
-        {
-            var dataByte = data[position + j];
-            var extByte = extBytes[j];
-
-            // Convert to lowercase for comparison
-            if (dataByte >= 'A' && dataByte <= 'Z')
-            {
-                dataByte = (byte)(dataByte + 32);
-            }
-
-            if (dataByte != extByte)
-            {
-                return false;
-            }
-        }
-
-        return true;
-    }
-
     private static int FindPathStart(ReadOnlySpan<byte> data, int pathEndPos)
     {
-        for (var i = pathEndPos - 1; i >= 0; i--)
-        {
-            var b = data[i];
-            // Stop at null, control chars (except we allow space now), or non-ASCII
-            if (b == 0 || b < 0x20 || b > 0x7E || !IsValidPathChar((char)b))
-            {
-                return i + 1;
-            }
-        }
-
-        return 0;
+        // Stop at the last byte before the end that is not a path character (null, control, non-ASCII, ...)
+        return data[..pathEndPos].LastIndexOfAnyExcept(PathBytes) + 1;
     }
 
     private static string? CleanupPath(string path, string expectedExtension)
@@ -0,0 +1,33 @@
+namespace Xbox360MemoryCarver.Core.Utils;
+
+/// <summary>
+///     Locates the solution root when running from a development build,
+///     so helper tools built alongside the app (DDXConv, XUIHelper) can be found.
+/// </summary>
+public static class WorkspaceLocator
+{
+    /// <summary>
+    ///     Walk up from <paramref name="startDir" /> to the first directory containing a .slnx or .sln file.
+    /// </summary>
+    public static string? FindWorkspaceRoot(string startDir)
+    {
+        var dir = startDir;
+        while (!string.IsNullOrEmpty(dir))
+        {
+            if (Directory.EnumerateFiles(dir, "*.slnx").Any() || Directory.EnumerateFiles(dir, "*.sln").Any())
+            {
+                return dir;
+            }
+
+            var parent = Directory.GetParent(dir);
+            if (parent == null)
+            {
+                break;
+            }
+
+            dir = parent.FullName;
+        }
+
+        return null;
+    }
+}
@@ -2,6 +2,7 @@ using System.CommandLine;
 using System.Text;
 using Spectre.Console;
 using Xbox360MemoryCarver.CLI;
+using Xbox360MemoryCarver.Core.Formats;
 
 namespace Xbox360MemoryCarver;
 
@@ -82,7 +83,7 @@ public static class Program
         };
         var typesOption = new Option<string[]>("-t", "--types")
         {
-            Description = "File types to extract (e.g., dds ddx xma nif)"
+            Description = $"File types to extract ({string.Join(", ", FormatRegistry.ScannableFormatIds)})"
         };
         var verboseOption = new Option<bool>("-v", "--verbose")
         {
@@ -93,6 +94,15 @@ public static class Program
             Description = "Maximum files to extract per type",
             DefaultValueFactory = _ => 10000
         };
+        var dedupeOption = new Option<bool>("--dedupe")
+        {
+            Description = "Write identical carved files only once, keeping the copy at the lowest offset"
+        };
+        var jobsOption = new Option<int>("-j", "--jobs")
+        {
+            Description = "Number of dump files to process in parallel when input is a directory",
+            DefaultValueFactory = _ => 1
+        };
 
         rootCommand.Arguments.Add(inputArgument);
         rootCommand.Options.Add(outputOption);
@@ -102,6 +112,8 @@ public static class Program
         rootCommand.Options.Add(typesOption);
         rootCommand.Options.Add(verboseOption);
         rootCommand.Options.Add(maxFilesOption);
+        rootCommand.Options.Add(dedupeOption);
+        rootCommand.Options.Add(jobsOption);
 
         rootCommand.SetAction(async (parseResult, cancellationToken) =>
         {
@@ -112,6 +124,8 @@ public static class Program
             var types = parseResult.GetValue(typesOption);
             var verbose = parseResult.GetValue(verboseOption);
             var maxFiles = parseResult.GetValue(maxFilesOption);
+            var dedupe = parseResult.GetValue(dedupeOption);
+            var jobs = parseResult.GetValue(jobsOption);
 
             if (string.IsNullOrEmpty(input))
             {
@@ -127,7 +141,8 @@ public static class Program
 
             try
             {
-                await CarveCommand.ExecuteAsync(input, output, types?.ToList(), convertDdx, verbose, maxFiles);
+                await CarveCommand.ExecuteAsync(input, output, types?.ToList(), convertDdx, verbose, maxFiles,
+                    jobs, dedupe);
                 return 0;
             }
             catch (Exception ex)
@@ -156,6 +171,7 @@ public static class Program
         AnsiConsole.MarkupLine("  Xbox360MemoryCarver [green]dump.dmp[/] -o [blue]extracted[/]");
         AnsiConsole.MarkupLine("  Xbox360MemoryCarver [green]dump.dmp[/] -o [blue]extracted[/] -t ddx xma nif");
         AnsiConsole.MarkupLine("  Xbox360MemoryCarver [green]dump.dmp[/] -o [blue]extracted[/] --convert-ddx -v");
+        AnsiConsole.MarkupLine("  Xbox360MemoryCarver [green]dumps/[/] -o [blue]extracted[/] -j 4");
 #if WINDOWS_GUI
         AnsiConsole.WriteLine();
         AnsiConsole.MarkupLine("[bold]For GUI mode:[/]");
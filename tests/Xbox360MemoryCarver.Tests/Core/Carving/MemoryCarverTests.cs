@@ -0,0 +1,136 @@
+using Xbox360MemoryCarver.Core.Carving;
+using Xunit;
+
+namespace Xbox360MemoryCarver.Tests.Core.Carving;
+
+/// <summary>
+///     Tests for MemoryCarver end-to-end carving.
+/// </summary>
+public sealed class MemoryCarverTests : IDisposable
+{
+    private readonly string _testDir;
+
+    public MemoryCarverTests()
+    {
+        _testDir = Path.Combine(Path.GetTempPath(), $"MemoryCarverTests_{Guid.NewGuid():N}");
+        Directory.CreateDirectory(_testDir);
+    }
+
+    public void Dispose()
+    {
+        if (Directory.Exists(_testDir)) Directory.Delete(_testDir, true);
+    }
+
+    [Fact]
+    public async Task CarveDumpAsync_IdenticalContent_WrittenOnce()
+    {
+        // Arrange
+        var dump = new byte[0x4000];
+        var png = CreatePng(16, 16);
+        var otherPng = CreatePng(32, 32);
+        png.CopyTo(dump, 0x100);
+        png.CopyTo(dump, 0x1000);
+        otherPng.CopyTo(dump, 0x2000);
+
+        var dumpPath = Path.Combine(_testDir, "dupes.dmp");
+        await File.WriteAllBytesAsync(dumpPath, dump);
+
+        using var carver = new MemoryCarver(Path.Combine(_testDir, "out"), fileTypes: ["png"],
+            deduplicateContent: true);
+
+        // Act
+        var entries = await carver.CarveDumpAsync(dumpPath);
+
+        // Assert
+        Assert.Equal(2, entries.Count);
+        Assert.Equal(2, carver.Stats["png"]);
+        Assert.Contains(entries, e => e.Offset == 0x100);
+        Assert.Contains(entries, e => e.Offset == 0x2000);
+        Assert.Equal(1, carver.DuplicatesSkipped);
+    }
+
+    [Fact]
+    public async Task CarveDumpAsync_DefaultOptions_WritesEveryCopy()
+    {
+        // Arrange
+        var dump = new byte[0x4000];
+        var png = CreatePng(16, 16);
+        png.CopyTo(dump, 0x100);
+        png.CopyTo(dump, 0x1000);
+
+        var dumpPath = Path.Combine(_testDir, "dupes.dmp");
+        await File.WriteAllBytesAsync(dumpPath, dump);
+
+        using var carver = new MemoryCarver(Path.Combine(_testDir, "out"), fileTypes: ["png"]);
+
+        // Act
+        var entries = await carver.CarveDumpAsync(dumpPath);
+
+        // Assert
+        Assert.Equal([0x100L, 0x1000L], entries.Select(e => e.Offset).Order());
+        Assert.Equal(0, carver.DuplicatesSkipped);
+    }
+
+    [Fact]
+    public async Task CarveDumpAsync_DeduplicatingWithMaxFilesPerType_KeepsLowestOffsets()
+    {
+        // Arrange
+        var dump = new byte[0x4000];
+        CreatePng(16, 16).CopyTo(dump, 0x100);
+        CreatePng(32, 32).CopyTo(dump, 0x1000);
+        CreatePng(48, 48).CopyTo(dump, 0x2000);
+
+        var dumpPath = Path.Combine(_testDir, "limited.dmp");
+        await File.WriteAllBytesAsync(dumpPath, dump);
+
+        using var carver = new MemoryCarver(Path.Combine(_testDir, "out"), 2, fileTypes: ["png"],
+            deduplicateContent: true);
+
+        // Act
+        var entries = await carver.CarveDumpAsync(dumpPath);
+
+        // Assert
+        Assert.Equal([0x100L, 0x1000L], entries.Select(e => e.Offset).Order());
+        Assert.Equal(2, carver.Stats["png"]);
+    }
+
+    [Fact]
+    public async Task CarveDumpAsync_ExistingOutput_WritesSuffixedFile()
+    {
+        // Arrange
+        var dump = new byte[0x1000];
+        CreatePng(16, 16).CopyTo(dump, 0x100);
+
+        var dumpPath = Path.Combine(_testDir, "rerun.dmp");
+        await File.WriteAllBytesAsync(dumpPath, dump);
+
+        using var carver = new MemoryCarver(Path.Combine(_testDir, "out"), fileTypes: ["png"]);
+        await carver.CarveDumpAsync(dumpPath);
+
+        // Act
+        var entries = await carver.CarveDumpAsync(dumpPath);
+
+        // Assert
+        var entry = Assert.Single(entries);
+        Assert.Equal("00000100_1.png", entry.Filename);
+        Assert.True(File.Exists(Path.Combine(_testDir, "out", "rerun", "images", "00000100.png")));
+        Assert.True(File.Exists(Path.Combine(_testDir, "out", "rerun", "images", "00000100_1.png")));
+    }
+
+    private static byte[] CreatePng(int width, int height)
+    {
+        var png = new byte[80];
+        byte[] magic = [0x89, 0x50, 0x4E, 0x47, 0x0D, 0x0A, 0x1A, 0x0A];
+        magic.CopyTo(png, 0);
+
+        // IHDR chunk with big-endian dimensions
+        png[11] = 13;
+        "IHDR"u8.CopyTo(png.AsSpan(12));
+        png[19] = (byte)width;
+        png[23] = (byte)height;
+
+        // IEND chunk closes the file
+        "IEND"u8.CopyTo(png.AsSpan(png.Length - 8));
+        return png;
+    }
+}
@@ -0,0 +1,52 @@
+using Xbox360MemoryCarver.Core.Carving;
+using Xunit;
+
+namespace Xbox360MemoryCarver.Tests.Core.Carving;
+
+/// <summary>
+///     Tests for OutputDirectoryCache.
+/// </summary>
+public sealed class OutputDirectoryCacheTests : IDisposable
+{
+    private readonly string _testDir;
+
+    public OutputDirectoryCacheTests()
+    {
+        _testDir = Path.Combine(Path.GetTempPath(), $"OutputDirectoryCacheTests_{Guid.NewGuid():N}");
+    }
+
+    public void Dispose()
+    {
+        if (Directory.Exists(_testDir)) Directory.Delete(_testDir, true);
+    }
+
+    [Fact]
+    public void EnsureExists_CreatesNestedDirectory()
+    {
+        // Arrange
+        var cache = new OutputDirectoryCache();
+        var path = Path.Combine(_testDir, "textures", "ddx");
+
+        // Act
+        cache.EnsureExists(path);
+
+        // Assert
+        Assert.True(Directory.Exists(path));
+    }
+
+    [Fact]
+    public void EnsureExists_AfterClear_RecreatesRemovedDirectory()
+    {
+        // Arrange
+        var cache = new OutputDirectoryCache();
+        cache.EnsureExists(_testDir);
+        Directory.Delete(_testDir);
+
+        // Act
+        cache.Clear();
+        cache.EnsureExists(_testDir);
+
+        // Assert
+        Assert.True(Directory.Exists(_testDir));
+    }
+}
@@ -0,0 +1,43 @@
+using System.Text;
+using Xbox360MemoryCarver.Core.Converters;
+using Xunit;
+
+namespace Xbox360MemoryCarver.Tests.Core.Converters;
+
+public class DdxSubprocessConverterTests
+{
+    [Theory]
+    [InlineData("3XDO")]
+    [InlineData("3XDR")]
+    public void HasDdxHeader_ValidMagicAndFullHeader_ReturnsTrue(string magic)
+    {
+        // Arrange
+        var data = new byte[0x44];
+        Encoding.ASCII.GetBytes(magic).CopyTo(data, 0);
+
+        // Act & Assert
+        Assert.True(DdxSubprocessConverter.HasDdxHeader(data));
+    }
+
+    [Fact]
+    public void HasDdxHeader_TruncatedHeader_ReturnsFalse()
+    {
+        // Arrange
+        var data = new byte[0x20];
+        "3XDO"u8.ToArray().CopyTo(data, 0);
+
+        // Act & Assert
+        Assert.False(DdxSubprocessConverter.HasDdxHeader(data));
+    }
+
+    [Fact]
+    public void HasDdxHeader_WrongMagic_ReturnsFalse()
+    {
+        // Arrange
+        var data = new byte[0x44];
+        "DDS "u8.ToArray().CopyTo(data, 0);
+
+        // Act & Assert
+        Assert.False(DdxSubprocessConverter.HasDdxHeader(data));
+    }
+}
@@ -168,6 +168,36 @@ public class FormatRegistryTests
 
     #endregion
 
+    #region GetSignature Tests
+
+    [Theory]
+    [InlineData("ddx_3xdo")]
+    [InlineData("DDX_3XDR")]
+    [InlineData("script_scn")]
+    public void GetSignature_KnownSignature_ReturnsFormatSignature(string signatureId)
+    {
+        // Act
+        var signature = FormatRegistry.GetSignature(signatureId);
+        var format = FormatRegistry.GetBySignatureId(signatureId);
+
+        // Assert
+        Assert.NotNull(signature);
+        Assert.NotNull(format);
+        Assert.Contains(signature, format.Signatures);
+    }
+
+    [Fact]
+    public void GetSignature_FormatIdOnly_ReturnsNull()
+    {
+        // Act - "script" is a format id, not a signature id
+        var signature = FormatRegistry.GetSignature("script");
+
+        // Assert
+        Assert.Null(signature);
+    }
+
+    #endregion
+
     #region GetColor Tests
 
     [Fact]
@@ -293,6 +323,26 @@ public class FormatRegistryTests
 
     #endregion
 
+    #region ScannableSignatureIds Tests
+
+    [Fact]
+    public void ScannableSignatureIds_MatchFormatsWithSignatureScanning()
+    {
+        // Act
+        var ids = FormatRegistry.ScannableSignatureIds;
+        var expectedIds = FormatRegistry.All
+            .Where(f => f.EnableSignatureScanning)
+            .SelectMany(f => f.Signatures.Select(s => s.Id))
+            .Distinct(StringComparer.OrdinalIgnoreCase)
+            .ToList();
+
+        // Assert
+        Assert.Equal(expectedIds.Count, ids.Count);
+        foreach (var id in expectedIds) Assert.Contains(id, ids);
+    }
+
+    #endregion
+
     #region GetSignatureIdsForDisplayNames Tests
 
     [Fact]
@@ -104,6 +104,73 @@ public class NifFormatTests
         Assert.Equal("20.2.0.7", result.Metadata["version"]);
     }
 
+    [Fact]
+    public void Parse_BigEndianBlockSizes_SumsIntoEstimatedSize()
+    {
+        // Arrange - non-Bethesda big-endian NIF with two blocks of 0x100 and 0x200 bytes
+        var header = "Gamebryo File Format, Version 20.2.0.7\n"u8.ToArray();
+        byte[] body =
+        [
+            0x07, 0x00, 0x02, 0x14, // Binary version (always little-endian)
+            0x00, // Endian byte: 0 = big-endian
+            0x00, 0x00, 0x00, 0x00, // User version: 0
+            0x02, 0x00, 0x00, 0x00, // Num blocks: 2
+            0x00, 0x01, // Num block types: 1
+            0x00, 0x00, 0x00, 0x06, .. "NiNode"u8,
+            0x00, 0x00, 0x00, 0x00, // Block type indices
+            0x00, 0x00, 0x01, 0x00, // Block sizes
+            0x00, 0x00, 0x02, 0x00,
+            0x00, 0x00, 0x00, 0x00, // Num strings
+            0x00, 0x00, 0x00, 0x00, // Max string length
+            0x00, 0x00, 0x00, 0x00 // Num groups
+        ];
+        var data = new byte[512];
+        header.CopyTo(data, 0);
+        body.CopyTo(data, header.Length);
+
+        // Act
+        var result = _format.Parse(data);
+
+        // Assert
+        Assert.NotNull(result);
+        Assert.Equal(header.Length + body.Length + 0x300 + 8, result.EstimatedSize);
+        Assert.True((bool)result.Metadata["bigEndian"]);
+    }
+
+    [Fact]
+    public void Parse_GeometryAndAnimationBlocks_ClassifiesAsMixed()
+    {
+        // Arrange - non-Bethesda big-endian NIF with one geometry and one animation block type
+        var header = "Gamebryo File Format, Version 20.2.0.7\n"u8.ToArray();
+        byte[] body =
+        [
+            0x07, 0x00, 0x02, 0x14, // Binary version (always little-endian)
+            0x00, // Endian byte: 0 = big-endian
+            0x00, 0x00, 0x00, 0x00, // User version: 0
+            0x02, 0x00, 0x00, 0x00, // Num blocks: 2
+            0x00, 0x02, // Num block types: 2
+            0x00, 0x00, 0x00, 0x06, .. "NiNode"u8,
+            0x00, 0x00, 0x00, 0x14, .. "NiControllerSequence"u8,
+            0x00, 0x00, 0x00, 0x01, // Block type indices
+            0x00, 0x00, 0x00, 0x10, // Block sizes
+            0x00, 0x00, 0x00, 0x10,
+            0x00, 0x00, 0x00, 0x00, // Num strings
+            0x00, 0x00, 0x00, 0x00, // Max string length
+            0x00, 0x00, 0x00, 0x00 // Num groups
+        ];
+        var data = new byte[512];
+        header.CopyTo(data, 0);
+        body.CopyTo(data, header.Length);
+
+        // Act
+        var result = _format.Parse(data);
+
+        // Assert
+        Assert.NotNull(result);
+        Assert.Equal("mixed", result.Metadata["contentType"]);
+        Assert.Equal("meshes", result.OutputFolderOverride);
+    }
+
     [Fact]
     public void Parse_InvalidVersionFormat_ReturnsNull()
     {
@@ -279,6 +279,25 @@ public class LoggerTests : IDisposable
         Assert.Contains("debug 42 arg", _output.ToString());
     }
 
+    [Fact]
+    public void Debug_Interpolated_FormatsCorrectly()
+    {
+        Logger.Instance.Level = LogLevel.Debug;
+        var value = 42;
+        Logger.Instance.Debug($"debug {value} 0x{value:X4}");
+        Assert.Contains("debug 42 0x002A", _output.ToString());
+    }
+
+    [Fact]
+    public void Debug_Interpolated_SkipsFormatting_WhenLevelIsInfo()
+    {
+        Logger.Instance.Level = LogLevel.Info;
+        var formatted = 0;
+        Logger.Instance.Debug($"debug {new CountingFormattable(() => formatted++)}");
+        Assert.Equal(0, formatted);
+        Assert.Empty(_output.ToString());
+    }
+
     #endregion
 
     #region Trace Tests
@@ -315,6 +334,16 @@ public class LoggerTests : IDisposable
         Assert.Contains("trace 42 arg", _output.ToString());
     }
 
+    [Fact]
+    public void Trace_Interpolated_SkipsFormatting_WhenLevelIsDebug()
+    {
+        Logger.Instance.Level = LogLevel.Debug;
+        var formatted = 0;
+        Logger.Instance.Trace($"trace {new CountingFormattable(() => formatted++)}");
+        Assert.Equal(0, formatted);
+        Assert.Empty(_output.ToString());
+    }
+
     #endregion
 
     #region Log Tests
@@ -428,4 +457,13 @@ public class LoggerTests : IDisposable
     }
 
     #endregion
-}
\ No newline at end of file
+
+    private sealed class CountingFormattable(Action onFormat)
+    {
+        public override string ToString()
+        {
+            onFormat();
+            return "formatted";
+        }
+    }
+}
@@ -1,3 +1,5 @@
+using System.IO.MemoryMappedFiles;
+using System.Text;
 using Xbox360MemoryCarver.Core.Minidump;
 using Xunit;
 
@@ -236,6 +238,73 @@ public class MinidumpParserTests
         Assert.Equal(0x80000500, va.Value);
     }
 
+    [Fact]
+    public void MinidumpInfo_FileOffsetToVirtualAddress_UnsortedRegions_FindsContainingRegion()
+    {
+        // Arrange - regions listed out of file order
+        var info = new MinidumpInfo
+        {
+            IsValid = true,
+            MemoryRegions =
+            [
+                new MinidumpMemoryRegion { VirtualAddress = 0x82000000, Size = 0x1000, FileOffset = 0x3000 },
+                new MinidumpMemoryRegion { VirtualAddress = 0x80000000, Size = 0x1000, FileOffset = 0x1000 },
+                new MinidumpMemoryRegion { VirtualAddress = 0x81000000, Size = 0x1000, FileOffset = 0x2000 }
+            ]
+        };
+
+        // Act
+        var va = info.FileOffsetToVirtualAddress(0x2010);
+
+        // Assert
+        Assert.Equal(0x81000010, va);
+    }
+
+    [Fact]
+    public void MinidumpInfo_VirtualAddressToFileOffset_NestedAndEmptyRegions_FindsContainingRegion()
+    {
+        // Arrange - a nested and an empty entry both start inside the first region
+        var info = new MinidumpInfo
+        {
+            IsValid = true,
+            MemoryRegions =
+            [
+                new MinidumpMemoryRegion { VirtualAddress = 0x80000000, Size = 0x10000, FileOffset = 0x1000 },
+                new MinidumpMemoryRegion { VirtualAddress = 0x80004000, Size = 0x100, FileOffset = 0x20000 },
+                new MinidumpMemoryRegion { VirtualAddress = 0x80008000, Size = 0, FileOffset = 0x30000 }
+            ]
+        };
+
+        // Act
+        var pastEmpty = info.VirtualAddressToFileOffset(0x80009000);
+        var insideNested = info.VirtualAddressToFileOffset(0x80004010);
+
+        // Assert - the region listed first wins, as with a linear scan
+        Assert.Equal(0xA000, pastEmpty);
+        Assert.Equal(0x5010, insideNested);
+    }
+
+    [Fact]
+    public void MinidumpInfo_FileOffsetToVirtualAddress_ZeroSizeRegion_FindsContainingRegion()
+    {
+        // Arrange - a zero-size entry whose file offset falls inside another region's data
+        var info = new MinidumpInfo
+        {
+            IsValid = true,
+            MemoryRegions =
+            [
+                new MinidumpMemoryRegion { VirtualAddress = 0x80000000, Size = 0x2000, FileOffset = 0x1000 },
+                new MinidumpMemoryRegion { VirtualAddress = 0x90000000, Size = 0, FileOffset = 0x1800 }
+            ]
+        };
+
+        // Act
+        var va = info.FileOffsetToVirtualAddress(0x1900);
+
+        // Assert
+        Assert.Equal(0x80000900, va);
+    }
+
     [Fact]
     public void MinidumpInfo_FileOffsetToVirtualAddress_OutOfRange_ReturnsNull()
     {
@@ -277,6 +346,118 @@ public class MinidumpParserTests
         Assert.Equal(0x1500, offset.Value);
     }
 
+    [Fact]
+    public void MinidumpInfo_GetModuleFileRange_SpansContiguousRegions()
+    {
+        // Arrange - regions listed out of address order; the module spans the first two contiguous ones
+        var info = new MinidumpInfo
+        {
+            IsValid = true,
+            MemoryRegions =
+            [
+                new MinidumpMemoryRegion { VirtualAddress = 0x82010000, Size = 0x8000, FileOffset = 0x21000 },
+                new MinidumpMemoryRegion { VirtualAddress = 0x82000000, Size = 0x10000, FileOffset = 0x11000 },
+                new MinidumpMemoryRegion { VirtualAddress = 0x82020000, Size = 0x10000, FileOffset = 0x29000 }
+            ]
+        };
+        var module = new MinidumpModule { Name = "default.xex", BaseAddress = 0x82000000, Size = 0x30000 };
+
+        // Act
+        var range = info.GetModuleFileRange(module);
+
+        // Assert - stops at the gap between 0x82018000 and 0x82020000
+        Assert.NotNull(range);
+        Assert.Equal(0x11000, range.Value.fileOffset);
+        Assert.Equal(0x18000, range.Value.size);
+    }
+
+    [Fact]
+    public void MinidumpInfo_GetModuleFileRange_NotCaptured_ReturnsNull()
+    {
+        // Arrange
+        var info = new MinidumpInfo
+        {
+            IsValid = true,
+            MemoryRegions =
+            [
+                new MinidumpMemoryRegion { VirtualAddress = 0x80000000, Size = 0x10000, FileOffset = 0x1000 }
+            ]
+        };
+        var module = new MinidumpModule { Name = "xam.xex", BaseAddress = 0x81000000, Size = 0x1000 };
+
+        // Act
+        var range = info.GetModuleFileRange(module);
+
+        // Assert
+        Assert.Null(range);
+    }
+
+    #endregion
+
+    #region Module List Tests
+
+    [Fact]
+    public void Parse_WithModuleListStream_ExtractsModule()
+    {
+        // Arrange
+        var data = CreateMinidumpWithModule("xboxkrnl.exe", 0x80040000, 0x1000);
+        using var stream = new MemoryStream(data);
+
+        // Act
+        var result = MinidumpParser.Parse(stream);
+
+        // Assert
+        var module = Assert.Single(result.Modules);
+        Assert.Equal("xboxkrnl.exe", module.Name);
+        Assert.Equal(0x80040000, module.BaseAddress);
+        Assert.Equal(0x1000, module.Size);
+    }
+
+    [Fact]
+    public void Parse_MappedFile_MatchesStreamResult()
+    {
+        // Arrange
+        var data = CreateMinidumpWithModule("default.xex", 0x82000000, 0x2000);
+        var path = Path.Combine(Path.GetTempPath(), $"MinidumpParserTests_{Guid.NewGuid():N}.dmp");
+        File.WriteAllBytes(path, data);
+
+        try
+        {
+            using var mmf = MemoryMappedFile.CreateFromFile(path, FileMode.Open, null, 0,
+                MemoryMappedFileAccess.Read);
+            using var accessor = mmf.CreateViewAccessor(0, data.Length, MemoryMappedFileAccess.Read);
+
+            // Act
+            var mapped = MinidumpParser.Parse(accessor, data.Length);
+            var streamed = MinidumpParser.Parse(new MemoryStream(data));
+
+            // Assert
+            Assert.True(mapped.IsValid);
+            Assert.Equal(streamed.Modules.Select(m => (m.Name, m.BaseAddress, m.Size)),
+                mapped.Modules.Select(m => (m.Name, m.BaseAddress, m.Size)));
+        }
+        finally
+        {
+            File.Delete(path);
+        }
+    }
+
+    [Fact]
+    public void Parse_ModuleNameOutOfRange_SkipsModule()
+    {
+        // Arrange - point the module name past the end of the file
+        var data = CreateMinidumpWithModule("xam.xex", 0x81000000, 0x1000);
+        WriteUInt32Le(data, 32 + 12 + 4 + 0x14, (uint)data.Length + 16);
+        using var stream = new MemoryStream(data);
+
+        // Act
+        var result = MinidumpParser.Parse(stream);
+
+        // Assert
+        Assert.True(result.IsValid);
+        Assert.Empty(result.Modules);
+    }
+
     #endregion
 
     #region Helper Methods
@@ -361,6 +542,41 @@ public class MinidumpParserTests
         return data;
     }
 
+    private static byte[] CreateMinidumpWithModule(string name, uint baseAddress, uint size)
+    {
+        const int directoryOffset = 32;
+        const int moduleListOffset = directoryOffset + 12; // After 1 directory entry
+        const int nameOffset = moduleListOffset + 4 + 108; // After count + 1 MINIDUMP_MODULE
+        var nameBytes = Encoding.Unicode.GetBytes(name);
+
+        var data = new byte[nameOffset + 4 + nameBytes.Length];
+
+        // Header
+        data[0] = 0x4D;
+        data[1] = 0x44;
+        data[2] = 0x4D;
+        data[3] = 0x50;
+        WriteUInt32Le(data, 8, 1); // 1 stream
+        WriteUInt32Le(data, 12, directoryOffset);
+
+        // Stream directory entry for ModuleListStream (type 4)
+        WriteUInt32Le(data, directoryOffset, 4);
+        WriteUInt32Le(data, directoryOffset + 4, 4 + 108);
+        WriteUInt32Le(data, directoryOffset + 8, moduleListOffset);
+
+        // Module list: count followed by one MINIDUMP_MODULE
+        WriteUInt32Le(data, moduleListOffset, 1);
+        WriteUInt32Le(data, moduleListOffset + 4, baseAddress);
+        WriteUInt32Le(data, moduleListOffset + 4 + 0x08, size);
+        WriteUInt32Le(data, moduleListOffset + 4 + 0x14, nameOffset);
+
+        // MINIDUMP_STRING: byte length then UTF-16LE characters
+        WriteUInt32Le(data, nameOffset, (uint)nameBytes.Length);
+        nameBytes.CopyTo(data, nameOffset + 4);
+
+        return data;
+    }
+
     private static void WriteUInt32Le(byte[] data, int offset, uint value)
     {
         data[offset] = (byte)(value & 0xFF);
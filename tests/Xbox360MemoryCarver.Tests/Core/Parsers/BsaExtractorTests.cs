@@ -0,0 +1,124 @@
+using System.Text;
+using Xbox360MemoryCarver.Core.Formats.Bsa;
+using Xunit;
+
+namespace Xbox360MemoryCarver.Tests.Core.Parsers;
+
+/// <summary>
+///     Tests for BsaExtractor.
+/// </summary>
+public sealed class BsaExtractorTests : IDisposable
+{
+    private readonly string _testDir;
+
+    public BsaExtractorTests()
+    {
+        _testDir = Path.Combine(Path.GetTempPath(), $"BsaExtractorTests_{Guid.NewGuid():N}");
+        Directory.CreateDirectory(_testDir);
+    }
+
+    public void Dispose()
+    {
+        if (Directory.Exists(_testDir)) Directory.Delete(_testDir, true);
+    }
+
+    [Fact]
+    public async Task ExtractFileToDiskAsync_StoredFile_WritesFileData()
+    {
+        // Arrange - one uncompressed file "t\a.txt" whose data sits right after the name table
+        var bsaPath = WriteSingleFileArchive(5, "hello"u8);
+        using var extractor = new BsaExtractor(bsaPath);
+        var file = Assert.Single(extractor.Archive.AllFiles);
+        var outputDir = Path.Combine(_testDir, "out");
+
+        // Act
+        var result = await extractor.ExtractFileToDiskAsync(file, outputDir);
+
+        // Assert
+        Assert.True(result.Success, result.Error);
+        Assert.Equal(5, result.ExtractedSize);
+        Assert.Equal("hello"u8.ToArray(), await File.ReadAllBytesAsync(result.OutputPath));
+    }
+
+    [Fact]
+    public async Task ExtractFileToDiskAsync_TrailingArchiveData_CopiesOnlyRecordBytes()
+    {
+        // Arrange - the record is 5 bytes, followed by unrelated archive data
+        var bsaPath = WriteSingleFileArchive(5, "hello world"u8);
+        using var extractor = new BsaExtractor(bsaPath);
+        var file = Assert.Single(extractor.Archive.AllFiles);
+
+        // Act
+        var result = await extractor.ExtractFileToDiskAsync(file, Path.Combine(_testDir, "out"));
+
+        // Assert
+        Assert.True(result.Success, result.Error);
+        Assert.Equal("hello"u8.ToArray(), await File.ReadAllBytesAsync(result.OutputPath));
+    }
+
+    [Fact]
+    public async Task ExtractFileToDiskAsync_ZeroSizeRecord_WritesEmptyFile()
+    {
+        // Arrange
+        var bsaPath = WriteSingleFileArchive(0, "hello"u8);
+        using var extractor = new BsaExtractor(bsaPath);
+        var file = Assert.Single(extractor.Archive.AllFiles);
+
+        // Act
+        var result = await extractor.ExtractFileToDiskAsync(file, Path.Combine(_testDir, "out"));
+
+        // Assert
+        Assert.True(result.Success, result.Error);
+        Assert.Equal(0, result.ExtractedSize);
+        Assert.Empty(await File.ReadAllBytesAsync(result.OutputPath));
+    }
+
+    [Fact]
+    public void ExtractFile_ZeroSizeRecord_ReturnsEmptyArray()
+    {
+        // Arrange
+        var bsaPath = WriteSingleFileArchive(0, "hello"u8);
+        using var extractor = new BsaExtractor(bsaPath);
+        var file = Assert.Single(extractor.Archive.AllFiles);
+
+        // Act
+        var data = extractor.ExtractFile(file);
+
+        // Assert
+        Assert.Empty(data);
+    }
+
+    /// <summary>
+    ///     Write a BSA holding one stored file "t\a.txt" with the given record size; <paramref name="data" />
+    ///     is appended right after the name table, where the record points.
+    /// </summary>
+    private string WriteSingleFileArchive(uint fileSize, ReadOnlySpan<byte> data)
+    {
+        var bsaPath = Path.Combine(_testDir, "test.bsa");
+        using var writer = new BinaryWriter(File.Create(bsaPath), Encoding.ASCII);
+        writer.Write("BSA\0"u8);
+        writer.Write(104u);
+        writer.Write(36u);
+        writer.Write((uint)(BsaArchiveFlags.IncludeDirectoryNames | BsaArchiveFlags.IncludeFileNames));
+        writer.Write(1u); // folder count
+        writer.Write(1u); // file count
+        writer.Write(2u); // total folder name length
+        writer.Write(6u); // total file name length
+        writer.Write((ushort)0);
+        writer.Write((ushort)0);
+
+        writer.Write(0x11UL);
+        writer.Write(1u);
+        writer.Write(0u);
+
+        writer.Write((byte)2);
+        writer.Write("t\0"u8);
+        writer.Write(0x22UL);
+        writer.Write(fileSize);
+        writer.Write(77u);
+
+        writer.Write("a.txt\0"u8);
+        writer.Write(data);
+        return bsaPath;
+    }
+}
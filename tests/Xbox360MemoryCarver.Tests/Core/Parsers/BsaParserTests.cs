@@ -0,0 +1,110 @@
+using System.Text;
+using Xbox360MemoryCarver.Core.Formats.Bsa;
+using Xunit;
+
+namespace Xbox360MemoryCarver.Tests.Core.Parsers;
+
+/// <summary>
+///     Tests for BsaParser.
+/// </summary>
+public class BsaParserTests
+{
+    [Fact]
+    public void Parse_FolderWithFiles_ReadsRecordsAndNames()
+    {
+        // Arrange
+        using var stream = new MemoryStream();
+        using (var writer = new BinaryWriter(stream, Encoding.ASCII, true))
+        {
+            writer.Write("BSA\0"u8);
+            writer.Write(104u);
+            writer.Write(36u);
+            writer.Write((uint)(BsaArchiveFlags.IncludeDirectoryNames | BsaArchiveFlags.IncludeFileNames));
+            writer.Write(1u); // folder count
+            writer.Write(2u); // file count
+            writer.Write(9u); // total folder name length
+            writer.Write(12u); // total file name length
+            writer.Write((ushort)0);
+            writer.Write((ushort)0);
+
+            writer.Write(0x1122334455667788UL);
+            writer.Write(2u);
+            writer.Write(0u);
+
+            writer.Write((byte)9);
+            writer.Write("textures\0"u8);
+            writer.Write(0xAAUL);
+            writer.Write(0x40000010u);
+            writer.Write(0x200u);
+            writer.Write(0xBBUL);
+            writer.Write(0x20u);
+            writer.Write(0x300u);
+
+            writer.Write("a.dds\0b.dds\0"u8);
+        }
+
+        stream.Position = 0;
+
+        // Act
+        var archive = BsaParser.Parse(stream);
+
+        // Assert
+        var folder = Assert.Single(archive.Folders);
+        Assert.Equal(0x1122334455667788UL, folder.NameHash);
+        Assert.Equal("textures", folder.Name);
+        Assert.Equal(2, folder.Files.Count);
+        Assert.Equal(0x10u, folder.Files[0].Size);
+        Assert.True(folder.Files[0].CompressionToggle);
+        Assert.Equal(0x300u, folder.Files[1].Offset);
+        Assert.Equal("textures\\b.dds", folder.Files[1].FullPath);
+    }
+
+    [Fact]
+    public void Parse_FolderCountPastEnd_Throws()
+    {
+        // Arrange
+        var data = new byte[36];
+        "BSA\0"u8.CopyTo(data);
+        BitConverter.TryWriteBytes(data.AsSpan(4), 104u);
+        BitConverter.TryWriteBytes(data.AsSpan(16), 0x10000000u);
+
+        // Act & Assert
+        Assert.Throws<EndOfStreamException>(() => BsaParser.Parse(new MemoryStream(data)));
+    }
+
+    [Fact]
+    public void Parse_FileNameBlockPastEnd_ThrowsWithNameBlockMessage()
+    {
+        // Arrange - one folder with one file, but no file name block after the records
+        using var stream = new MemoryStream();
+        using (var writer = new BinaryWriter(stream, Encoding.ASCII, true))
+        {
+            writer.Write("BSA\0"u8);
+            writer.Write(104u);
+            writer.Write(36u);
+            writer.Write((uint)(BsaArchiveFlags.IncludeDirectoryNames | BsaArchiveFlags.IncludeFileNames));
+            writer.Write(1u); // folder count
+            writer.Write(1u); // file count
+            writer.Write(2u); // total folder name length
+            writer.Write(6u); // total file name length
+            writer.Write((ushort)0);
+            writer.Write((ushort)0);
+
+            writer.Write(0x11UL);
+            writer.Write(1u);
+            writer.Write(0u);
+
+            writer.Write((byte)2);
+            writer.Write("t\0"u8);
+            writer.Write(0x22UL);
+            writer.Write(5u);
+            writer.Write(77u);
+        }
+
+        stream.Position = 0;
+
+        // Act & Assert
+        var ex = Assert.Throws<EndOfStreamException>(() => BsaParser.Parse(stream));
+        Assert.Contains("file name block", ex.Message);
+    }
+}
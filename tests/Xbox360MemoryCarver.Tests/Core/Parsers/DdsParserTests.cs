@@ -30,6 +30,24 @@ public class DdsFormatTests
         Assert.Equal(fourcc, (string)result.Metadata["fourCc"]);
     }
 
+    [Theory]
+    [InlineData("DXT1", 8)]
+    [InlineData("BC4S", 8)]
+    [InlineData("DXT5", 16)]
+    [InlineData("BC5U", 16)]
+    public void ParseHeader_FourCC_SizesMipChainByBlockSize(string fourcc, int bytesPerBlock)
+    {
+        // Arrange - 256x256 with one mip level is 64x64 blocks
+        var data = CreateDdsHeader(256, 256, fourcc);
+
+        // Act
+        var result = _parser.Parse(data);
+
+        // Assert
+        Assert.NotNull(result);
+        Assert.Equal(64 * 64 * bytesPerBlock + 128, result.EstimatedSize);
+    }
+
     #endregion
 
     #region Endianness Detection Tests
@@ -49,6 +67,41 @@ public class DdsFormatTests
         Assert.False((bool)result.Metadata["isXbox360"]);
     }
 
+    [Fact]
+    public void ParseHeader_BigEndian_DetectsCorrectly()
+    {
+        // Arrange - Xbox 360 layout: header dwords byte-swapped
+        var data = CreateDdsHeader(512, 128, "DXT1", 3);
+        for (var offset = 4; offset < 32; offset += 4)
+        {
+            Array.Reverse(data, offset, 4);
+        }
+
+        // Act
+        var result = _parser.Parse(data);
+
+        // Assert
+        Assert.NotNull(result);
+        Assert.Equal("big", result.Metadata["endianness"]);
+        Assert.True((bool)result.Metadata["isXbox360"]);
+        Assert.Equal(512, result.Metadata["width"]);
+        Assert.Equal(128, result.Metadata["height"]);
+        Assert.Equal(3, result.Metadata["mipCount"]);
+    }
+
+    [Fact]
+    public void ParseHeader_LittleEndianHeaderSize_DoesNotRetryAsBigEndian()
+    {
+        // Arrange - dimensions that are only plausible when byte-swapped (512x256)
+        var data = CreateDdsHeader(0x00020000, 0x00010000, "DXT1");
+
+        // Act
+        var result = _parser.Parse(data);
+
+        // Assert
+        Assert.Null(result);
+    }
+
     #endregion
 
     #region Magic Bytes Tests
@@ -81,6 +134,20 @@ public class DdsFormatTests
         Assert.Null(result);
     }
 
+    [Fact]
+    public void ParseHeader_WrongHeaderSize_ReturnsNull()
+    {
+        // Arrange - magic matches but the size dword is not 124 in either byte order
+        var data = CreateDdsHeader(256, 256, "DXT1");
+        WriteUInt32Le(data, 4, 128);
+
+        // Act
+        var result = _parser.Parse(data);
+
+        // Assert
+        Assert.Null(result);
+    }
+
     [Fact]
     public void ParseHeader_InsufficientData_ReturnsNull()
     {
@@ -196,6 +263,20 @@ public class DdsFormatTests
         Assert.True(result.EstimatedSize > 32768 + 128);
     }
 
+    [Fact]
+    public void ParseHeader_NonSquareMipChain_SumsEveryLevel()
+    {
+        // Arrange - 256x64 DXT1, 10 levels; the last four (4x1 down to 1x1) are one block each
+        var data = CreateDdsHeader(256, 64, "DXT1", 10);
+
+        // Act
+        var result = _parser.Parse(data);
+
+        // Assert - 8192 + 2048 + 512 + 128 + 32 + 16 + 4 * 8 bytes of mips, plus the 128-byte header
+        Assert.NotNull(result);
+        Assert.Equal(10960 + 128, result.EstimatedSize);
+    }
+
     #endregion
 
     #region Helper Methods
@@ -27,6 +27,22 @@ public class DdxFormatTests
         Assert.True(result.EstimatedSize > 0);
     }
 
+    [Fact]
+    public void ParseHeader_FollowedBySignature_EndsAtSignature()
+    {
+        // Arrange
+        var data = new byte[0x1000];
+        Create3XdoHeader(256, 256).CopyTo(data, 0);
+        "XEX2"u8.CopyTo(data.AsSpan(0x300));
+
+        // Act
+        var result = _parser.Parse(data);
+
+        // Assert
+        Assert.NotNull(result);
+        Assert.Equal(0x300, result.EstimatedSize);
+    }
+
     #endregion
 
     #region Magic Bytes Tests
@@ -1,3 +1,4 @@
+using System.IO.MemoryMappedFiles;
 using System.Text;
 using Xbox360MemoryCarver.Core.Formats.EsmRecord;
 using Xunit;
@@ -60,6 +61,42 @@ public class EsmRecordParserTests
         Assert.Equal(0, result.EditorIds[0].Offset);
     }
 
+    [Fact]
+    public void ScanForRecordsMemoryMapped_EdidsInSeparateChunks_FindsBothAndCorrelatesFormId()
+    {
+        // Arrange - a WEAP header owning the first EDID, and a second EDID past the first 16 MB chunk
+        const int secondOffset = 16 * 1024 * 1024 + 100;
+        var data = new byte[secondOffset + 64];
+        "WEAP"u8.CopyTo(data.AsSpan(0));
+        BitConverter.TryWriteBytes(data.AsSpan(4), 100u); // data size
+        BitConverter.TryWriteBytes(data.AsSpan(12), 0x00012345u); // FormID
+        "EDID\u0009\0FirstItem\0"u8.CopyTo(data.AsSpan(24));
+        "EDID\u000A\0SecondItem\0"u8.CopyTo(data.AsSpan(secondOffset));
+
+        var path = Path.Combine(Path.GetTempPath(), $"EsmRecordParserTests_{Guid.NewGuid():N}.bin");
+        File.WriteAllBytes(path, data);
+
+        try
+        {
+            using var mmf = MemoryMappedFile.CreateFromFile(path, FileMode.Open, null, 0,
+                MemoryMappedFileAccess.Read);
+            using var accessor = mmf.CreateViewAccessor(0, data.Length, MemoryMappedFileAccess.Read);
+
+            // Act
+            var result = EsmRecordFormat.ScanForRecordsMemoryMapped(accessor, data.Length);
+            var formIds = EsmRecordFormat.CorrelateFormIdsToNamesMemoryMapped(accessor, data.Length, result);
+
+            // Assert
+            Assert.Equal(["FirstItem", "SecondItem"], result.EditorIds.Select(e => e.Name));
+            Assert.Equal(secondOffset, result.EditorIds[1].Offset);
+            Assert.Equal("FirstItem", formIds[0x00012345u]);
+        }
+        finally
+        {
+            File.Delete(path);
+        }
+    }
+
     [Fact]
     public void ScanForRecords_DuplicateEdids_DeduplicatesResults()
     {
@@ -117,6 +154,26 @@ public class EsmRecordParserTests
         Assert.Empty(result.EditorIds);
     }
 
+    [Theory]
+    [InlineData("DoorRef0123-A", true)]
+    [InlineData("Door Ref-01.A", false)]
+    public void ScanForRecords_EdidInvalidCharRatio_AcceptedAtNinetyPercent(string editorId, bool accepted)
+    {
+        // Arrange - 13 characters: one invalid stays above 90% valid, three do not
+        var editorIdBytes = Encoding.ASCII.GetBytes(editorId + "\0");
+
+        var data = new byte[30];
+        "EDID"u8.CopyTo(data);
+        data[4] = (byte)editorIdBytes.Length;
+        Array.Copy(editorIdBytes, 0, data, 6, editorIdBytes.Length);
+
+        // Act
+        var result = EsmRecordFormat.ScanForRecords(data);
+
+        // Assert
+        Assert.Equal(accepted, result.EditorIds.Any(e => e.Name == editorId));
+    }
+
     [Fact]
     public void ScanForRecords_EdidStartsWithNumber_Skipped()
     {
@@ -0,0 +1,70 @@
+using Xbox360MemoryCarver.Core.Formats.Esp;
+using Xunit;
+
+namespace Xbox360MemoryCarver.Tests.Core.Parsers;
+
+/// <summary>
+///     Tests for EspFormat.
+/// </summary>
+public class EspFormatTests
+{
+    private readonly EspFormat _parser = new();
+
+    [Fact]
+    public void Parse_ValidHeader_ReturnsResult()
+    {
+        // Arrange
+        var data = new byte[0x400];
+        WriteTes4Header(data, 0x40, 0x01);
+
+        // Act
+        var result = _parser.Parse(data);
+
+        // Assert
+        Assert.NotNull(result);
+        Assert.Equal("ESM", result.Format);
+        Assert.True((bool)result.Metadata["isMaster"]);
+    }
+
+    [Fact]
+    public void Parse_FollowedBySignature_EndsAtSignature()
+    {
+        // Arrange
+        var data = new byte[0x1000];
+        WriteTes4Header(data, 0x40, 0);
+        "XDBF"u8.CopyTo(data.AsSpan(0x300));
+
+        // Act
+        var result = _parser.Parse(data);
+
+        // Assert
+        Assert.NotNull(result);
+        Assert.Equal(0x300, result.EstimatedSize);
+    }
+
+    [Fact]
+    public void Parse_NoHedrSubrecord_ReturnsNull()
+    {
+        // Arrange
+        var data = new byte[0x400];
+        WriteTes4Header(data, 0x40, 0);
+        "XXXX"u8.CopyTo(data.AsSpan(24));
+
+        // Act
+        var result = _parser.Parse(data);
+
+        // Assert
+        Assert.Null(result);
+    }
+
+    private static void WriteTes4Header(byte[] data, uint dataSize, uint flags)
+    {
+        "TES4"u8.CopyTo(data.AsSpan(0));
+        BitConverter.TryWriteBytes(data.AsSpan(4), dataSize);
+        BitConverter.TryWriteBytes(data.AsSpan(8), flags);
+
+        // HEDR subrecord with its fixed 12-byte payload
+        "HEDR"u8.CopyTo(data.AsSpan(24));
+        BitConverter.TryWriteBytes(data.AsSpan(28), (ushort)12);
+    }
+}
@@ -0,0 +1,47 @@
+using System.Text;
+using Xbox360MemoryCarver.Core.Formats.FaceGen;
+using Xunit;
+
+namespace Xbox360MemoryCarver.Tests.Core.Parsers;
+
+/// <summary>
+///     Tests for FaceGenFormat.
+/// </summary>
+public class FaceGenFormatTests
+{
+    private readonly FaceGenFormat _parser = new();
+
+    [Theory]
+    [InlineData("FREGM002", "EGM", ".egm")]
+    [InlineData("FREGT003", "EGT", ".egt")]
+    [InlineData("FRTRI003", "TRI", ".tri")]
+    public void Parse_KnownMagic_DetectsType(string magic, string expectedType, string expectedExtension)
+    {
+        // Arrange
+        var data = new byte[256];
+        Encoding.ASCII.GetBytes(magic).CopyTo(data, 0);
+
+        // Act
+        var result = _parser.Parse(data);
+
+        // Assert
+        Assert.NotNull(result);
+        Assert.Equal(expectedType, result.Format);
+        Assert.Equal(expectedExtension, result.ExtensionOverride);
+        Assert.Equal(data.Length, result.EstimatedSize);
+    }
+
+    [Fact]
+    public void Parse_UnknownFaceGenMagic_ReturnsNull()
+    {
+        // Arrange
+        var data = new byte[256];
+        "FREGX002"u8.CopyTo(data);
+
+        // Act
+        var result = _parser.Parse(data);
+
+        // Assert
+        Assert.Null(result);
+    }
+}
@@ -127,6 +127,37 @@ public class PngFormatTests
         Assert.True(result.EstimatedSize > 8);
     }
 
+    [Fact]
+    public void ParseHeader_IhdrChunk_ReportsDimensions()
+    {
+        // Arrange
+        var data = CreateMinimalPng();
+
+        // Act
+        var result = _parser.Parse(data);
+
+        // Assert
+        Assert.NotNull(result);
+        Assert.Equal("1x1", result.Metadata["dimensions"]);
+    }
+
+    [Fact]
+    public void ParseHeader_IendBytesInsideChunkData_FollowsChunkLengths()
+    {
+        // Arrange - an IDAT chunk whose payload happens to contain "IEND" before the real IEND chunk
+        var minimal = CreateMinimalPng();
+        var iendChunkStart = minimal.Length - 12;
+        byte[] idat = [0x00, 0x00, 0x00, 0x08, .. "IDAT"u8, .. "xxIENDxx"u8, 0x00, 0x00, 0x00, 0x00];
+        byte[] data = [.. minimal[..iendChunkStart], .. idat, .. minimal[iendChunkStart..]];
+
+        // Act
+        var result = _parser.Parse(data);
+
+        // Assert
+        Assert.NotNull(result);
+        Assert.Equal(data.Length, result.EstimatedSize);
+    }
+
     [Fact]
     public void ParseHeader_NoIendFound_ReturnsNull()
     {
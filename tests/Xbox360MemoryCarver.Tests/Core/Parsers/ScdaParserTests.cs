@@ -1,3 +1,4 @@
+using System.IO.MemoryMappedFiles;
 using System.Text;
 using Xbox360MemoryCarver.Core.Formats.Scda;
 using Xunit;
@@ -363,4 +364,83 @@ public class ScdaParserTests
         Assert.Equal(5, record.BytecodeLength);
         Assert.Equal(record.BytecodeSize, record.BytecodeLength);
     }
-}
\ No newline at end of file
+
+    [Fact]
+    public void ParseRecordsAtOffsets_OnlyParsesGivenOffsets()
+    {
+        // Arrange - two records, but only the second offset is supplied
+        var data = new byte[64];
+        byte[] record = [(byte)'S', (byte)'C', (byte)'D', (byte)'A', 0x06, 0x00, 0x10, 0x01, 0x02, 0x03, 0x04, 0x05];
+        record.CopyTo(data, 0);
+        record.CopyTo(data, 32);
+
+        var path = Path.Combine(Path.GetTempPath(), $"ScdaParserTests_{Guid.NewGuid():N}.bin");
+        File.WriteAllBytes(path, data);
+
+        try
+        {
+            using var mmf = MemoryMappedFile.CreateFromFile(path, FileMode.Open, null, 0,
+                MemoryMappedFileAccess.Read);
+            using var accessor = mmf.CreateViewAccessor(0, data.Length, MemoryMappedFileAccess.Read);
+
+            // Act
+            var result = ScdaFormat.ParseRecordsAtOffsets(accessor, data.Length, [32]);
+
+            // Assert
+            Assert.Single(result.Records);
+            Assert.Equal(32, result.Records[0].Offset);
+            Assert.Equal(6, result.Records[0].BytecodeLength);
+        }
+        finally
+        {
+            File.Delete(path);
+        }
+    }
+
+    [Fact]
+    public void ExtractScriptNameFromSource_SetBeforeGet_PrefersSetEvenWhenLater()
+    {
+        // Arrange
+        var source = "GetStage VMS01Quest\r\nset VMS01Counter to 1\r\n";
+
+        // Act
+        var name = ScdaExtractor.ExtractScriptNameFromSourcePublic(source);
+
+        // Assert
+        Assert.Equal("VMS01Counter", name);
+    }
+
+    [Fact]
+    public void ExtractScriptNameFromSource_InvalidSetName_FallsBackToIf()
+    {
+        // Arrange
+        var source = "Set x to 1\nif DoorRef.IsAnimPlaying\n";
+
+        // Act
+        var name = ScdaExtractor.ExtractScriptNameFromSourcePublic(source);
+
+        // Assert
+        Assert.Equal("DoorRef", name);
+    }
+
+    [Fact]
+    public void AssignScriptNames_DuplicateSource_NamesEveryCopy()
+    {
+        // Arrange
+        const string source = "set VMS01Counter to 1\n";
+        List<ScdaRecord> records =
+        [
+            new() { Offset = 0x100, Bytecode = [], SourceText = source },
+            new() { Offset = 0x200, Bytecode = [] },
+            new() { Offset = 0x300, Bytecode = [], SourceText = source }
+        ];
+
+        // Act
+        ScdaExtractor.AssignScriptNames(records);
+
+        // Assert
+        Assert.Equal("VMS01Counter", records[0].ScriptName);
+        Assert.Null(records[1].ScriptName);
+        Assert.Equal("VMS01Counter", records[2].ScriptName);
+    }
+}
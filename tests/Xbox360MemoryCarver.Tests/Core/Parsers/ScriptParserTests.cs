@@ -0,0 +1,120 @@
+using System.Text;
+using Xbox360MemoryCarver.Core.Formats.Script;
+using Xunit;
+
+namespace Xbox360MemoryCarver.Tests.Core.Parsers;
+
+/// <summary>
+///     Tests for ScriptFormat.
+/// </summary>
+public class ScriptFormatTests
+{
+    private readonly ScriptFormat _parser = new();
+
+    [Fact]
+    public void Parse_ScnHeader_ReturnsScriptName()
+    {
+        // Arrange
+        var data = "scn MyQuestScript\r\nbegin GameMode\r\nend\r\n"u8.ToArray();
+
+        // Act
+        var result = _parser.Parse(data);
+
+        // Assert
+        Assert.NotNull(result);
+        Assert.Equal("MyQuestScript", result.Metadata["scriptName"]);
+        Assert.Equal(data.Length, result.EstimatedSize);
+    }
+
+    [Fact]
+    public void Parse_ScriptNameHeaderWithComment_StripsComment()
+    {
+        // Arrange
+        var data = "SCRIPTNAME\tDoorScript;opens the gate\nbegin OnActivate\nend\n"u8.ToArray();
+
+        // Act
+        var result = _parser.Parse(data);
+
+        // Assert
+        Assert.NotNull(result);
+        Assert.Equal("DoorScript", result.Metadata["scriptName"]);
+        Assert.Equal("DoorScript.txt", result.FileName);
+    }
+
+    [Fact]
+    public void Parse_FollowedByBinary_EndsBeforeBinaryRun()
+    {
+        // Arrange
+        var text = "scn MyQuestScript\nbegin GameMode\nend\n"u8.ToArray();
+        var data = new byte[text.Length + 16];
+        text.CopyTo(data, 0);
+        data[text.Length + 4] = 0xFF;
+
+        // Act
+        var result = _parser.Parse(data);
+
+        // Assert
+        Assert.NotNull(result);
+        Assert.Equal(text.Length, result.EstimatedSize);
+    }
+
+    [Fact]
+    public void Parse_ShortBinaryRunInsideText_ContinuesPastIt()
+    {
+        // Arrange
+        byte[] data = [.. "scn MyQuestScript\nset x to 1"u8, 0x00, 0x01, .. "\nend\n"u8];
+
+        // Act
+        var result = _parser.Parse(data);
+
+        // Assert
+        Assert.NotNull(result);
+        Assert.Equal(data.Length, result.EstimatedSize);
+    }
+
+    [Fact]
+    public void Parse_FollowedByAnotherScript_EndsAtNextHeader()
+    {
+        // Arrange
+        var first = "scn FirstScript\nset myscn to 1\nend\n"u8.ToArray();
+        byte[] data = [.. first, .. "ScriptName SecondScript\nend\n"u8];
+
+        // Act
+        var result = _parser.Parse(data);
+
+        // Assert
+        Assert.NotNull(result);
+        Assert.Equal(first.Length, result.EstimatedSize);
+    }
+
+    [Theory]
+    [InlineData("SCRIPTNAME SecondScript\nend\n")]
+    [InlineData("sCn SecondScript\nend\n")]
+    [InlineData("ScriptName\tSecondScript\nend\n")]
+    public void Parse_FollowedByMixedCaseHeader_EndsAtNextHeader(string nextScript)
+    {
+        // Arrange
+        var first = "scn FirstScript\nset myscn to 1\nend\n"u8.ToArray();
+        byte[] data = [.. first, .. Encoding.ASCII.GetBytes(nextScript)];
+
+        // Act
+        var result = _parser.Parse(data);
+
+        // Assert
+        Assert.NotNull(result);
+        Assert.Equal(first.Length, result.EstimatedSize);
+    }
+
+    [Fact]
+    public void Parse_InvalidScriptName_ReturnsNull()
+    {
+        // Arrange
+        var data = "scn My.Script\nbegin GameMode\n"u8.ToArray();
+
+        // Act
+        var result = _parser.Parse(data);
+
+        // Assert
+        Assert.Null(result);
+    }
+}
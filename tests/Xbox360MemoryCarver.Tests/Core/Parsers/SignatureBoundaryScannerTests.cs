@@ -296,6 +296,90 @@ public class SignatureBoundaryScannerTests
         Assert.Equal(-1, result);
     }
 
+    [Fact]
+    public void FindNextSignature_SkipsNearMissCandidates()
+    {
+        // Arrange - bytes that start signatures but do not complete them, then a real one
+        var data = new byte[200];
+        "3XD_"u8.CopyTo(data.AsSpan(20));
+        "XUI_"u8.CopyTo(data.AsSpan(40));
+        "Gamebryo"u8.CopyTo(data.AsSpan(60));
+        "TES4"u8.CopyTo(data.AsSpan(120));
+
+        // Act
+        var result = SignatureBoundaryScanner.FindNextSignature(data, 0, 10, 200);
+
+        // Assert
+        Assert.Equal(120, result);
+    }
+
+    [Fact]
+    public void FindNextSignature_FindsGamebryoSignature()
+    {
+        // Arrange
+        var data = new byte[200];
+        "Gamebryo File Format"u8.CopyTo(data.AsSpan(90));
+
+        // Act
+        var result = SignatureBoundaryScanner.FindNextSignature(data, 0, 10, 200);
+
+        // Assert
+        Assert.Equal(90, result);
+    }
+
+    #endregion
+
+    #region Signature Table Tests
+
+    private static readonly SignatureBoundaryScanner.SignatureTable TableSignatures =
+        SignatureBoundaryScanner.CreateSignatureTable(
+            ("XDBF"u8.ToArray(), null),
+            ("RIFF"u8.ToArray(), (data, position) => data[position + 4] == 1));
+
+    [Fact]
+    public void FindNextSignature_Table_SignaturePresent_ReturnsAbsolutePosition()
+    {
+        // Arrange
+        var data = new byte[256];
+        "XDBF"u8.CopyTo(data.AsSpan(100));
+
+        // Act
+        var position = SignatureBoundaryScanner.FindNextSignature(data, 10, data.Length - 4, TableSignatures);
+
+        // Assert
+        Assert.Equal(100, position);
+    }
+
+    [Fact]
+    public void FindNextSignature_Table_ValidatorRejects_ContinuesToNextCandidate()
+    {
+        // Arrange
+        var data = new byte[256];
+        "RIFF"u8.CopyTo(data.AsSpan(40));
+        "RIFF"u8.CopyTo(data.AsSpan(80));
+        data[84] = 1;
+
+        // Act
+        var position = SignatureBoundaryScanner.FindNextSignature(data, 0, data.Length - 8, TableSignatures);
+
+        // Assert
+        Assert.Equal(80, position);
+    }
+
+    [Fact]
+    public void FindNextSignature_Table_SignatureAtOrAfterEnd_ReturnsMinusOne()
+    {
+        // Arrange
+        var data = new byte[256];
+        "XDBF"u8.CopyTo(data.AsSpan(200));
+
+        // Act
+        var position = SignatureBoundaryScanner.FindNextSignature(data, 0, 200, TableSignatures);
+
+        // Assert
+        Assert.Equal(-1, position);
+    }
+
     #endregion
 
     #region FindBoundary Tests
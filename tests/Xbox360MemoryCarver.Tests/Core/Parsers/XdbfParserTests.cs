@@ -0,0 +1,48 @@
+using System.Buffers.Binary;
+using Xbox360MemoryCarver.Core.Formats.Xdbf;
+using Xunit;
+
+namespace Xbox360MemoryCarver.Tests.Core.Parsers;
+
+/// <summary>
+///     Tests for XdbfFormat.
+/// </summary>
+public class XdbfFormatTests
+{
+    private readonly XdbfFormat _parser = new();
+
+    [Fact]
+    public void Parse_BigEndianHeader_ReadsVersionAndEntryCount()
+    {
+        // Arrange
+        var data = new byte[2048];
+        "XDBF"u8.CopyTo(data);
+        BinaryPrimitives.WriteUInt32BigEndian(data.AsSpan(4), 0x10000);
+        BinaryPrimitives.WriteUInt32BigEndian(data.AsSpan(8), 12);
+        BinaryPrimitives.WriteUInt32BigEndian(data.AsSpan(12), 0x100);
+        BinaryPrimitives.WriteUInt32BigEndian(data.AsSpan(16), 4);
+
+        // Act
+        var result = _parser.Parse(data);
+
+        // Assert
+        Assert.NotNull(result);
+        Assert.Equal(0x10000u, result.Metadata["version"]);
+        Assert.Equal(12u, result.Metadata["entryCount"]);
+    }
+
+    [Fact]
+    public void Parse_EntryCountTooLarge_ReturnsNull()
+    {
+        // Arrange
+        var data = new byte[2048];
+        "XDBF"u8.CopyTo(data);
+        BinaryPrimitives.WriteUInt32BigEndian(data.AsSpan(8), 20000);
+
+        // Act
+        var result = _parser.Parse(data);
+
+        // Assert
+        Assert.Null(result);
+    }
+}
@@ -176,6 +176,43 @@ public class XmaFormatTests
 
     #endregion
 
+    #region Data Quality Tests
+
+    [Fact]
+    public void EstimateDataQuality_LongZeroAndFfRuns_CountsEachRun()
+    {
+        // Arrange - 100 bytes of audio with a 10-byte 0x00 run, a 4-byte 0xFF run, then a 16-byte 0xFF run
+        var data = new byte[100];
+        Array.Fill(data, (byte)0x5A);
+        data.AsSpan(40, 10).Clear();
+        data.AsSpan(50, 4).Fill(0xFF);
+        data.AsSpan(84, 16).Fill(0xFF);
+
+        // Act
+        var (totalQuality, usablePercent) = XmaParser.EstimateDataQuality(data, 0, data.Length);
+
+        // Assert - only runs of 8+ count: 26 corrupt bytes, first one at offset 40
+        Assert.Equal(74, totalQuality);
+        Assert.Equal(40, usablePercent);
+    }
+
+    [Fact]
+    public void EstimateDataQuality_ChunkSizePastIntRange_ClampsToData()
+    {
+        // Arrange - a corrupt data chunk size that overflows when added to the chunk start
+        var data = new byte[64];
+        Array.Fill(data, (byte)0x5A);
+
+        // Act
+        var (totalQuality, usablePercent) = XmaParser.EstimateDataQuality(data, 8, int.MaxValue - 16);
+
+        // Assert
+        Assert.Equal(100, totalQuality);
+        Assert.Equal(100, usablePercent);
+    }
+
+    #endregion
+
     #region Helper Methods
 
     private static byte[] CreateXmaHeader(
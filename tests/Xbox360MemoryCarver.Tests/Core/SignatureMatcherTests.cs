@@ -1,4 +1,7 @@
+using System.Collections.Concurrent;
+using System.IO.MemoryMappedFiles;
 using Xbox360MemoryCarver.Core;
+using Xbox360MemoryCarver.Core.Utils;
 using Xunit;
 
 namespace Xbox360MemoryCarver.Tests.Core;
@@ -31,6 +34,38 @@ public class SignatureMatcherTests
 
     #endregion
 
+    #region MatchesAt Tests
+
+    [Fact]
+    public void MatchesAt_PatternAtStart_ReturnsTrue()
+    {
+        // Arrange
+        var matcher = new SignatureMatcher();
+        matcher.AddPattern("ddx", "3XDO"u8.ToArray());
+        matcher.AddPattern("xdo", "XDO"u8.ToArray());
+        matcher.Build();
+
+        // Act & Assert
+        Assert.True(matcher.MatchesAt("3XDO...."u8));
+        Assert.True(matcher.MatchesAt("XDO"u8));
+    }
+
+    [Fact]
+    public void MatchesAt_PatternOnlyLaterInData_ReturnsFalse()
+    {
+        // Arrange
+        var matcher = new SignatureMatcher();
+        matcher.AddPattern("ddx", "3XDO"u8.ToArray());
+        matcher.AddPattern("xdo", "XDO"u8.ToArray());
+        matcher.Build();
+
+        // Act & Assert
+        Assert.False(matcher.MatchesAt("33XDO"u8));
+        Assert.False(matcher.MatchesAt("3XD"u8));
+    }
+
+    #endregion
+
     #region Construction and Properties
 
     [Fact]
@@ -409,6 +444,47 @@ public class SignatureMatcherTests
         Assert.Equal(2, results[2].Position);
     }
 
+    [Fact]
+    public void Search_PatternAddedAfterBuild_IsFound()
+    {
+        // Arrange
+        var matcher = new SignatureMatcher();
+        matcher.AddPattern("first", [0x01, 0x02]);
+        matcher.Build();
+        matcher.AddPattern("second", [0x03, 0x04]);
+
+        var data = new byte[] { 0x01, 0x02, 0x03, 0x04 };
+
+        // Act
+        var results = matcher.Search(data);
+
+        // Assert
+        Assert.Equal(2, results.Count);
+        Assert.Contains(results, r => r.Name == "first" && r.Position == 0);
+        Assert.Contains(results, r => r.Name == "second" && r.Position == 2);
+    }
+
+    [Fact]
+    public void Search_ConcurrentFirstUseWithoutBuild_FindsAllMatches()
+    {
+        // Arrange
+        var matcher = new SignatureMatcher();
+        matcher.AddPattern("ddx", "3XDO"u8.ToArray());
+        matcher.AddPattern("xma", "RIFF"u8.ToArray());
+
+        var data = new byte[256];
+        "3XDO"u8.CopyTo(data.AsSpan(16));
+        "RIFF"u8.CopyTo(data.AsSpan(100));
+        var counts = new ConcurrentBag<int>();
+
+        // Act
+        Parallel.For(0, 64, _ => counts.Add(matcher.Search(data).Count));
+
+        // Assert
+        Assert.Equal(64, counts.Count);
+        Assert.All(counts, count => Assert.Equal(2, count));
+    }
+
     #endregion
 
     #region Real-World File Signature Tests
@@ -486,4 +562,46 @@ public class SignatureMatcherTests
     }
 
     #endregion
-}
\ No newline at end of file
+
+    #region Mapped Search Tests
+
+    [Fact]
+    public void SearchMapped_FindsMatchesInEveryWindowAndAcrossBoundaries()
+    {
+        // Arrange - 64-byte windows; one pattern straddles the first boundary
+        var matcher = new SignatureMatcher();
+        matcher.AddPattern("ddx", "3XDO"u8.ToArray());
+        matcher.Build();
+
+        var data = new byte[256];
+        "3XDO"u8.CopyTo(data.AsSpan(10));
+        "3XDO"u8.CopyTo(data.AsSpan(62));
+        "3XDO"u8.CopyTo(data.AsSpan(200));
+
+        var path = Path.Combine(Path.GetTempPath(), $"SignatureMatcherTests_{Guid.NewGuid():N}.bin");
+        File.WriteAllBytes(path, data);
+
+        try
+        {
+            using var mmf = MemoryMappedFile.CreateFromFile(path, FileMode.Open, null, 0,
+                MemoryMappedFileAccess.Read);
+            using var accessor = mmf.CreateViewAccessor(0, data.Length, MemoryMappedFileAccess.Read);
+            using var reader = new MemoryMappedSpanReader(accessor, data.Length);
+            var scannedTotals = new ConcurrentBag<long>();
+
+            // Act
+            var results = matcher.SearchMapped(reader, 64, scannedTotals.Add);
+
+            // Assert
+            Assert.Equal([10L, 62L, 200L], results.Select(r => r.Position).Distinct().Order());
+            Assert.All(results, r => Assert.Equal("ddx", matcher.GetPatternName(r.PatternId)));
+            Assert.Equal(data.Length, scannedTotals.Max());
+        }
+        finally
+        {
+            File.Delete(path);
+        }
+    }
+
+    #endregion
+}
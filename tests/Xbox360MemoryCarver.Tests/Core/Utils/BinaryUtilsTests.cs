@@ -17,6 +17,8 @@ public class BinaryUtilsTests
     [InlineData(1536, "1.50 KB")]
     [InlineData(1048576, "1.00 MB")]
     [InlineData(1073741824, "1.00 GB")]
+    [InlineData(1048575, "1024.00 KB")]
+    [InlineData(2251799813685248, "2048.00 TB")]
     public void FormatSize_ReturnsCorrectFormat(long size, string expected)
     {
         // Act
@@ -36,6 +38,8 @@ public class BinaryUtilsTests
     [InlineData(4, 4, 4)]
     [InlineData(5, 4, 8)]
     [InlineData(100, 16, 112)]
+    [InlineData(2049, 2048, 4096)]
+    [InlineData(10, 3, 12)]
     public void AlignOffset_ReturnsAlignedValue(long offset, int alignment, long expected)
     {
         // Act
@@ -281,6 +285,19 @@ public class BinaryUtilsTests
         Assert.False(result);
     }
 
+    [Fact]
+    public void IsPrintableText_NonPrintableRunsAtRatio_ReturnsTrue()
+    {
+        // Arrange - 8 printable bytes and two 1-byte binary runs: exactly the 0.8 default ratio
+        byte[] data = [.. "abc"u8, 0x00, .. "defg"u8, 0x01, (byte)'h'];
+
+        // Act
+        var result = BinaryUtils.IsPrintableText(data);
+
+        // Assert
+        Assert.True(result);
+    }
+
     [Fact]
     public void IsPrintableText_EmptyData_ReturnsFalse()
     {
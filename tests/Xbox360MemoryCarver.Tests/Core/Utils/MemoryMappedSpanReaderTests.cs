@@ -0,0 +1,76 @@
+using System.IO.MemoryMappedFiles;
+using Xbox360MemoryCarver.Core.Utils;
+using Xunit;
+
+namespace Xbox360MemoryCarver.Tests.Core.Utils;
+
+/// <summary>
+///     Tests for MemoryMappedSpanReader zero-copy view access.
+/// </summary>
+public sealed class MemoryMappedSpanReaderTests : IDisposable
+{
+    private readonly string _testFile;
+
+    public MemoryMappedSpanReaderTests()
+    {
+        _testFile = Path.Combine(Path.GetTempPath(), $"MemoryMappedSpanReaderTests_{Guid.NewGuid():N}.bin");
+        var data = new byte[4096];
+        for (var i = 0; i < data.Length; i++)
+        {
+            data[i] = (byte)(i & 0xFF);
+        }
+
+        File.WriteAllBytes(_testFile, data);
+    }
+
+    public void Dispose()
+    {
+        if (File.Exists(_testFile)) File.Delete(_testFile);
+    }
+
+    [Fact]
+    public void GetSpan_ReturnsMappedBytes()
+    {
+        // Arrange
+        using var mmf = MemoryMappedFile.CreateFromFile(_testFile, FileMode.Open, null, 0,
+            MemoryMappedFileAccess.Read);
+        using var accessor = mmf.CreateViewAccessor(0, 4096, MemoryMappedFileAccess.Read);
+        using var reader = new MemoryMappedSpanReader(accessor, 4096);
+
+        // Act
+        var span = reader.GetSpan(0x100, 4);
+
+        // Assert
+        Assert.Equal(4096, reader.Length);
+        Assert.Equal(new byte[] { 0x00, 0x01, 0x02, 0x03 }, span.ToArray());
+    }
+
+    [Fact]
+    public void GetSpan_PastEnd_Throws()
+    {
+        // Arrange
+        using var mmf = MemoryMappedFile.CreateFromFile(_testFile, FileMode.Open, null, 0,
+            MemoryMappedFileAccess.Read);
+        using var accessor = mmf.CreateViewAccessor(0, 4096, MemoryMappedFileAccess.Read);
+        using var reader = new MemoryMappedSpanReader(accessor, 4096);
+
+        // Act & Assert
+        Assert.Throws<ArgumentOutOfRangeException>(() => reader.GetSpan(4090, 16));
+    }
+
+    [Fact]
+    public void GetSpan_AfterDispose_Throws()
+    {
+        // Arrange
+        using var mmf = MemoryMappedFile.CreateFromFile(_testFile, FileMode.Open, null, 0,
+            MemoryMappedFileAccess.Read);
+        using var accessor = mmf.CreateViewAccessor(0, 4096, MemoryMappedFileAccess.Read);
+        var reader = new MemoryMappedSpanReader(accessor, 4096);
+
+        // Act
+        reader.Dispose();
+
+        // Assert
+        Assert.Throws<ObjectDisposedException>(() => reader.GetSpan(0, 4));
+    }
+}